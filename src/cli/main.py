@@ -8,6 +8,7 @@ import asyncio
 import contextlib
 import json
 import logging
+import os
 import signal
 import sys
 from collections.abc import Sequence
@@ -172,6 +173,28 @@ def _run_cli(argv: Sequence[str] | None = None) -> int:
         help="Optional state directory override (defaults to ~/.labarchives_state).",
     )
 
+    mirror_parser = subparsers.add_parser(
+        "mirror-sync",
+        help="Populate the local notebook mirror used for offline reads.",
+    )
+    mirror_parser.add_argument(
+        "--path",
+        default=None,
+        help="SQLite mirror file (defaults to $LABARCHIVES_MIRROR_PATH).",
+    )
+    mirror_parser.add_argument(
+        "--notebook",
+        action="append",
+        default=[],
+        help="Notebook ID to mirror; repeat for several (defaults to all notebooks).",
+    )
+    mirror_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Pages fetched concurrently (default: 8).",
+    )
+
     parsed = parser.parse_args(list(argv) if argv is not None else None)
 
     if parsed.version:
@@ -200,6 +223,14 @@ def _run_cli(argv: Sequence[str] | None = None) -> int:
         print(output_path)
         return 0
 
+    if parsed.command == "mirror-sync":
+        mirror_path = parsed.path or os.environ.get("LABARCHIVES_MIRROR_PATH")
+        if not mirror_path:
+            parser.exit(2, f"{parser.prog}: error: pass --path or set LABARCHIVES_MIRROR_PATH\n")
+        summary = asyncio.run(_sync_mirror(mirror_path, parsed.notebook, parsed.concurrency))
+        print(json.dumps(summary, indent=2))
+        return 0
+
     logger.info("Starting LabArchives MCP server")
 
     for sig in (signal.SIGINT, signal.SIGTERM):
@@ -240,6 +271,48 @@ async def _emit_onboard(output_format: str) -> None:
         print(payload.markdown)
 
 
+async def _sync_mirror(
+    mirror_path: str, notebook_ids: Sequence[str], concurrency: int
+) -> dict[str, Any]:
+    """Fetch every tree level and page of the given notebooks into the mirror."""
+    import httpx
+
+    from labarchives_mcp.auth import AuthenticationManager, Credentials
+    from labarchives_mcp.eln_client import LabArchivesClient, NotebookTreeCrawler
+    from labarchives_mcp.mirror import NotebookMirror
+
+    credentials = Credentials.from_file()
+    # max_age_seconds=0: always refetch, so the sync refreshes existing copies
+    mirror = NotebookMirror(mirror_path, max_age_seconds=0)
+    counts = {"notebooks": 0, "pages": 0, "failed_pages": 0}
+    try:
+        async with httpx.AsyncClient(base_url=str(credentials.region)) as http_client:
+            auth_manager = AuthenticationManager(http_client, credentials)
+            client = LabArchivesClient(http_client, auth_manager, cache_size=0, mirror=mirror)
+            crawler = NotebookTreeCrawler(client, concurrency=concurrency, ttl_seconds=0)
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            uid = await auth_manager.ensure_uid()
+            nbids = list(notebook_ids) or [nb.nbid for nb in await client.list_notebooks(uid)]
+
+            async def mirror_page(nbid: str, page_id: str) -> None:
+                async with semaphore:
+                    try:
+                        await client.get_page_entries(uid, nbid, page_id)
+                    except Exception as exc:  # noqa: BLE001 - counted and reported per page
+                        logger.warning("Could not mirror page %s of %s: %s", page_id, nbid, exc)
+                        counts["failed_pages"] += 1
+                        return
+                counts["pages"] += 1
+
+            for nbid in nbids:
+                pages = await crawler.list_pages(uid, nbid)
+                await asyncio.gather(*(mirror_page(nbid, page["tree_id"]) for page in pages))
+                counts["notebooks"] += 1
+        return {**counts, "mirror": mirror.stats()}
+    finally:
+        mirror.close()
+
+
 def _init_state() -> None:
     """Initialize the local state directory."""
     from pathlib import Path
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
+import json
 import os
 import time
 from pathlib import Path
 from typing import Any, cast
 
 import httpx
+from loguru import logger
 from lxml import etree
 from omegaconf import OmegaConf
 from pydantic import BaseModel, Field, HttpUrl
@@ -147,31 +150,135 @@ class Credentials(BaseModel):
 
 
 class AuthenticationManager:
-    """Coordinate authentication flows against the LabArchives API."""
+    """Coordinate authentication flows against the LabArchives API.
 
-    USER_ACCESS_METHOD = "user_access_info"
+    Signed auth params depend only on (method, expires), so they are cached per API
+    method and reused until `SIGNATURE_RENEW_MARGIN_MS` before they expire. New
+    signatures are computed from a copy of an HMAC already keyed with the password.
+
+    A uid resolved through `user_access_info` is stored in a small JSON file
+    (`LABARCHIVES_UID_CACHE`, default ``~/.labarchives_state/uid_cache.json``) keyed
+    by a hash of the region, akid and login, so later processes start without an
+    auth round-trip. Concurrent `ensure_uid` calls share one resolution.
+    """
 
-    def __init__(self, client: httpx.AsyncClient, credentials: Credentials) -> None:
+    USER_ACCESS_METHOD = "user_access_info"
+    SIGNATURE_LIFETIME_MS = 120_000
+    # Cached params are re-signed once they are this close to expiry
+    SIGNATURE_RENEW_MARGIN_MS = 30_000
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        credentials: Credentials,
+        *,
+        uid_cache_path: Path | str | None = None,
+    ) -> None:
         self._client = client
         self._credentials = credentials
         self._uid: str | None = credentials.uid
+        if uid_cache_path is None:
+            uid_cache_path = os.environ.get("LABARCHIVES_UID_CACHE") or (
+                Path.home() / ".labarchives_state" / "uid_cache.json"
+            )
+        self._uid_cache_path = Path(uid_cache_path).expanduser()
+        self._uid_task: asyncio.Task[str] | None = None
+        self._hmac_prototype = hmac.new(
+            credentials.password.encode("utf-8"), digestmod=hashlib.sha512
+        )
+        # method -> (renew after this epoch ms, signed params)
+        self._signed_params: dict[str, tuple[int, dict[str, str]]] = {}
 
     async def ensure_uid(self) -> str:
-        """Return a cached uid or resolve it through the documented user access flow."""
+        """Return a cached uid or resolve it through the documented user access flow.
+
+        Callers arriving while a resolution is running wait for it instead of
+        starting their own; a failed resolution is not remembered.
+        """
         if self._uid:
             return self._uid
 
-        if self._credentials.auth_email and self._credentials.auth_code:
-            self._uid = await self._fetch_uid_via_user_access_info()
-            return self._uid
+        if not (self._credentials.auth_email and self._credentials.auth_code):
+            raise RuntimeError(
+                "LabArchives credentials require either LABARCHIVES_UID or both "
+                "LABARCHIVES_AUTH_EMAIL and LABARCHIVES_AUTH_CODE."
+            )
 
-        raise RuntimeError(
-            "LabArchives credentials require either LABARCHIVES_UID or both "
-            "LABARCHIVES_AUTH_EMAIL and LABARCHIVES_AUTH_CODE."
-        )
+        task = self._uid_task
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._resolve_uid())
+            task.add_done_callback(self._forget_uid_task)
+            self._uid_task = task
+        # Shield so one caller giving up does not cancel the resolution for the others
+        return await asyncio.shield(task)
+
+    def _forget_uid_task(self, task: asyncio.Task[str]) -> None:
+        if self._uid_task is task:
+            self._uid_task = None
+
+    async def _resolve_uid(self) -> str:
+        uid = self._read_cached_uid()
+        if uid is None:
+            uid = await self._fetch_uid_via_user_access_info()
+            self._write_cached_uid(uid)
+        self._uid = uid
+        return uid
 
     def clear_uid(self) -> None:
+        """Forget the uid, including any copy cached on disk."""
         self._uid = None
+        self._write_cached_uid(None)
+
+    def invalidate_uid(self) -> None:
+        """Drop a resolved uid after LabArchives rejected a call made with it.
+
+        A uid configured in the credentials is kept; a resolved one is forgotten
+        (in memory and on disk) so the next `ensure_uid` resolves it again.
+        """
+        if self._credentials.uid is None and self._uid is not None:
+            logger.warning("LabArchives rejected the cached uid; it will be resolved again")
+            self.clear_uid()
+
+    def _uid_cache_key(self) -> str:
+        identity = "\0".join(
+            [
+                str(self._credentials.region),
+                self._credentials.akid,
+                self._credentials.auth_email or "",
+            ]
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _load_uid_cache(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self._uid_cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _read_cached_uid(self) -> str | None:
+        entry = self._load_uid_cache().get(self._uid_cache_key())
+        uid = entry.get("uid") if isinstance(entry, dict) else None
+        return str(uid) if uid else None
+
+    def _write_cached_uid(self, uid: str | None) -> None:
+        """Store (or with None, remove) this account's uid in the cache file."""
+        cache = self._load_uid_cache()
+        key = self._uid_cache_key()
+        if uid is None:
+            if cache.pop(key, None) is None:
+                return
+        else:
+            cache[key] = {"uid": uid, "resolved_at": int(time.time())}
+        try:
+            self._uid_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._uid_cache_path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as handle:
+                json.dump(cache, handle)
+            os.replace(tmp_path, self._uid_cache_path)
+        except OSError as exc:
+            logger.warning(f"Could not update uid cache {self._uid_cache_path}: {exc}")
 
     async def _fetch_uid_via_user_access_info(self) -> str:
         params = self._build_auth_params(self.USER_ACCESS_METHOD)
@@ -224,20 +331,26 @@ class AuthenticationManager:
             raise RuntimeError("LabArchives user_access_info failed: missing uid")
 
     def _build_auth_params(self, method: str) -> dict[str, str]:
-        expires = str(int(time.time() * 1000) + 120_000)
-        message = f"{self._credentials.akid}{method}{expires}".encode()
-        digest = hmac.new(
-            self._credentials.password.encode("utf-8"),
-            message,
-            hashlib.sha512,
-        ).digest()
-        signature = base64.b64encode(digest).decode("ascii")
-
-        return {
+        """Return akid/expires/sig params for `method`, reusing a still-valid signature."""
+        now_ms = int(time.time() * 1000)
+        cached = self._signed_params.get(method)
+        if cached is not None and now_ms < cached[0]:
+            return dict(cached[1])
+
+        expires = now_ms + self.SIGNATURE_LIFETIME_MS
+        params = {
             "akid": self._credentials.akid,
-            "expires": expires,
-            "sig": signature,
+            "expires": str(expires),
+            "sig": self._sign(method, expires),
         }
+        self._signed_params[method] = (expires - self.SIGNATURE_RENEW_MARGIN_MS, params)
+        return dict(params)
+
+    def _sign(self, method: str, expires: int) -> str:
+        """Compute the base64 HMAC-SHA512 of akid + method + expires."""
+        mac = self._hmac_prototype.copy()
+        mac.update(f"{self._credentials.akid}{method}{expires}".encode())
+        return base64.b64encode(mac.digest()).decode("ascii")
 
     @staticmethod
     def _parse_response_json(response: httpx.Response) -> dict[str, Any]:
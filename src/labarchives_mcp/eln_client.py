@@ -2,25 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
+import glob
 import html as _html
+import inspect
+import os
 import re
-from collections.abc import Callable
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Sequence
 from datetime import UTC
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
 
 import httpx
 from loguru import logger
 from pydantic import BaseModel, Field, ValidationError
 
 from .auth import AuthenticationManager
-from .transform import NotebookTransformer
+from .mirror import NotebookMirror
+from .throttle import Priority, current_priority, throttle_for
+from .transform import UID_FAULT_CODES, NotebookTransformer, parse_labarchives_fault
+from .upload_stream import FileUploadStream, ProgressCallback
 
 if TYPE_CHECKING:
     from .models.upload import (
         AttachmentUploadRequest,
         AttachmentUploadResult,
+        BatchUploadItem,
         PageCreationRequest,
         PageCreationResult,
+        ProvenanceMetadata,
         UploadRequest,
         UploadResponse,
     )
@@ -62,12 +74,325 @@ class NotebookRecord(BaseModel):
     )
 
 
+CacheKey = tuple[str, str, tuple[tuple[str, Hashable], ...]]
+
+
+class ResponseCache:
+    """Bounded in-memory cache for LabArchives read responses.
+
+    Entries expire `ttl_seconds` after they were stored; once `max_entries` is
+    reached the least recently used entry is evicted. Keys are
+    (uid, API method, request params), so writes can evict exactly the pages and
+    tree levels they touch via `invalidate()`. A size or TTL of 0 disables caching.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that had to call the API
+        evictions: Entries dropped for space (expired and invalidated ones excluded)
+        generation: Invalidation counter; see `LabArchivesClient._cached`
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumped by every invalidation so reads that started earlier are not stored
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when the cache stores anything at all."""
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def make_key(uid: str, method: str, **params: Hashable) -> CacheKey:
+        """Build the cache key for one API call."""
+        return (uid, method, tuple(sorted(params.items())))
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Return the cached value for `key`, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store `value` under `key`, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, method: str, **params: Hashable) -> int:
+        """Drop every entry for `method` whose params include `params` (any uid).
+
+        Returns:
+            Number of entries removed
+        """
+        self.generation += 1
+        stale = [key for key in self._entries if self.matches(key, method, **params)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    @staticmethod
+    def matches(key: CacheKey, method: str, **params: Hashable) -> bool:
+        """Return True if `key` is a `method` call whose params include `params`."""
+        return key[1] == method and all(dict(key[2]).get(k) == v for k, v in params.items())
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return size and hit-rate counters."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def _copy_response(value: Any) -> Any:
+    """Copy a cached list so callers cannot mutate the cached rows."""
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def _read_entry_events(parser: Any, include_data: bool) -> list[dict[str, Any]]:
+    """Convert the `<entry>` elements completed so far and release their memory."""
+    entries = []
+    for _event, entry in parser.read_events():
+        entry_dict = {
+            "eid": entry.findtext("eid"),
+            "part_type": entry.findtext("part-type"),
+            "created_at": entry.findtext("created-at"),
+            "updated_at": entry.findtext("updated-at"),
+        }
+        if include_data:
+            entry_data = entry.find("entry-data")
+            if entry_data is not None and entry_data.text:
+                entry_dict["content"] = entry_data.text
+        entries.append(entry_dict)
+
+        # Drop the element and any already-processed siblings still attached to the root
+        entry.clear()
+        parent = entry.getparent()
+        if parent is not None:
+            while entry.getprevious() is not None:
+                del parent[0]
+    return entries
+
+
+def expand_upload_paths(source: str | Path) -> list[Path]:
+    """Resolve a directory or glob pattern to the files it names, sorted by path.
+
+    A directory contributes its regular, non-hidden files (not subdirectories);
+    anything else is treated as a glob pattern, where `**` matches recursively.
+
+    Raises:
+        FileNotFoundError: Nothing matched `source`
+    """
+    root = Path(source).expanduser()
+    if root.is_dir():
+        candidates = [p for p in root.iterdir() if not p.name.startswith(".")]
+    else:
+        candidates = [Path(p) for p in glob.glob(str(root), recursive=True)]
+    files = sorted(p for p in candidates if p.is_file())
+    if not files:
+        raise FileNotFoundError(f"No files to upload match {source}")
+    return files
+
+
 class LabArchivesClient:
-    """Wrap LabArchives ELN API calls needed for proof-of-life."""
+    """Wrap LabArchives ELN API calls needed for proof-of-life.
+
+    Reads (`list_notebooks`, `get_notebook_tree`, `get_page_entries`) are served
+    from a `ResponseCache` while fresh. Size and TTL default to the
+    `LABARCHIVES_CACHE_SIZE` / `LABARCHIVES_CACHE_TTL_SECONDS` environment
+    variables (512 entries, 30 seconds); `add_entry`, `add_attachment` and
+    `insert_node` evict the page or tree level they modify. Page entries are parsed
+    incrementally as the response streams in; `iter_page_entries` exposes them
+    one by one.
+
+    Identical reads that are already in flight are coalesced: concurrent callers
+    share one HTTP request and all receive its result (or its exception, which
+    is never cached). An interactive caller never joins a request running at
+    background priority, so it is not queued behind background work. Every
+    request goes through the `RequestThrottle` shared by all clients on the same
+    `httpx.AsyncClient` (rate limit, adaptive concurrency, retries of retryable
+    faults).
+
+    With a `NotebookMirror`, tree levels and pages are also read through a local
+    SQLite copy younger than its `max_age_seconds` and every fetch is written back
+    to it; writes mark the touched page or level as expired there too.
+    """
 
-    def __init__(self, client: httpx.AsyncClient, auth_manager: AuthenticationManager) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        auth_manager: AuthenticationManager,
+        *,
+        cache_size: int | None = None,
+        cache_ttl_seconds: float | None = None,
+        mirror: NotebookMirror | None = None,
+    ) -> None:
         self._client = client
         self._auth_manager = auth_manager
+        if cache_size is None:
+            cache_size = int(os.environ.get("LABARCHIVES_CACHE_SIZE", "512"))
+        if cache_ttl_seconds is None:
+            cache_ttl_seconds = float(os.environ.get("LABARCHIVES_CACHE_TTL_SECONDS", "30"))
+        self.cache = ResponseCache(max_entries=cache_size, ttl_seconds=cache_ttl_seconds)
+        self._in_flight: dict[tuple[CacheKey, Priority], asyncio.Task[Any]] = {}
+        self.coalesced = 0
+        self.throttle = throttle_for(client)
+        self.mirror = mirror
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return response cache size, hit-rate and request coalescing counters."""
+        stats = {
+            **self.cache.stats(),
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+        if self.mirror is not None:
+            stats["mirror"] = self.mirror.stats()
+        return stats
+
+    async def _cached(self, key: CacheKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve `key` from the response cache or an identical in-flight request.
+
+        On a miss the first caller starts `fetch` as a task; callers arriving while
+        it runs await the same task instead of issuing their own request (see
+        `_join_flight` for how priorities are matched). Only a successful result is
+        cached, and only if no write invalidated the cache while the request was in
+        flight.
+        """
+        if self.cache.enabled:
+            value = self.cache.get(key)
+            if value is not None:
+                return _copy_response(value)
+
+        task = self._join_flight(key)
+        if task is None:
+            # The task inherits this context, so it runs at the caller's priority
+            task = asyncio.ensure_future(fetch())
+            flight = (key, current_priority())
+            self._in_flight[flight] = task
+            task.add_done_callback(self._make_flight_callback(flight, self.cache.generation))
+
+        # Shield so one caller giving up does not cancel the request for the others
+        return _copy_response(await asyncio.shield(task))
+
+    def _join_flight(self, key: CacheKey) -> asyncio.Task[Any] | None:
+        """Return an in-flight read of `key` the current caller may share, if any.
+
+        Background callers join any request; interactive callers only join
+        interactive ones, since a background request waits behind interactive work.
+        """
+        priority = current_priority()
+        task = self._in_flight.get((key, priority))
+        if task is None and priority is Priority.BACKGROUND:
+            task = self._in_flight.get((key, Priority.INTERACTIVE))
+        if task is not None:
+            self.coalesced += 1
+        return task
+
+    def _make_flight_callback(
+        self, flight: tuple[CacheKey, Priority], generation: int
+    ) -> Callable[[asyncio.Task[Any]], None]:
+        key = flight[0]
+
+        def _done(task: asyncio.Task[Any]) -> None:
+            if self._in_flight.get(flight) is task:
+                del self._in_flight[flight]
+            if task.cancelled():
+                return
+            if task.exception() is None and self.cache.generation == generation:
+                self.cache.put(key, task.result())
+
+        return _done
+
+    async def _request(
+        self,
+        http_method: str,
+        url: str,
+        api_method: str,
+        params: dict[str, str],
+        *,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a signed API call through the shared throttle.
+
+        Auth params are requested on every attempt (the auth manager renews them
+        before they expire) so retries never reuse an expired signature. GETs are
+        retried on any transport error; writes only when the request cannot have
+        reached the server. With `stream=True` the body of a successful response is
+        left unread (the caller must close it); error bodies are always read so
+        faults can be parsed.
+
+        A fault saying the uid itself was rejected also makes the auth manager forget
+        a resolved uid, so a stale cached uid is resolved again next time. Other
+        401/403 answers (no rights, invalid signature) leave the uid alone.
+
+        Raises:
+            LabArchivesAPIError: LabArchives answered with a fault
+            httpx.HTTPStatusError: Any other non-success status
+        """
+
+        async def attempt() -> httpx.Response:
+            signed = {**params, **self._auth_manager._build_auth_params(api_method)}
+            if stream:
+                request = self._client.build_request(http_method, url, params=signed, **kwargs)
+                streamed = await self._client.send(request, stream=True)
+                if streamed.is_error:
+                    await streamed.aread()
+                return streamed
+            if http_method == "GET":
+                return await self._client.get(url, params=signed)
+            return await self._client.post(url, params=signed, **kwargs)
+
+        response = await self.throttle.send(attempt, idempotent=http_method == "GET")
+        if response.is_error:
+            fault = parse_labarchives_fault(response.content)
+            if fault is not None:
+                if fault.code in UID_FAULT_CODES:
+                    self._auth_manager.invalidate_uid()
+                raise fault
+        response.raise_for_status()
+        return response
+
+    def _invalidate(self, method: str, **params: Hashable) -> None:
+        """Evict cached and in-flight reads touched by a write."""
+        self.cache.invalidate(method, **params)
+        for flight in [f for f in self._in_flight if ResponseCache.matches(f[0], method, **params)]:
+            # Later readers start a fresh request; current waiters keep the old one
+            del self._in_flight[flight]
 
     @staticmethod
     def _markdown_to_html(markdown_text: str, require_lib: bool = False) -> str:
@@ -180,14 +505,19 @@ class LabArchivesClient:
 
     async def list_notebooks(self, uid: str) -> list[NotebookRecord]:
         """Return notebooks for a user uid."""
-        auth_params = self._auth_manager._build_auth_params("user_info_via_id")
-        params = {"uid": uid, **auth_params}
+        key = ResponseCache.make_key(uid, "user_info_via_id")
+        notebooks: list[NotebookRecord] = await self._cached(
+            key, lambda: self._fetch_notebooks(uid)
+        )
+        return notebooks
 
-        response = await self._client.get(
+    async def _fetch_notebooks(self, uid: str) -> list[NotebookRecord]:
+        response = await self._request(
+            "GET",
             "https://api.labarchives.com/api/users/user_info_via_id",
-            params=params,
+            "user_info_via_id",
+            {"uid": uid},
         )
-        response.raise_for_status()
 
         payload = response.text
         raw_records = self.parse_xml(payload)
@@ -219,17 +549,44 @@ class LabArchivesClient:
             nbid: Notebook ID
             parent_tree_id: Either 0 for root, or a base64-encoded tree_id string
         """
+        key = ResponseCache.make_key(
+            uid, "get_tree_level", nbid=nbid, parent_tree_id=str(parent_tree_id)
+        )
+        nodes: list[dict[str, Any]] = await self._cached(
+            key, lambda: self._read_tree_level(uid, nbid, parent_tree_id)
+        )
+        return nodes
+
+    async def _read_tree_level(
+        self, uid: str, nbid: str, parent_tree_id: int | str
+    ) -> list[dict[str, Any]]:
+        """Read a tree level through the mirror, if there is one."""
+        if self.mirror is None:
+            return await self._fetch_tree_level(uid, nbid, parent_tree_id)
+        # SQLite I/O runs in a worker thread so it never stalls the event loop
+        mirrored = await asyncio.to_thread(
+            self.mirror.get_tree_level, nbid, parent_tree_id, max_age=self.mirror.max_age_seconds
+        )
+        if mirrored is not None:
+            return mirrored.value
+        generation = self.cache.generation
+        nodes = await self._fetch_tree_level(uid, nbid, parent_tree_id)
+        if self.cache.generation == generation:
+            await asyncio.to_thread(self.mirror.put_tree_level, nbid, parent_tree_id, nodes)
+        return nodes
+
+    async def _fetch_tree_level(
+        self, uid: str, nbid: str, parent_tree_id: int | str
+    ) -> list[dict[str, Any]]:
         logger.debug(f"get_notebook_tree: nbid={nbid}, parent_tree_id={parent_tree_id}")
 
-        auth_params = self._auth_manager._build_auth_params("get_tree_level")
-        params = {"uid": uid, "nbid": nbid, "parent_tree_id": str(parent_tree_id), **auth_params}
+        params = {"uid": uid, "nbid": nbid, "parent_tree_id": str(parent_tree_id)}
 
         url = "https://api.labarchives.com/api/tree_tools/get_tree_level"
         logger.debug(f"Making API request to {url}")
 
-        response = await self._client.get(url, params=params)
+        response = await self._request("GET", url, "get_tree_level", params)
         logger.debug(f"API response status: {response.status_code}")
-        response.raise_for_status()
 
         from lxml import etree
 
@@ -258,48 +615,161 @@ class LabArchivesClient:
             page_tree_id: Either an integer or base64-encoded tree_id string
             include_data: Whether to include entry content
         """
+        key = self._page_entries_key(uid, nbid, page_tree_id, include_data)
+        entries: list[dict[str, Any]] = await self._cached(
+            key, lambda: self._read_page_entries(uid, nbid, page_tree_id, include_data)
+        )
+        return entries
+
+    async def _read_page_entries(
+        self, uid: str, nbid: str, page_tree_id: int | str, include_data: bool
+    ) -> list[dict[str, Any]]:
+        """Read a page through the mirror, if there is one."""
+        mirrored = await self._fresh_mirrored_page(nbid, page_tree_id, include_data)
+        if mirrored is not None:
+            return mirrored
+        generation = self.cache.generation
+        entries = await self._fetch_page_entries(uid, nbid, page_tree_id, include_data)
+        await self._mirror_page(nbid, page_tree_id, include_data, entries, generation)
+        return entries
+
+    async def _fresh_mirrored_page(
+        self, nbid: str, page_tree_id: int | str, include_data: bool
+    ) -> list[dict[str, Any]] | None:
+        if self.mirror is None:
+            return None
+        mirrored = await asyncio.to_thread(
+            self.mirror.get_page_entries,
+            nbid,
+            page_tree_id,
+            include_data=include_data,
+            max_age=self.mirror.max_age_seconds,
+        )
+        return None if mirrored is None else mirrored.value
+
+    async def _mirror_page(
+        self,
+        nbid: str,
+        page_tree_id: int | str,
+        include_data: bool,
+        entries: list[dict[str, Any]],
+        generation: int,
+    ) -> None:
+        # Pages without content are not mirrored; a write since the read began wins
+        if self.mirror is not None and include_data and self.cache.generation == generation:
+            await asyncio.to_thread(self.mirror.put_page_entries, nbid, page_tree_id, entries)
+
+    async def iter_page_entries(
+        self, uid: str, nbid: str, page_tree_id: int | str, include_data: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the entries of a page as they are parsed off the wire.
+
+        Same entries as `get_page_entries`, but each one is available as soon as its
+        `<entry>` element has been downloaded, so callers can start processing
+        before a large page finishes. Fresh cached pages and identical reads
+        already in flight are served without a new request; a page streamed to
+        the end is cached like any other read.
+
+        Args:
+            uid: User ID
+            nbid: Notebook ID
+            page_tree_id: Either an integer or base64-encoded tree_id string
+            include_data: Whether to include entry content
+        """
+        key = self._page_entries_key(uid, nbid, page_tree_id, include_data)
+        if self.cache.enabled:
+            cached = self.cache.get(key)
+            if cached is not None:
+                for entry in _copy_response(cached):
+                    yield entry
+                return
+
+        task = self._join_flight(key)
+        if task is not None:
+            for entry in _copy_response(await asyncio.shield(task)):
+                yield entry
+            return
+
+        mirrored = await self._fresh_mirrored_page(nbid, page_tree_id, include_data)
+        if mirrored is not None:
+            self.cache.put(key, mirrored)
+            for entry in _copy_response(mirrored):
+                yield entry
+            return
+
+        generation = self.cache.generation
+        received: list[dict[str, Any]] = []
+        async for entry in self._stream_page_entries(uid, nbid, page_tree_id, include_data):
+            received.append(entry)
+            yield dict(entry)
+        await self._mirror_page(nbid, page_tree_id, include_data, received, generation)
+        if self.cache.enabled and self.cache.generation == generation:
+            self.cache.put(key, received)
+
+    @staticmethod
+    def _page_entries_key(
+        uid: str, nbid: str, page_tree_id: int | str, include_data: bool
+    ) -> CacheKey:
+        return ResponseCache.make_key(
+            uid,
+            "get_entries_for_page",
+            nbid=nbid,
+            page_tree_id=str(page_tree_id),
+            include_data=include_data,
+        )
+
+    async def _fetch_page_entries(
+        self, uid: str, nbid: str, page_tree_id: int | str, include_data: bool
+    ) -> list[dict[str, Any]]:
+        return [
+            entry
+            async for entry in self._stream_page_entries(uid, nbid, page_tree_id, include_data)
+        ]
+
+    async def _stream_page_entries(
+        self, uid: str, nbid: str, page_tree_id: int | str, include_data: bool
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Parse `get_entries_for_page` incrementally from the response body.
+
+        Chunks are fed to an lxml pull parser and each entry is yielded when its
+        closing tag arrives; parsed elements are then dropped, so neither the raw
+        payload nor the full tree is held in memory.
+        """
         logger.debug(
             f"get_page_entries: nbid={nbid}, page_tree_id={page_tree_id}, "
             f"include_data={include_data}"
         )
 
-        auth_params = self._auth_manager._build_auth_params("get_entries_for_page")
         params = {
             "uid": uid,
             "nbid": nbid,
             "page_tree_id": str(page_tree_id),
             "entry_data": "true" if include_data else "false",
-            **auth_params,
         }
 
         url = "https://api.labarchives.com/api/tree_tools/get_entries_for_page"
         logger.debug(f"Making API request to {url}")
 
-        response = await self._client.get(url, params=params)
+        response = await self._request("GET", url, "get_entries_for_page", params, stream=True)
         logger.debug(f"API response status: {response.status_code}")
-        response.raise_for_status()
 
         from lxml import etree
 
-        root = etree.fromstring(response.content)
-        entry_elements = root.findall(".//entry")
-        logger.debug(f"Parsed {len(entry_elements)} entries from XML response")
-
-        entries = []
-        for entry in entry_elements:
-            entry_dict = {
-                "eid": entry.findtext("eid"),
-                "part_type": entry.findtext("part-type"),
-                "created_at": entry.findtext("created-at"),
-                "updated_at": entry.findtext("updated-at"),
-            }
-            if include_data:
-                entry_data = entry.find("entry-data")
-                if entry_data is not None and entry_data.text:
-                    entry_dict["content"] = entry_data.text
-            entries.append(entry_dict)
-
-        return entries
+        parser = etree.XMLPullParser(events=("end",), tag="entry")
+        count = 0
+        try:
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                for entry in _read_entry_events(parser, include_data):
+                    count += 1
+                    yield entry
+            parser.close()
+            for entry in _read_entry_events(parser, include_data):
+                count += 1
+                yield entry
+        finally:
+            await response.aclose()
+        logger.debug(f"Parsed {count} entries from XML response")
 
     async def insert_node(self, uid: str, request: PageCreationRequest) -> PageCreationResult:
         """Create a new page or folder in notebook hierarchy.
@@ -318,19 +788,27 @@ class LabArchivesClient:
             f"parent={request.parent_tree_id}, display_text={request.display_text}"
         )
 
-        auth_params = self._auth_manager._build_auth_params("insert_node")
         params = {
             "uid": uid,
             "nbid": request.notebook_id,
             "parent_tree_id": str(request.parent_tree_id),
             "display_text": request.display_text,
             "is_folder": "true" if request.is_folder else "false",
-            **auth_params,
         }
 
         url = "https://api.labarchives.com/api/tree_tools/insert_node"
-        response = await self._client.post(url, params=params)
-        response.raise_for_status()
+        try:
+            response = await self._request("POST", url, "insert_node", params)
+        finally:
+            self._invalidate(
+                "get_tree_level",
+                nbid=request.notebook_id,
+                parent_tree_id=str(request.parent_tree_id),
+            )
+            if self.mirror is not None:
+                await asyncio.to_thread(
+                    self.mirror.expire_tree_level, request.notebook_id, request.parent_tree_id
+                )
 
         from lxml import etree
 
@@ -347,13 +825,21 @@ class LabArchivesClient:
         )
 
     async def add_attachment(
-        self, uid: str, request: AttachmentUploadRequest
+        self,
+        uid: str,
+        request: AttachmentUploadRequest,
+        *,
+        progress: ProgressCallback | None = None,
     ) -> AttachmentUploadResult:
         """Upload a file as attachment to a page.
 
+        The file is streamed from disk in chunks rather than read into memory; its
+        size and SHA-256 digest are taken while it streams.
+
         Args:
             uid: User ID
             request: Attachment upload parameters
+            progress: Optional callback receiving (bytes sent, total bytes)
 
         Returns:
             AttachmentUploadResult with entry metadata
@@ -367,11 +853,8 @@ class LabArchivesClient:
             f"pid={request.page_tree_id}, filename={request.filename}"
         )
 
-        # Read file content
-        file_content = request.file_path.read_bytes()
-        file_size = len(file_content)
+        body = FileUploadStream(request.file_path, progress=progress)
 
-        auth_params = self._auth_manager._build_auth_params("add_attachment")
         # Default filename to file_path.name if not provided
         filename = request.filename or request.file_path.name
         params = {
@@ -379,7 +862,6 @@ class LabArchivesClient:
             "nbid": request.notebook_id,
             "pid": request.page_tree_id,
             "filename": filename,
-            **auth_params,
         }
 
         if request.caption:
@@ -388,13 +870,17 @@ class LabArchivesClient:
             params["change_description"] = request.change_description
 
         url = "https://api.labarchives.com/api/entries/add_attachment"
-        response = await self._client.post(
-            url,
-            params=params,
-            content=file_content,
-            headers={"Content-Type": "application/octet-stream"},
-        )
-        response.raise_for_status()
+        try:
+            response = await self._request(
+                "POST",
+                url,
+                "add_attachment",
+                params,
+                content=body,
+                headers=body.headers,
+            )
+        finally:
+            await self._invalidate_page(request.notebook_id, request.page_tree_id)
 
         from lxml import etree
 
@@ -416,7 +902,8 @@ class LabArchivesClient:
             filename=entry.findtext("filename") or filename,
             caption=entry.findtext("caption"),
             created_at=created_at,
-            file_size_bytes=file_size,
+            file_size_bytes=body.total_bytes,
+            sha256=body.sha256,
         )
 
     async def add_entry(
@@ -445,14 +932,12 @@ class LabArchivesClient:
         """
         logger.debug(f"add_entry: nbid={notebook_id}, pid={page_tree_id}, type={part_type}")
 
-        auth_params = self._auth_manager._build_auth_params("add_entry")
         params = {
             "uid": uid,
             "nbid": notebook_id,
             "pid": page_tree_id,
             "part_type": part_type,
             "entry_data": entry_data,
-            **auth_params,
         }
 
         if caption:
@@ -461,8 +946,10 @@ class LabArchivesClient:
             params["change_description"] = change_description
 
         url = "https://api.labarchives.com/api/entries/add_entry"
-        response = await self._client.post(url, params=params)
-        response.raise_for_status()
+        try:
+            response = await self._request("POST", url, "add_entry", params)
+        finally:
+            await self._invalidate_page(notebook_id, page_tree_id)
 
         from lxml import etree
 
@@ -481,7 +968,19 @@ class LabArchivesClient:
             result["created_at"] = created_at_val
         return result
 
-    async def upload_to_labarchives(self, uid: str, request: UploadRequest) -> UploadResponse:
+    async def _invalidate_page(self, nbid: str, page_tree_id: int | str) -> None:
+        """Evict cached entries of a page after a write to it."""
+        self._invalidate("get_entries_for_page", nbid=nbid, page_tree_id=str(page_tree_id))
+        if self.mirror is not None:
+            await asyncio.to_thread(self.mirror.expire_page, nbid, page_tree_id)
+
+    async def upload_to_labarchives(
+        self,
+        uid: str,
+        request: UploadRequest,
+        *,
+        progress: ProgressCallback | None = None,
+    ) -> UploadResponse:
         """Orchestrate complete upload workflow.
 
         Creates a page and either:
@@ -493,6 +992,7 @@ class LabArchivesClient:
         Args:
             uid: User ID
             request: Complete upload request
+            progress: Optional callback receiving (bytes read or sent, total bytes)
 
         Returns:
             UploadResponse with page URL and metadata
@@ -541,9 +1041,13 @@ class LabArchivesClient:
 
         attachment_created_at: dt | None = None
 
+        content_sha256: str | None = None
+
         if request.create_as_text:
-            # Read file content as text (best-effort decoding)
-            raw_bytes = request.file_path.read_bytes()
+            # Read file content as text (best-effort decoding) without blocking the loop
+            source = FileUploadStream(request.file_path, progress=progress)
+            raw_bytes = await source.read()
+            content_sha256 = source.sha256
             try:
                 file_text = raw_bytes.decode("utf-8")
             except UnicodeDecodeError:
@@ -584,8 +1088,11 @@ class LabArchivesClient:
                 caption=request.caption,
                 change_description=request.change_description,
             )
-            attachment_result = await self.add_attachment(uid, attachment_request)
+            attachment_result = await self.add_attachment(
+                uid, attachment_request, progress=progress
+            )
             main_entry_eid = attachment_result.eid
+            content_sha256 = attachment_result.sha256
             file_size_bytes_for_response = attachment_result.file_size_bytes
             attachment_created_at = attachment_result.created_at
             logger.info(f"Uploaded attachment: {main_entry_eid}")
@@ -629,4 +1136,216 @@ class LabArchivesClient:
             created_at=created_at_dt,
             file_size_bytes=file_size_bytes_for_response,
             filename=filename_for_response,
+            sha256=content_sha256,
+        )
+
+    async def upload_files(
+        self,
+        uid: str,
+        files: str | Path | Sequence[Path],
+        *,
+        notebook_id: str,
+        parent_folder_id: str | None = None,
+        metadata: ProvenanceMetadata | None = None,
+        allow_dirty_git: bool = False,
+        create_as_text: bool = False,
+        caption: str | None = None,
+        max_concurrency: int = 4,
+        progress: ProgressCallback | None = None,
+    ) -> list[BatchUploadItem]:
+        """Upload many files, one page per file, with bounded parallelism.
+
+        Each file goes through `upload_to_labarchives` (page, content, metadata entry)
+        titled after its file name; up to `max_concurrency` files are in progress at
+        once, on top of the client's shared request throttle. A failing file does not
+        stop the others: every file gets a `BatchUploadItem` with either its response
+        or its error, in input order.
+
+        Args:
+            uid: User ID
+            files: Directory, glob pattern (see `expand_upload_paths`) or explicit paths
+            notebook_id: Destination notebook
+            parent_folder_id: Folder tree_id for the new pages, or None for root
+            metadata: Provenance metadata added to every page
+            allow_dirty_git: Allow upload despite uncommitted changes
+            create_as_text: Store file contents as page text instead of attachments
+            caption: Optional caption applied to every upload
+            max_concurrency: Files uploaded concurrently
+            progress: Optional callback receiving (files finished, total files)
+
+        Raises:
+            FileNotFoundError: A directory or pattern matched no files
+        """
+        from labarchives_mcp.models.upload import BatchUploadItem, UploadRequest
+
+        paths = (
+            await asyncio.to_thread(expand_upload_paths, files)
+            if isinstance(files, str | Path)
+            else list(files)
         )
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        finished = 0
+        logger.info(f"upload_files: {len(paths)} files to notebook {notebook_id}")
+
+        async def upload_one(path: Path) -> BatchUploadItem:
+            nonlocal finished
+            async with semaphore:
+                try:
+                    request = UploadRequest(
+                        notebook_id=notebook_id,
+                        parent_folder_id=parent_folder_id,
+                        page_title=path.name,
+                        file_path=path,
+                        caption=caption,
+                        change_description=None,
+                        metadata=metadata,
+                        allow_dirty_git=allow_dirty_git,
+                        create_as_text=create_as_text,
+                    )
+                    item = BatchUploadItem(
+                        file_path=path, response=await self.upload_to_labarchives(uid, request)
+                    )
+                except Exception as exc:
+                    logger.warning(f"Batch upload of {path} failed: {exc}")
+                    # LabArchives faults carry their details in fields, not args
+                    item = BatchUploadItem(file_path=path, error=str(exc) or repr(exc))
+            finished += 1
+            if progress is not None:
+                result = progress(finished, len(paths))
+                if inspect.isawaitable(result):
+                    await result
+            return item
+
+        items = list(await asyncio.gather(*(upload_one(path) for path in paths)))
+        failed = sum(not item.ok for item in items)
+        logger.info(f"upload_files: {len(items) - failed} uploaded, {failed} failed")
+        return items
+
+
+class NotebookTreeSource(Protocol):
+    """Anything that can return one level of a notebook tree (e.g. `LabArchivesClient`)."""
+
+    async def get_notebook_tree(
+        self, uid: str, nbid: str, parent_tree_id: int | str = 0
+    ) -> list[dict[str, Any]]:
+        """Return the nodes directly below `parent_tree_id`."""
+        ...
+
+
+class NotebookTreeCrawler:
+    """Breadth-first, concurrent walker over a notebook's folder tree.
+
+    Each level of the tree is fetched with up to `concurrency` folders in flight at
+    once, instead of one `get_tree_level` round-trip at a time. Every page is yielded
+    with the titles of the folders above it. Tree levels are cached for
+    `ttl_seconds`, so repeated crawls of the same notebook (e.g. a listing followed
+    by a sync) only refetch levels that have expired.
+
+    Attributes:
+        hits: Tree levels served from the cache
+        misses: Tree levels fetched from LabArchives
+    """
+
+    def __init__(
+        self,
+        client: NotebookTreeSource,
+        *,
+        concurrency: int = 8,
+        ttl_seconds: float = 300.0,
+        max_cached_levels: int = 4096,
+    ) -> None:
+        self._client = client
+        self._concurrency = max(1, concurrency)
+        self._ttl_seconds = ttl_seconds
+        self._max_cached_levels = max_cached_levels
+        self._levels: dict[tuple[str, str, str], tuple[float, list[dict[str, Any]]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def iter_pages(
+        self,
+        uid: str,
+        nbid: str,
+        root_tree_id: int | str = 0,
+        *,
+        on_folder_error: Callable[[int | str, Exception], None] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every page below `root_tree_id`, level by level.
+
+        Each page is its tree node (`tree_id`, `display_text`, `is_page`, `is_folder`)
+        plus `folder_path` (folder titles from the crawl root down) and
+        `parent_tree_id`. A failure to read the root propagates; a failing subfolder
+        is logged and skipped so one bad folder does not hide the rest of the notebook.
+
+        Args:
+            uid: User ID
+            nbid: Notebook ID
+            root_tree_id: 0 for the notebook root, or the tree_id of a folder
+            on_folder_error: Called with the folder's tree_id and the error for every
+                skipped subfolder, so callers can report incomplete crawls
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+        level: list[tuple[int | str, list[str]]] = [(root_tree_id, [])]
+        is_root = True
+
+        async def fetch(parent: int | str) -> list[dict[str, Any]] | Exception:
+            async with semaphore:
+                try:
+                    return await self.get_level(uid, nbid, parent)
+                except Exception as exc:  # noqa: BLE001 - reported per folder below
+                    return exc
+
+        while level:
+            results = await asyncio.gather(*(fetch(parent) for parent, _ in level))
+            next_level: list[tuple[int | str, list[str]]] = []
+            for (parent, path), nodes in zip(level, results, strict=True):
+                if isinstance(nodes, Exception):
+                    if is_root:
+                        raise nodes
+                    logger.warning(f"Skipping folder {parent} of notebook {nbid}: {nodes}")
+                    if on_folder_error is not None:
+                        on_folder_error(parent, nodes)
+                    continue
+                for node in nodes:
+                    tree_id = node.get("tree_id")
+                    if node.get("is_page"):
+                        yield {**node, "folder_path": path, "parent_tree_id": str(parent)}
+                    elif node.get("is_folder") and tree_id is not None:
+                        title = node.get("display_text") or str(tree_id)
+                        next_level.append((str(tree_id), [*path, title]))
+            level = next_level
+            is_root = False
+
+    async def list_pages(
+        self, uid: str, nbid: str, root_tree_id: int | str = 0
+    ) -> list[dict[str, Any]]:
+        """Return every page below `root_tree_id` (see `iter_pages`)."""
+        return [page async for page in self.iter_pages(uid, nbid, root_tree_id)]
+
+    async def get_level(
+        self, uid: str, nbid: str, parent_tree_id: int | str
+    ) -> list[dict[str, Any]]:
+        """Return one tree level, from the cache while it is fresh."""
+        key = (uid, nbid, str(parent_tree_id))
+        cached = self._levels.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        nodes = await self._client.get_notebook_tree(uid, nbid, parent_tree_id=parent_tree_id)
+        self._levels.pop(key, None)
+        if len(self._levels) >= self._max_cached_levels:
+            # Drop the oldest entry; insertion order tracks fetch time
+            self._levels.pop(next(iter(self._levels)))
+        self._levels[key] = (now + self._ttl_seconds, nodes)
+        return nodes
+
+    def invalidate(self, nbid: str | None = None) -> None:
+        """Forget cached levels for one notebook, or for all notebooks."""
+        if nbid is None:
+            self._levels.clear()
+            return
+        for key in [key for key in self._levels if key[1] == nbid]:
+            del self._levels[key]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import functools
 import html
 import inspect
 import os
@@ -18,9 +18,13 @@ from loguru import logger
 
 from . import onboard
 from .auth import AuthenticationManager, Credentials
-from .eln_client import LabArchivesClient
+from .eln_client import LabArchivesClient, NotebookTreeCrawler, expand_upload_paths
+from .mirror import MirroredValue, NotebookMirror, is_offline_error
+from .search import SearchService
 from .state import StateManager
+from .throttle import background_priority
 from .transform import LabArchivesAPIError, translate_labarchives_fault
+from .upload_stream import file_sha256
 
 ResourceHandler = Callable[[], Awaitable[dict[str, Any]]]
 ResourceDecorator = Callable[[ResourceHandler], ResourceHandler]
@@ -136,6 +140,114 @@ def _is_upload_enabled() -> bool:
     return env_value.lower() != "false"
 
 
+def _provenance_metadata(
+    *,
+    git_commit_sha: str,
+    git_branch: str,
+    git_repo_url: str,
+    git_is_dirty: bool,
+    python_version: str,
+    executed_at: str,
+    dependencies: dict[str, str] | None,
+) -> Any:
+    """Build upload `ProvenanceMetadata` from tool arguments and the local platform."""
+    import platform
+    from datetime import datetime
+
+    from labarchives_mcp.models.upload import ProvenanceMetadata
+
+    return ProvenanceMetadata(
+        git_commit_sha=git_commit_sha,
+        git_branch=git_branch,
+        git_repo_url=git_repo_url,
+        git_is_dirty=git_is_dirty,
+        code_version=__version__,
+        executed_at=datetime.fromisoformat(executed_at.replace("Z", "+00:00")),
+        python_version=python_version,
+        dependencies=dependencies or {},
+        os_name=platform.system(),
+        hostname=platform.node(),
+    )
+
+
+def _deduplicated_upload(artifact: dict[str, Any]) -> dict[str, Any]:
+    """Describe an earlier upload (an artifact from `StateManager.find_upload`) as a tool result."""
+    from datetime import UTC, datetime
+
+    created_at = artifact.get("created_at")
+    return {
+        "page_tree_id": artifact.get("page_id"),
+        "entry_id": artifact.get("entry_id"),
+        "page_url": artifact.get("page_url"),
+        "created_at": (
+            datetime.fromtimestamp(created_at, UTC).isoformat()
+            if isinstance(created_at, int | float)
+            else created_at
+        ),
+        "file_size_bytes": artifact.get("file_size_bytes"),
+        "filename": artifact.get("filename"),
+        "sha256": artifact.get("sha256"),
+        "deduplicated": True,
+    }
+
+
+def _mcp_progress_reporter(label: str) -> Callable[[int, int], Awaitable[None]] | None:
+    """Return a callback forwarding byte progress to the calling MCP client, if any.
+
+    Progress notifications are sent at most once per percentage point.
+    """
+    try:
+        from fastmcp.server.dependencies import get_context
+
+        ctx = get_context()
+    except (ImportError, RuntimeError):
+        return None
+
+    last_percent = -1
+
+    async def report(done: int, total: int) -> None:
+        nonlocal last_percent
+        percent = done * 100 // total if total else 100
+        if percent == last_percent:
+            return
+        last_percent = percent
+        try:
+            await ctx.report_progress(done, total)
+        except Exception as exc:  # progress is best-effort
+            logger.debug(f"Progress report for {label} failed: {exc}")
+
+    return report
+
+
+async def _offline_copy(
+    exc: Exception,
+    mirror: NotebookMirror | None,
+    read: Callable[[NotebookMirror], MirroredValue | None],
+) -> MirroredValue | None:
+    """Return the mirrored copy to answer with when `exc` means LabArchives is unreachable."""
+    if mirror is None or not is_offline_error(exc):
+        return None
+    mirrored = await asyncio.to_thread(read, mirror)
+    if mirrored is not None:
+        logger.warning(
+            f"LabArchives unreachable ({exc!r}); answering from the mirror "
+            f"as of {mirrored.fetched_at_iso}"
+        )
+    return mirrored
+
+
+def _tree_listing(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "tree_id": node["tree_id"],
+            "title": node["display_text"],
+            "is_page": node["is_page"],
+            "is_folder": node["is_folder"],
+        }
+        for node in nodes
+    ]
+
+
 async def run_server() -> None:
     """Run the MCP server event loop."""
 
@@ -145,7 +257,10 @@ async def run_server() -> None:
     async with httpx.AsyncClient(base_url=str(credentials.region)) as http_client:
         auth_manager = AuthenticationManager(http_client, credentials)
         notebook_client = LabArchivesClient(http_client, auth_manager)
+        notebook_client.mirror = NotebookMirror.from_env()
+        tree_crawler = NotebookTreeCrawler(notebook_client)
         state_manager = StateManager()
+        search_service = SearchService(auth_manager, notebook_client)
 
         server = _instantiate_fastmcp(
             fastmcp_class,
@@ -212,6 +327,9 @@ async def run_server() -> None:
                 - title: Page or folder name
                 - is_page: True if this is a page (can be read with read_notebook_page)
                 - is_folder: True if this is a folder (can be navigated with folder_id)
+                When LabArchives is unreachable and a local mirror is configured, the
+                mirrored listing is returned with "stale": True and "mirrored_at" on
+                every item.
             """
             logger.info(
                 f"list_notebook_pages called with notebook_id={notebook_id}, "
@@ -239,22 +357,58 @@ async def run_server() -> None:
                 )
                 logger.info(f"Retrieved {len(tree_nodes)} nodes from notebook tree")
 
-                result = [
-                    {
-                        "tree_id": node["tree_id"],
-                        "title": node["display_text"],
-                        "is_page": node["is_page"],
-                        "is_folder": node["is_folder"],
-                    }
-                    for node in tree_nodes
-                ]
+                result = _tree_listing(tree_nodes)
                 logger.success(f"Successfully listed {len(result)} pages/folders")
                 return result
 
             except Exception as exc:
+                mirrored = await _offline_copy(
+                    exc,
+                    notebook_client.mirror,
+                    lambda mirror: mirror.get_tree_level(notebook_id, folder_id or 0),
+                )
+                if mirrored is not None:
+                    return [
+                        {**item, "stale": True, "mirrored_at": mirrored.fetched_at_iso}
+                        for item in _tree_listing(mirrored.value)
+                    ]
                 logger.error(f"Failed to list notebook pages: {exc}", exc_info=True)
                 raise
 
+        @server.tool()  # type: ignore[misc]
+        async def list_all_notebook_pages(
+            notebook_id: str, folder_id: str | None = None
+        ) -> list[dict[str, Any]]:
+            """List every page in a LabArchives notebook, including pages inside folders.
+
+            Walks the whole folder tree (or the subtree under folder_id) in one call,
+            so there is no need to navigate folder by folder with list_notebook_pages.
+
+            Args:
+                notebook_id: The notebook ID (nbid) from list_labarchives_notebooks
+                folder_id: Optional tree_id of a folder to limit the listing to its subtree.
+                          If None, lists the whole notebook.
+
+            Returns:
+                List of pages, each with:
+                - tree_id: Page identifier (use as page_id with read_notebook_page)
+                - title: Page name
+                - path: Folder titles above the page, joined with "/" ("" at the top level)
+                - folder_id: tree_id of the folder containing the page ("0" at the root)
+            """
+            uid = await auth_manager.ensure_uid()
+            pages = await tree_crawler.list_pages(uid, notebook_id, folder_id or 0)
+            logger.info(f"Listed {len(pages)} pages in notebook {notebook_id}")
+            return [
+                {
+                    "tree_id": page["tree_id"],
+                    "title": page["display_text"],
+                    "path": "/".join(page["folder_path"]),
+                    "folder_id": page["parent_tree_id"],
+                }
+                for page in pages
+            ]
+
         @server.tool()  # type: ignore[misc]
         async def read_notebook_page(
             notebook_id: str,
@@ -281,20 +435,33 @@ async def run_server() -> None:
                   - content: The entry content (for text entries and headings)
                   - created_at: Creation timestamp
                   - updated_at: Last modification timestamp
+                - stale: True when LabArchives was unreachable and the entries come from
+                  the local mirror, as of "mirrored_at"
             """
             logger.info(
                 f"read_notebook_page called with notebook_id={notebook_id}, page_id={page_id}"
             )
 
             try:
-                uid = await auth_manager.ensure_uid()
-                logger.debug(f"Obtained UID: {uid[:20]}...")
+                mirrored_at: str | None = None
+                try:
+                    uid = await auth_manager.ensure_uid()
+                    logger.debug(f"Obtained UID: {uid[:20]}...")
 
-                logger.debug(f"Fetching entries for page {page_id} in notebook {notebook_id}")
+                    logger.debug(f"Fetching entries for page {page_id} in notebook {notebook_id}")
 
-                entries = await notebook_client.get_page_entries(
-                    uid, notebook_id, page_id, include_data=True
-                )
+                    entries = await notebook_client.get_page_entries(
+                        uid, notebook_id, page_id, include_data=True
+                    )
+                except Exception as exc:
+                    mirrored = await _offline_copy(
+                        exc,
+                        notebook_client.mirror,
+                        lambda mirror: mirror.get_page_entries(notebook_id, page_id),
+                    )
+                    if mirrored is None:
+                        raise
+                    entries, mirrored_at = mirrored.value, mirrored.fetched_at_iso
                 logger.info(f"Retrieved {len(entries)} entries from page")
 
                 for i, entry in enumerate(entries[:3]):  # Log first 3 entries
@@ -327,6 +494,8 @@ async def run_server() -> None:
                     "tracked_in_project": context.name if context else None,
                     "tracked": tracked,
                     "dry_run": dry_run,
+                    "stale": mirrored_at is not None,
+                    **({"mirrored_at": mirrored_at} if mirrored_at else {}),
                 }
 
             except Exception as exc:
@@ -356,132 +525,10 @@ async def run_server() -> None:
                 - date: Last modified date
                 - content: Full page text content (cleaned HTML)
             """
-            import os
-
-            import yaml  # type: ignore[import-untyped]
-
-            from vector_backend.config import load_config
-            from vector_backend.embedding import create_embedding_client
-            from vector_backend.index import PineconeIndex
-            from vector_backend.labarchives_indexer import clean_html
-            from vector_backend.models import SearchRequest
-
             logger.info(f"search_labarchives called: query='{query}', limit={limit}")
 
             try:
-                # Load secrets using same logic as Credentials.from_file()
-                from pathlib import Path
-
-                import aiofiles  # type: ignore[import-untyped]
-
-                env_path = os.environ.get("LABARCHIVES_CONFIG_PATH")
-                secrets_path = Path(env_path) if env_path else Path("conf/secrets.yml")
-
-                async with aiofiles.open(secrets_path) as f:
-                    content = await f.read()
-                    secrets = yaml.safe_load(content)
-
-                # Do not mutate process environment; pass keys via config/clients
-
-                # Load configuration
-                config = load_config("default")
-
-                # Create embedding client
-                embedding_client = create_embedding_client(config.embedding)
-
-                # Create Pinecone index
-                index = PineconeIndex(
-                    index_name="labarchives-test",
-                    api_key=secrets["PINECONE_API_KEY"],
-                    environment=secrets.get("PINECONE_ENVIRONMENT", "us-east-1"),
-                    namespace=None,
-                )
-
-                # Quick health check so we fail fast instead of hanging
-                healthy = await index.health_check()
-                if not healthy:
-                    raise RuntimeError(
-                        "Pinecone index not reachable. Check network, API key, or environment."
-                    )
-
-                # Generate query embedding
-                logger.debug("Generating query embedding...")
-                query_vector = await embedding_client.embed_single(query)
-
-                # Search for candidates (oversample to allow page-level dedup)
-                candidate_k = max(min(limit * 3, 100), limit)
-                search_request = SearchRequest(query=query, limit=candidate_k, filters=None)
-                results = await index.search(request=search_request, query_vector=query_vector)
-
-                if not results:
-                    logger.info("No results found")
-                    return []
-
-                logger.info(f"Found {len(results)} results")
-
-                # Deduplicate by page and enforce page-level limit
-                seen_pages: set[tuple[str, str]] = set()
-                unique_results: list[Any] = []
-                for r in results:
-                    key = (r.chunk.metadata.notebook_id, r.chunk.metadata.page_id)
-                    if key in seen_pages:
-                        continue
-                    seen_pages.add(key)
-                    unique_results.append(r)
-                    if len(unique_results) >= limit:
-                        break
-
-                # Fetch full page content for each unique result
-                uid = await auth_manager.ensure_uid()
-                output = []
-
-                for result in unique_results:
-                    chunk = result.chunk
-                    metadata = chunk.metadata
-
-                    # Fetch full page content
-                    try:
-                        entries = await notebook_client.get_page_entries(
-                            uid, metadata.notebook_id, metadata.page_id
-                        )
-
-                        # Combine all text entries
-                        full_text = []
-                        for entry in entries:
-                            entry_type = entry.get("part_type", "").lower().replace(" ", "_")
-                            content = entry.get("content", "")
-
-                            if entry_type == "text_entry" and content:
-                                cleaned = clean_html(content)
-                                if cleaned:
-                                    full_text.append(cleaned)
-                            elif entry_type in ["heading", "plain_text"] and content:
-                                full_text.append(content.strip())
-
-                        page_content = (
-                            "\n\n".join(full_text)
-                            if full_text
-                            else "(No text content on this page)"
-                        )
-
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch full page content: {e}")
-                        page_content = f"(Error fetching page: {e})"
-
-                    output.append(
-                        {
-                            "score": result.score,
-                            "notebook_name": metadata.notebook_name,
-                            "page_title": metadata.page_title,
-                            "page_id": metadata.page_id,
-                            "notebook_id": metadata.notebook_id,
-                            "url": metadata.labarchives_url,
-                            "author": metadata.author,
-                            "date": str(metadata.date),
-                            "content": page_content,
-                        }
-                    )
-
+                output = await search_service.search(query, limit)
                 logger.success(f"Successfully returned {len(output)} search results")
                 return output
 
@@ -509,7 +556,9 @@ async def run_server() -> None:
                 notebook_id: Optional notebook scope (reserved for future use)
 
             Returns:
-                Dictionary describing the action taken or planned.
+                Dictionary describing the action taken or planned. After an executed
+                sync it also holds `errors` (per-page and skipped-folder failures) and
+                `record_saved`; the build record is only refreshed when nothing failed.
             """
             from datetime import datetime
             from pathlib import Path
@@ -521,9 +570,10 @@ async def run_server() -> None:
                 save_build_record,
             )
             from vector_backend.config import load_config
-            from vector_backend.embedding import create_embedding_client
-            from vector_backend.index import PineconeIndex
-            from vector_backend.notebook_indexer import NotebookIndexer
+            from vector_backend.embedding import close_embedding_client, create_embedding_client
+            from vector_backend.index import create_vector_index
+            from vector_backend.local_index import LocalVectorIndex
+            from vector_backend.notebook_indexer import NotebookIndexer, create_process_pool
             from vector_backend.sync import plan_sync, select_incremental_entries
 
             # Load configuration and prior record
@@ -549,9 +599,12 @@ async def run_server() -> None:
             action = decision["action"]
             processed_pages = 0
             indexed_chunks = 0
+            errors: list[dict[str, str]] = []
 
-            # Instantiate clients fresh to allow test monkeypatching and avoid stale captures
-            async with httpx.AsyncClient(base_url=str(credentials.region)) as http_client:
+            # Instantiate clients fresh to allow test monkeypatching and avoid stale captures.
+            # They share the server's HTTP client, and so its throttle, at background
+            # priority: indexing only consumes capacity interactive tools leave unused.
+            with background_priority():
                 auth = AuthenticationManager(http_client, credentials)
                 uid = await auth.ensure_uid()
                 nb_client = LabArchivesClient(http_client, auth)
@@ -566,25 +619,6 @@ async def run_server() -> None:
                         else datetime.now()
                     )
 
-                # Helper: recursively collect page nodes
-                async def _collect_pages(nbid: str) -> list[dict[str, Any]]:
-                    pages: list[dict[str, Any]] = []
-
-                    async def _walk(parent: int | str = 0) -> None:
-                        parent_id: int | str = parent
-                        tree = await nb_client.get_notebook_tree(
-                            uid, nbid, parent_tree_id=parent_id
-                        )
-                        for node in tree:
-                            if node.get("is_page"):
-                                pages.append(node)
-                            elif node.get("is_folder"):
-                                next_parent = node.get("tree_id")
-                                await _walk(str(next_parent) if next_parent is not None else 0)
-
-                    await _walk(0)
-                    return pages
-
                 target_notebooks: list[str]
                 if notebook_id:
                     target_notebooks = [notebook_id]
@@ -597,66 +631,83 @@ async def run_server() -> None:
 
                 # Build embedding + index clients only if we have work to do
                 embed_client = create_embedding_client(config.embedding)
-                index_client = PineconeIndex(
-                    index_name=config.index.index_name,
-                    api_key=config.index.api_key or "",
-                    environment=config.index.environment or "us-east-1",
-                    namespace=config.index.namespace,
-                )
+                index_client = create_vector_index(config.index, config.embedding.version)
+                # Optional worker processes for HTML extraction + chunking
+                workers = config.indexing.process_workers
+                executor = create_process_pool(workers) if workers > 0 else None
                 indexer = NotebookIndexer(
                     embedding_client=embed_client,
                     vector_index=index_client,
                     embedding_version=config.embedding.version,
                     chunking_config=config.chunking,
+                    executor=executor,
                 )
 
                 # Use region URL for metadata links
                 base_url = str(credentials.region)
 
-                for nbid in target_notebooks:
-                    pages = await _collect_pages(nbid)
-                    # Best-effort name; real name lookup could call list_notebooks
-                    notebook_name = f"Notebook {nbid}"
-                    for node in pages:
-                        pid = str(node.get("tree_id"))
-                        title = node.get("display_text", "") or node.get("name", "") or pid
-                        try:
-                            entries = await nb_client.get_page_entries(uid, nbid, pid)
-                        except Exception as exc:  # pragma: no cover - network errors
-                            logger.warning(f"Failed to fetch entries for page {pid}: {exc}")
-                            continue
+                # Filter for incremental; full set for rebuild
+                entry_filter = (
+                    functools.partial(select_incremental_entries, built_after=built_at_dt)
+                    if built_at_dt
+                    else None
+                )
 
-                        # Filter for incremental; full set for rebuild
-                        selected_entries = (
-                            select_incremental_entries(entries, built_at_dt)
-                            if built_at_dt
-                            else entries
-                        )
-                        if not selected_entries:
-                            continue
+                crawler = NotebookTreeCrawler(
+                    nb_client, concurrency=config.indexing.crawl_concurrency
+                )
 
-                        page_data = {
+                def folder_failed(nbid: str, folder: int | str, exc: Exception) -> None:
+                    # A skipped subfolder leaves the build incomplete, like a failed page
+                    errors.append(
+                        {
                             "notebook_id": nbid,
-                            "notebook_name": notebook_name,
-                            "page_id": pid,
-                            "page_title": title,
-                            "entries": selected_entries,
+                            "stage": "crawl",
+                            "page_id": str(folder),
+                            "error": str(exc),
                         }
-                        res = await indexer.index_page(
-                            page_data=page_data,
-                            author="unknown@example.com",
+                    )
+
+                try:
+                    for nbid in target_notebooks:
+                        # Best-effort name; real name lookup could call list_notebooks
+                        stats = await indexer.index_notebook(
+                            nb_client,
+                            uid,
+                            nbid,
                             labarchives_url=base_url,
+                            pages=crawler.iter_pages(
+                                uid, nbid, on_folder_error=functools.partial(folder_failed, nbid)
+                            ),
+                            notebook_name=f"Notebook {nbid}",
+                            entry_filter=entry_filter,
+                            settings=config.indexing,
                         )
-                        processed_pages += 1
-                        indexed_chunks += int(res.get("indexed_count", 0))
-
-            # Save/refresh build record for both incremental and rebuild
-            with contextlib.suppress(Exception):
+                        processed_pages += int(stats["pages_processed"])
+                        indexed_chunks += int(stats["indexed_count"])
+                        errors.extend({"notebook_id": nbid, **err} for err in stats["errors"])
+                    if isinstance(index_client, LocalVectorIndex):
+                        # Write buffered upserts back to the Parquet files
+                        await index_client.compact()
+                finally:
+                    await close_embedding_client(embed_client)
+                    if executor is not None:
+                        await asyncio.to_thread(executor.shutdown)
+
+            # Save/refresh build record for both incremental and rebuild, unless pages
+            # failed: a newer record would make later incremental syncs skip them for good
+            if errors:
+                logger.warning(
+                    f"sync_vector_index: {len(errors)} page(s) failed; build record not updated"
+                )
+            else:
                 save_build_record(record_path, build_record_from_config(config))
             return {
                 **decision,
                 "processed_pages": processed_pages,
                 "indexed_chunks": indexed_chunks,
+                "errors": errors,
+                "record_saved": not errors,
             }
 
         # Conditionally register upload tool based on environment variable
@@ -679,6 +730,7 @@ async def run_server() -> None:
                 allow_dirty_git: bool = False,
                 dependencies: dict[str, str] | None = None,
                 as_page_text: bool = True,
+                force: bool = False,
             ) -> dict[str, Any]:
                 """Upload a file to LabArchives with code provenance metadata.
 
@@ -686,6 +738,10 @@ async def run_server() -> None:
                 page text (default, Markdown → HTML) or uploads the file as an attachment, and
                 adds metadata about code version, execution context, and dependencies.
 
+                If identical content (same SHA-256) was already uploaded to the same notebook
+                folder, the existing page is returned instead (deduplicated=True) unless
+                force=True.
+
                 Args:
                     notebook_id: LabArchives notebook ID
                     page_title: Title for the new page
@@ -701,6 +757,8 @@ async def run_server() -> None:
                     allow_dirty_git: Allow upload despite dirty Git (not recommended)
                     dependencies: Key package versions (e.g., {"numpy": "1.26.0"})
                     as_page_text: If True, store file contents as page text instead of attachment
+                    force: Upload even if identical content was already uploaded to the same
+                        folder with the same page title and as_page_text setting
 
                 Returns:
                     Dictionary with:
@@ -710,11 +768,12 @@ async def run_server() -> None:
                     - created_at: Upload timestamp
                     - file_size_bytes: File size
                     - filename: Uploaded filename
+                    - sha256: SHA-256 digest of the uploaded content
+                    - deduplicated: True when an existing upload was returned
                 """
-                from datetime import datetime
                 from pathlib import Path
 
-                from labarchives_mcp.models.upload import ProvenanceMetadata, UploadRequest
+                from labarchives_mcp.models.upload import UploadRequest
 
                 logger.info(
                     f"upload_to_labarchives called: file={file_path}, "
@@ -730,23 +789,15 @@ async def run_server() -> None:
                     if not await asyncio.to_thread(file_path_obj.exists):
                         raise FileNotFoundError(f"File not found: {file_path}")
 
-                    # Parse execution timestamp
-                    executed_at_dt = datetime.fromisoformat(executed_at.replace("Z", "+00:00"))
-
                     # Build metadata
-                    import platform
-
-                    metadata = ProvenanceMetadata(
+                    metadata = _provenance_metadata(
                         git_commit_sha=git_commit_sha,
                         git_branch=git_branch,
                         git_repo_url=git_repo_url,
                         git_is_dirty=git_is_dirty,
-                        code_version=__version__,
-                        executed_at=executed_at_dt,
                         python_version=python_version,
-                        dependencies=dependencies or {},
-                        os_name=platform.system(),
-                        hostname=platform.node(),
+                        executed_at=executed_at,
+                        dependencies=dependencies,
                     )
 
                     # Build upload request
@@ -762,8 +813,29 @@ async def run_server() -> None:
                         create_as_text=as_page_text,
                     )
 
-                    # Execute upload
-                    result = await notebook_client.upload_to_labarchives(uid, upload_request)
+                    if not force:
+                        content_hash = await asyncio.to_thread(file_sha256, file_path_obj)
+                        existing = state_manager.find_upload(
+                            sha256=content_hash,
+                            notebook_id=notebook_id,
+                            parent_folder_id=parent_folder_id,
+                            page_title=page_title,
+                            as_page_text=as_page_text,
+                        )
+                        if existing is not None:
+                            logger.info(
+                                f"Skipping upload of {file_path_obj.name}: identical content "
+                                f"already on page {existing.get('page_id')}"
+                            )
+                            return _deduplicated_upload(existing)
+
+                    # Execute upload (streamed from disk, reporting progress to the client)
+                    result = await notebook_client.upload_to_labarchives(
+                        uid,
+                        upload_request,
+                        progress=_mcp_progress_reporter(file_path_obj.name),
+                    )
+                    tree_crawler.invalidate(notebook_id)
                     state_manager.record_upload_provenance(
                         uid=uid,
                         notebook_id=notebook_id,
@@ -778,6 +850,8 @@ async def run_server() -> None:
                         metadata=metadata,
                         server_version=__version__,
                         as_page_text=as_page_text,
+                        sha256=result.sha256,
+                        parent_folder_id=parent_folder_id,
                     )
                     logger.success(
                         f"Successfully uploaded {result.filename} to page {result.page_tree_id}"
@@ -790,12 +864,187 @@ async def run_server() -> None:
                         "created_at": result.created_at.isoformat(),
                         "file_size_bytes": result.file_size_bytes,
                         "filename": result.filename,
+                        "sha256": result.sha256,
+                        "deduplicated": False,
                     }
 
                 except Exception as exc:
                     logger.error(f"Failed to upload to LabArchives: {exc}", exc_info=True)
                     raise
 
+            @server.tool()  # type: ignore[misc]
+            async def upload_files_to_labarchives(
+                notebook_id: str,
+                source: str,
+                git_commit_sha: str,
+                git_branch: str,
+                git_repo_url: str,
+                python_version: str,
+                executed_at: str,
+                parent_folder_id: str | None = None,
+                caption: str | None = None,
+                git_is_dirty: bool = False,
+                allow_dirty_git: bool = False,
+                dependencies: dict[str, str] | None = None,
+                as_page_text: bool = False,
+                max_concurrency: int = 4,
+                force: bool = False,
+            ) -> dict[str, Any]:
+                """Upload every file in a directory or matching a glob, one page per file.
+
+                Files are uploaded concurrently (up to max_concurrency at a time), each to
+                a new page titled with its file name and carrying the same provenance
+                metadata. Failures are reported per file and do not stop the batch.
+                Files whose content was already uploaded to the same notebook folder under
+                the same name and as_page_text setting (or that repeat another file of the
+                same name in the batch) are not uploaded again unless force=True; their
+                results point at the existing page.
+
+                Args:
+                    notebook_id: LabArchives notebook ID
+                    source: Directory (its top-level files) or glob such as "figures/*.png"
+                        ("**" matches recursively)
+                    git_commit_sha: Full 40-character Git commit SHA
+                    git_branch: Git branch name (e.g., "main")
+                    git_repo_url: Git repository URL
+                    python_version: Python version (e.g., "3.11.8")
+                    executed_at: Execution timestamp (ISO 8601, e.g., "2025-09-30T12:00:00Z")
+                    parent_folder_id: Optional folder tree_id to upload into
+                    caption: Optional caption applied to every file
+                    git_is_dirty: True if uncommitted changes exist
+                    allow_dirty_git: Allow upload despite dirty Git (not recommended)
+                    dependencies: Key package versions (e.g., {"numpy": "1.26.0"})
+                    as_page_text: Store contents as page text instead of attachments
+                    max_concurrency: Maximum number of files uploaded at once
+                    force: Upload even if identical files were already uploaded
+
+                Returns:
+                    Dictionary with uploaded/deduplicated/failed counts and per-file results
+                    (status, page_tree_id, entry_id, page_url, file_size_bytes, sha256; error
+                    on failure)
+                """
+                from pathlib import Path
+
+                logger.info(
+                    f"upload_files_to_labarchives called: source={source}, "
+                    f"notebook={notebook_id}"
+                )
+                uid = await auth_manager.ensure_uid()
+                metadata = _provenance_metadata(
+                    git_commit_sha=git_commit_sha,
+                    git_branch=git_branch,
+                    git_repo_url=git_repo_url,
+                    git_is_dirty=git_is_dirty,
+                    python_version=python_version,
+                    executed_at=executed_at,
+                    dependencies=dependencies,
+                )
+
+                paths = await asyncio.to_thread(expand_upload_paths, source)
+                existing: dict[Path, dict[str, Any]] = {}
+                # Later copies of content that appears more than once in this batch
+                same_as: dict[Path, Path] = {}
+                to_upload = paths
+                if not force:
+                    hashes = await asyncio.gather(
+                        *(asyncio.to_thread(file_sha256, path) for path in paths)
+                    )
+                    # Each file becomes a page titled with its name
+                    first_with_key: dict[tuple[str, str], Path] = {}
+                    to_upload = []
+                    for path, content_hash in zip(paths, hashes, strict=True):
+                        found = state_manager.find_upload(
+                            sha256=content_hash,
+                            notebook_id=notebook_id,
+                            parent_folder_id=parent_folder_id,
+                            page_title=path.name,
+                            as_page_text=as_page_text,
+                        )
+                        key = (content_hash, path.name)
+                        if found is not None:
+                            existing[path] = found
+                        elif key in first_with_key:
+                            same_as[path] = first_with_key[key]
+                        else:
+                            first_with_key[key] = path
+                            to_upload.append(path)
+
+                items = await notebook_client.upload_files(
+                    uid,
+                    to_upload,
+                    notebook_id=notebook_id,
+                    parent_folder_id=parent_folder_id,
+                    metadata=metadata,
+                    allow_dirty_git=allow_dirty_git,
+                    create_as_text=as_page_text,
+                    caption=caption,
+                    max_concurrency=max_concurrency,
+                    progress=_mcp_progress_reporter(source),
+                )
+                if items:
+                    tree_crawler.invalidate(notebook_id)
+
+                # One graph rebuild and state save for the whole batch
+                state_manager.record_upload_provenance_batch(
+                    [
+                        {
+                            "uid": uid,
+                            "notebook_id": notebook_id,
+                            "page_title": item.file_path.name,
+                            "file_path": item.file_path,
+                            "page_tree_id": item.response.page_tree_id,
+                            "entry_id": item.response.entry_id,
+                            "page_url": item.response.page_url,
+                            "created_at": item.response.created_at,
+                            "file_size_bytes": item.response.file_size_bytes,
+                            "filename": item.response.filename,
+                            "metadata": metadata,
+                            "server_version": __version__,
+                            "as_page_text": as_page_text,
+                            "sha256": item.response.sha256,
+                            "parent_folder_id": parent_folder_id,
+                        }
+                        for item in items
+                        if item.response is not None
+                    ]
+                )
+
+                by_path = {item.file_path: item for item in items}
+                results: list[dict[str, Any]] = []
+                for path in paths:
+                    if path in existing:
+                        results.append(
+                            {
+                                "file_path": str(path),
+                                "status": "deduplicated",
+                                **_deduplicated_upload(existing[path]),
+                            }
+                        )
+                        continue
+                    item = by_path[same_as.get(path, path)]
+                    if item.response is None:
+                        results.append(
+                            {"file_path": str(path), "status": "failed", "error": item.error}
+                        )
+                        continue
+                    results.append(
+                        {
+                            "file_path": str(path),
+                            "status": "deduplicated" if path in same_as else "uploaded",
+                            "page_tree_id": item.response.page_tree_id,
+                            "entry_id": item.response.entry_id,
+                            "page_url": item.response.page_url,
+                            "file_size_bytes": item.response.file_size_bytes,
+                            "sha256": item.response.sha256,
+                            "deduplicated": path in same_as,
+                        }
+                    )
+
+                counts = {"uploaded": 0, "deduplicated": 0, "failed": 0}
+                for result in results:
+                    counts[result["status"]] += 1
+                return {"notebook_id": notebook_id, **counts, "results": results}
+
             @server.tool()  # type: ignore[misc]
             async def write_notebook_entry(
                 notebook_id: str,
@@ -859,6 +1108,7 @@ async def run_server() -> None:
                             is_folder=False,
                         )
                         page_result = await notebook_client.insert_node(uid, page_request)
+                        tree_crawler.invalidate(notebook_id)
                         page_tree_id = page_result.tree_id
 
                     normalized_format = content_format.strip().lower()
@@ -1311,7 +1561,9 @@ async def run_server() -> None:
             service = onboard.OnboardService(
                 auth_manager=auth_manager, notebook_client=notebook_client, version=__version__
             )
-            payload = await service.get_payload()
+            # Onboarding walks every notebook; keep it out of interactive calls' way
+            with background_priority():
+                payload = await service.get_payload()
             if format.lower() == "markdown":
                 return payload.markdown
             return payload.model_dump()
@@ -1330,17 +1582,31 @@ async def run_server() -> None:
                 except Exception:
                     return False
 
-            stats = await state_manager.validate_graph(
-                _check_page, max_checks=10, include_all_contexts=True
-            )
+            with background_priority():
+                stats = await state_manager.validate_graph(
+                    _check_page, max_checks=10, include_all_contexts=True
+                )
             if stats.get("removed_nodes", 0) > 0:
                 logger.warning(f"Graph validation pruned invalid elements: {stats}")
             else:
                 logger.info("Graph validation passed (no invalid nodes found).")
 
-        asyncio.create_task(_validate_graph_task())
+        # Warm search clients off the request path so the first query is fast too
+        async def _warm_search_task() -> None:
+            try:
+                await search_service.warm_up()
+            except Exception as exc:
+                logger.warning(f"Search warm-up failed; retrying on first query: {exc}")
 
-        await server.run_async()
+        asyncio.create_task(_validate_graph_task())
+        asyncio.create_task(_warm_search_task())
+
+        try:
+            await server.run_async()
+        finally:
+            await search_service.aclose()
+            if notebook_client.mirror is not None:
+                await asyncio.to_thread(notebook_client.mirror.close)
 
 
 def run(main: Callable[[], Coroutine[Any, Any, None]] | None = None) -> None:
@@ -0,0 +1,309 @@
+"""Optional local SQLite mirror of LabArchives notebooks.
+
+`NotebookMirror` keeps the tree levels and page entries that `LabArchivesClient`
+fetches, keyed by notebook, tree node and entry, each with the time it was fetched
+(and the entry's own `updated_at`). The client reads through it while a copy is
+younger than `max_age_seconds` and writes every fresh fetch back, so warm reads are
+local disk lookups. The methods are synchronous; async callers run them in a worker
+thread (`asyncio.to_thread`) so SQLite I/O never blocks the event loop. Copies of
+any age remain available for offline fallback when LabArchives cannot be reached.
+
+The mirror is enabled by setting `LABARCHIVES_MIRROR_PATH` (see `from_env`) and
+populated in bulk with `labarchives-mcp mirror-sync`.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import httpx
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tree_levels (
+    nbid TEXT NOT NULL,
+    parent_tree_id TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expired INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (nbid, parent_tree_id)
+);
+CREATE TABLE IF NOT EXISTS tree_nodes (
+    nbid TEXT NOT NULL,
+    parent_tree_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    tree_id TEXT,
+    display_text TEXT,
+    is_page INTEGER NOT NULL,
+    PRIMARY KEY (nbid, parent_tree_id, position)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    nbid TEXT NOT NULL,
+    page_tree_id TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expired INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (nbid, page_tree_id)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    nbid TEXT NOT NULL,
+    page_tree_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    eid TEXT,
+    part_type TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    content TEXT,
+    PRIMARY KEY (nbid, page_tree_id, position)
+);
+"""
+
+
+class MirroredValue(NamedTuple):
+    """A value read from the mirror and the Unix time it was fetched from LabArchives."""
+
+    value: list[dict[str, Any]]
+    fetched_at: float
+
+    @property
+    def fetched_at_iso(self) -> str:
+        """`fetched_at` as an ISO 8601 UTC timestamp."""
+        return datetime.fromtimestamp(self.fetched_at, UTC).isoformat()
+
+
+def is_offline_error(exc: BaseException) -> bool:
+    """Return True if `exc` means LabArchives could not be reached or is failing.
+
+    Transport errors (DNS, connection, timeouts) and 5xx statuses qualify; faults
+    returned by LabArchives (bad ids, missing rights) do not.
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+
+
+class NotebookMirror:
+    """SQLite store of notebook tree levels and page entries.
+
+    Only pages read with `include_data=True` are stored; reads without data are
+    served from them by dropping the content. Writes made through the client mark
+    the touched page or level as expired rather than deleting it, so it is
+    refetched on the next read but still available offline.
+
+    Attributes:
+        path: SQLite database file
+        max_age_seconds: Age below which reads are served without calling the API
+            (0 makes the mirror write-only apart from offline fallback)
+        hits: Reads served from the mirror
+        misses: Reads that found no fresh copy
+    """
+
+    def __init__(self, path: str | Path, *, max_age_seconds: float = 300.0) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> NotebookMirror | None:
+        """Open the mirror named by `LABARCHIVES_MIRROR_PATH`, or return None if unset.
+
+        `LABARCHIVES_MIRROR_MAX_AGE_SECONDS` (default 300) sets `max_age_seconds`.
+        """
+        path = os.environ.get("LABARCHIVES_MIRROR_PATH")
+        if not path:
+            return None
+        max_age = float(os.environ.get("LABARCHIVES_MIRROR_MAX_AGE_SECONDS", "300"))
+        return cls(path, max_age_seconds=max_age)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _is_fresh(fetched_at: float, expired: int, max_age: float | None) -> bool:
+        return max_age is None or (not expired and time.time() - fetched_at < max_age)
+
+    def _count(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def get_tree_level(
+        self, nbid: str, parent_tree_id: int | str, *, max_age: float | None = None
+    ) -> MirroredValue | None:
+        """Return a mirrored tree level no older than `max_age` seconds (None: any age)."""
+        parent = str(parent_tree_id)
+        with self._lock:
+            level = self._conn.execute(
+                "SELECT fetched_at, expired FROM tree_levels WHERE nbid = ? AND parent_tree_id = ?",
+                (nbid, parent),
+            ).fetchone()
+            if level is None or not self._is_fresh(level[0], level[1], max_age):
+                self._count(False)
+                return None
+            rows = self._conn.execute(
+                "SELECT tree_id, display_text, is_page FROM tree_nodes "
+                "WHERE nbid = ? AND parent_tree_id = ? ORDER BY position",
+                (nbid, parent),
+            ).fetchall()
+        self._count(True)
+        nodes = [
+            {
+                "tree_id": tree_id,
+                "display_text": display_text,
+                "is_page": bool(is_page),
+                "is_folder": not is_page,
+            }
+            for tree_id, display_text, is_page in rows
+        ]
+        return MirroredValue(nodes, level[0])
+
+    def put_tree_level(
+        self, nbid: str, parent_tree_id: int | str, nodes: list[dict[str, Any]]
+    ) -> None:
+        """Replace a tree level with freshly fetched nodes."""
+        parent = str(parent_tree_id)
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM tree_nodes WHERE nbid = ? AND parent_tree_id = ?", (nbid, parent)
+            )
+            conn.executemany(
+                "INSERT INTO tree_nodes VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        nbid,
+                        parent,
+                        i,
+                        node.get("tree_id"),
+                        node.get("display_text"),
+                        node["is_page"],
+                    )
+                    for i, node in enumerate(nodes)
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO tree_levels VALUES (?, ?, ?, 0)",
+                (nbid, parent, time.time()),
+            )
+
+    def get_page_entries(
+        self,
+        nbid: str,
+        page_tree_id: int | str,
+        *,
+        include_data: bool = True,
+        max_age: float | None = None,
+    ) -> MirroredValue | None:
+        """Return a mirrored page no older than `max_age` seconds (None: any age)."""
+        page = str(page_tree_id)
+        with self._lock:
+            stored = self._conn.execute(
+                "SELECT fetched_at, expired FROM pages WHERE nbid = ? AND page_tree_id = ?",
+                (nbid, page),
+            ).fetchone()
+            if stored is None or not self._is_fresh(stored[0], stored[1], max_age):
+                self._count(False)
+                return None
+            rows = self._conn.execute(
+                "SELECT eid, part_type, created_at, updated_at, content FROM entries "
+                "WHERE nbid = ? AND page_tree_id = ? ORDER BY position",
+                (nbid, page),
+            ).fetchall()
+        self._count(True)
+        entries: list[dict[str, Any]] = []
+        for eid, part_type, created_at, updated_at, content in rows:
+            entry: dict[str, Any] = {
+                "eid": eid,
+                "part_type": part_type,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+            if include_data and content is not None:
+                entry["content"] = content
+            entries.append(entry)
+        return MirroredValue(entries, stored[0])
+
+    def put_page_entries(
+        self, nbid: str, page_tree_id: int | str, entries: list[dict[str, Any]]
+    ) -> None:
+        """Replace a page with freshly fetched entries (read with `include_data=True`)."""
+        page = str(page_tree_id)
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entries WHERE nbid = ? AND page_tree_id = ?", (nbid, page))
+            conn.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        nbid,
+                        page,
+                        i,
+                        entry.get("eid"),
+                        entry.get("part_type"),
+                        entry.get("created_at"),
+                        entry.get("updated_at"),
+                        entry.get("content"),
+                    )
+                    for i, entry in enumerate(entries)
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, 0)", (nbid, page, time.time())
+            )
+
+    def expire_tree_level(self, nbid: str, parent_tree_id: int | str) -> None:
+        """Force the next read of a tree level to refetch it (the copy is kept)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE tree_levels SET expired = 1 WHERE nbid = ? AND parent_tree_id = ?",
+                (nbid, str(parent_tree_id)),
+            )
+
+    def expire_page(self, nbid: str, page_tree_id: int | str) -> None:
+        """Force the next read of a page to refetch it (the copy is kept)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE pages SET expired = 1 WHERE nbid = ? AND page_tree_id = ?",
+                (nbid, str(page_tree_id)),
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Return row counts and hit counters."""
+        with self._lock:
+            levels, pages, entries = (
+                self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608
+                for table in ("tree_levels", "pages", "entries")
+            )
+        return {
+            "path": str(self.path),
+            "max_age_seconds": self.max_age_seconds,
+            "tree_levels": levels,
+            "pages": pages,
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -212,6 +212,7 @@ class AttachmentUploadResult(BaseModel):
         caption: Attachment caption
         created_at: Creation timestamp
         file_size_bytes: Size of uploaded file
+        sha256: Hex SHA-256 digest of the bytes sent, when the upload was streamed
     """
 
     eid: str = Field(..., description="Entry ID")
@@ -220,6 +221,7 @@ class AttachmentUploadResult(BaseModel):
     caption: str | None = None
     created_at: datetime
     file_size_bytes: int = Field(..., ge=0)
+    sha256: str | None = Field(None, description="SHA-256 of the uploaded content")
 
 
 class UploadResponse(BaseModel):
@@ -232,6 +234,7 @@ class UploadResponse(BaseModel):
         created_at: Timestamp of upload
         file_size_bytes: Size of uploaded file
         filename: Name of uploaded file
+        sha256: Hex SHA-256 digest of the uploaded content
     """
 
     page_tree_id: str = Field(..., description="Created page tree_id")
@@ -240,6 +243,7 @@ class UploadResponse(BaseModel):
     created_at: datetime
     file_size_bytes: int = Field(..., ge=0)
     filename: str
+    sha256: str | None = Field(None, description="SHA-256 of the uploaded content")
 
 
 class UploadError(BaseModel):
@@ -254,3 +258,22 @@ class UploadError(BaseModel):
     error_code: str = Field(..., description="ERROR_FILE_NOT_FOUND, ERROR_PERMISSION, etc")
     message: str
     details: dict[str, str] = Field(default_factory=dict)
+
+
+class BatchUploadItem(BaseModel):
+    """Outcome of one file in a batch upload.
+
+    Attributes:
+        file_path: Local file the item refers to
+        response: Upload result, when the file was uploaded
+        error: Error message, when the upload of this file failed
+    """
+
+    file_path: Path
+    response: UploadResponse | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the file was uploaded."""
+        return self.response is not None
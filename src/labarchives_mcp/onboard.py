@@ -148,6 +148,7 @@ class OnboardService:
                 "suggest_next_steps": "Get lightweight guidance from the current project state.",
                 "list_notebooks": "Enumerate notebooks available to the authenticated user.",
                 "list_notebook_pages": "Browse notebook structure to locate pages.",
+                "list_all_notebook_pages": "List every page in a notebook with its folder path.",
                 "read_notebook_page": "Retrieve full structured content for a given page.",
             },
             decision_aid="Start with `search_labarchives`—it searches all notebooks.",
@@ -0,0 +1,270 @@
+"""Long-lived semantic search service backing the `search_labarchives` tool."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from labarchives_mcp.auth import AuthenticationManager
+from labarchives_mcp.eln_client import LabArchivesClient
+
+if TYPE_CHECKING:
+    from vector_backend.config import VectorSearchConfig
+    from vector_backend.embedding import EmbeddingClient
+    from vector_backend.index import VectorIndex
+    from vector_backend.models import SearchResult
+
+
+class SearchService:
+    """Hold warm vector-search clients for the lifetime of one MCP server.
+
+    Secrets, Hydra configuration, the embedding client and the vector index are
+    resolved once (lazily, on first use or via `warm_up()`) and then reused, so a
+    query only pays for embed + query + hydrate. Once warm, a background task
+    re-checks index health every `health_ttl_seconds`, so queries never wait on it.
+    Result pages are hydrated concurrently, at most `hydration_concurrency` at a time.
+    """
+
+    def __init__(
+        self,
+        auth_manager: AuthenticationManager,
+        notebook_client: LabArchivesClient,
+        *,
+        config_name: str = "default",
+        health_ttl_seconds: float = 60.0,
+        hydration_concurrency: int = 5,
+    ) -> None:
+        self._auth_manager = auth_manager
+        self._notebook_client = notebook_client
+        self._config_name = config_name
+        self._health_ttl_seconds = health_ttl_seconds
+        self._hydration_concurrency = max(1, hydration_concurrency)
+
+        self._config: VectorSearchConfig | None = None
+        self._embedding_client: EmbeddingClient | None = None
+        self._index: VectorIndex | None = None
+        self._healthy: bool | None = None
+        self._health_task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_warm(self) -> bool:
+        """Return True once clients and configuration have been initialised."""
+        return self._index is not None and self._embedding_client is not None
+
+    @property
+    def healthy(self) -> bool | None:
+        """Return the last observed index health (None until first checked)."""
+        return self._healthy
+
+    async def warm_up(self) -> None:
+        """Resolve secrets, configuration and clients if not done already."""
+        async with self._lock:
+            if self.is_warm:
+                return
+
+            from vector_backend.config import load_config
+            from vector_backend.embedding import create_embedding_client
+            from vector_backend.index import PineconeIndex, create_vector_index
+
+            secrets = await self._load_secrets()
+            config = await asyncio.to_thread(load_config, self._config_name)
+
+            embedding_client = create_embedding_client(config.embedding)
+            index: VectorIndex
+            if config.index.backend == "local":
+                # Air-gapped: search the Parquet files written by LocalPersistence
+                index = create_vector_index(config.index, config.embedding.version)
+            else:
+                index = PineconeIndex(
+                    index_name="labarchives-test",
+                    api_key=secrets["PINECONE_API_KEY"],
+                    environment=secrets.get("PINECONE_ENVIRONMENT", "us-east-1"),
+                    namespace=None,
+                )
+
+            self._config = config
+            self._embedding_client = embedding_client
+            self._index = index
+            await self._refresh_health()
+            self._health_task = asyncio.create_task(self._monitor_health())
+            logger.info("Search service warmed up")
+
+    async def search(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
+        """Embed the query, search the index and hydrate unique pages.
+
+        Args:
+            query: Natural language search query
+            limit: Maximum number of unique pages to return
+
+        Returns:
+            List of result dictionaries (see `search_labarchives` for the schema)
+        """
+        from vector_backend.models import SearchRequest
+
+        if not self.is_warm:
+            await self.warm_up()
+        await self._ensure_healthy()
+        assert self._embedding_client is not None and self._index is not None
+
+        # Generate query embedding
+        logger.debug("Generating query embedding...")
+        query_vector = await self._embedding_client.embed_single(query)
+
+        # Search for candidates (oversample to allow page-level dedup)
+        candidate_k = max(min(limit * 3, 100), limit)
+        search_request = SearchRequest(query=query, limit=candidate_k, filters=None)
+        results = await self._index.search(request=search_request, query_vector=query_vector)
+
+        if not results:
+            logger.info("No results found")
+            return []
+
+        logger.info(f"Found {len(results)} results")
+
+        unique_results = self._dedupe_pages(results, limit)
+        uid = await self._auth_manager.ensure_uid()
+
+        page_contents = await self._hydrate_pages(uid, unique_results)
+
+        output = []
+        for result, page_content in zip(unique_results, page_contents, strict=True):
+            metadata = result.chunk.metadata
+            output.append(
+                {
+                    "score": result.score,
+                    "notebook_name": metadata.notebook_name,
+                    "page_title": metadata.page_title,
+                    "page_id": metadata.page_id,
+                    "notebook_id": metadata.notebook_id,
+                    "url": metadata.labarchives_url,
+                    "author": metadata.author,
+                    "date": str(metadata.date),
+                    "content": page_content,
+                }
+            )
+
+        return output
+
+    async def aclose(self) -> None:
+        """Stop the periodic health check and close the embedding client."""
+        task = self._health_task
+        self._health_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+        embedding_client = self._embedding_client
+        self._embedding_client = None
+        if embedding_client is not None:
+            from vector_backend.embedding import close_embedding_client
+
+            await close_embedding_client(embedding_client)
+
+    async def _load_secrets(self) -> dict[str, Any]:
+        """Load secrets using the same location logic as `Credentials.from_file()`."""
+        import aiofiles  # type: ignore[import-untyped]
+        import yaml  # type: ignore[import-untyped]
+
+        env_path = os.environ.get("LABARCHIVES_CONFIG_PATH")
+        secrets_path = Path(env_path) if env_path else Path("conf/secrets.yml")
+
+        async with aiofiles.open(secrets_path) as f:
+            content = await f.read()
+
+        secrets = yaml.safe_load(content)
+        return dict(secrets or {})
+
+    async def _ensure_healthy(self) -> None:
+        """Fail fast on a known-bad index, re-checking inline so recovery is immediate."""
+        if self._healthy is False and not await self._refresh_health():
+            raise RuntimeError(
+                "Vector index not reachable. Check network, API key, or environment."
+            )
+
+    async def _monitor_health(self) -> None:
+        """Refresh index health every `health_ttl_seconds` until cancelled."""
+        while True:
+            await asyncio.sleep(self._health_ttl_seconds)
+            await self._refresh_health()
+
+    async def _refresh_health(self) -> bool:
+        assert self._index is not None
+        try:
+            healthy = await self._index.health_check()
+        except Exception as exc:  # noqa: BLE001 - treat any failure as unhealthy
+            logger.warning(f"Vector index health check failed: {exc}")
+            healthy = False
+
+        if healthy != self._healthy:
+            logger.info(f"Vector index health changed: {self._healthy} -> {healthy}")
+        self._healthy = healthy
+        return healthy
+
+    @staticmethod
+    def _dedupe_pages(results: list[SearchResult], limit: int) -> list[SearchResult]:
+        """Keep the best-scoring hit per page, up to `limit` pages."""
+        seen_pages: set[tuple[str, str]] = set()
+        unique_results: list[SearchResult] = []
+        for r in results:
+            key = (r.chunk.metadata.notebook_id, r.chunk.metadata.page_id)
+            if key in seen_pages:
+                continue
+            seen_pages.add(key)
+            unique_results.append(r)
+            if len(unique_results) >= limit:
+                break
+        return unique_results
+
+    async def _hydrate_pages(self, uid: str, results: list[SearchResult]) -> list[str]:
+        """Fetch page text for every hit concurrently, bounded and order-preserving."""
+        semaphore = asyncio.Semaphore(self._hydration_concurrency)
+
+        async def _bounded(result: SearchResult) -> str:
+            async with semaphore:
+                return await self._hydrate_page(uid, result)
+
+        return list(await asyncio.gather(*(_bounded(result) for result in results)))
+
+    async def _hydrate_page(self, uid: str, result: SearchResult) -> str:
+        """Fetch the full page text for a search hit; errors stay local to the page."""
+        metadata = result.chunk.metadata
+        try:
+            # Clean each entry while the rest of the page is still downloading
+            texts: list[str] = []
+            async for entry in self._notebook_client.iter_page_entries(
+                uid, metadata.notebook_id, metadata.page_id
+            ):
+                if entry.get("content"):
+                    text = await asyncio.to_thread(_entry_text, entry)
+                    if text:
+                        texts.append(text)
+            return _join_texts(texts)
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch full page content: {e}")
+            return f"(Error fetching page: {e})"
+
+
+def _entry_text(entry: dict[str, Any]) -> str:
+    """Return the cleaned plain text of one entry ("" for entries without text)."""
+    from vector_backend.labarchives_indexer import clean_html
+
+    entry_type = (entry.get("part_type") or "").lower().replace(" ", "_")
+    content = entry.get("content", "")
+
+    if entry_type == "text_entry" and content:
+        return str(clean_html(content) or "")
+    if entry_type in ["heading", "plain_text"] and content:
+        return str(content.strip())
+    return ""
+
+
+def _join_texts(texts: list[str]) -> str:
+    return "\n\n".join(texts) if texts else "(No text content on this page)"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import time
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
 
 
 GRAPH_SCHEMA_VERSION = 2
+# (sha256, notebook_id, folder, page_title, entry_kind) of a recorded upload
+UploadKey = tuple[str, str, str, str, str]
 
 
 class Finding(BaseModel):
@@ -80,6 +83,8 @@ class StateManager:
         self.storage_dir = Path(storage_dir)
         self.state_file = self.storage_dir / "session_state.json"
         self._state: SessionState = self._load_state()
+        # UploadKey -> artifact attributes; rebuilt after each save
+        self._upload_index: dict[UploadKey, dict[str, Any]] | None = None
 
     def _load_state(self) -> SessionState:
         """Load state from disk or create fresh."""
@@ -107,6 +112,7 @@ class StateManager:
 
     def _save_state(self) -> None:
         """Persist current state to disk using atomic write pattern."""
+        self._upload_index = None
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         # Write to temp file first
@@ -284,148 +290,275 @@ class StateManager:
         metadata: ProvenanceMetadata,
         server_version: str,
         as_page_text: bool,
+        sha256: str | None = None,
+        parent_folder_id: str | None = None,
     ) -> None:
-        """Record a successful upload as a provenance subgraph on the active project."""
+        """Record a successful upload as a provenance subgraph on the active project.
+
+        `sha256` and `parent_folder_id` make the upload findable by `find_upload`.
+        """
+        self.record_upload_provenance_batch(
+            [
+                {
+                    "uid": uid,
+                    "notebook_id": notebook_id,
+                    "page_title": page_title,
+                    "file_path": file_path,
+                    "page_tree_id": page_tree_id,
+                    "entry_id": entry_id,
+                    "page_url": page_url,
+                    "created_at": created_at,
+                    "file_size_bytes": file_size_bytes,
+                    "filename": filename,
+                    "metadata": metadata,
+                    "server_version": server_version,
+                    "as_page_text": as_page_text,
+                    "sha256": sha256,
+                    "parent_folder_id": parent_folder_id,
+                }
+            ]
+        )
+
+    def record_upload_provenance_batch(self, uploads: Sequence[Mapping[str, Any]]) -> None:
+        """Record several uploads with a single graph rebuild and state save.
+
+        Each mapping holds the keyword arguments of `record_upload_provenance`.
+        """
         context = self.get_active_context()
-        if not context:
+        if not context or not uploads:
             return
 
         try:
             graph = nx.node_link_graph(context.graph_data, edges="links")
             graph.graph.setdefault("schema_version", GRAPH_SCHEMA_VERSION)
             now = time.time()
-            created_ts = (
-                self._coerce_timestamp(created_at) or metadata.executed_at.timestamp() or now
-            )
-            file_path_obj = Path(file_path)
+            for upload in uploads:
+                self._add_upload_provenance(graph, context, now, **upload)
+            context.graph_data = nx.node_link_data(graph, edges="links")
+            self._save_state()
+        except Exception as e:
+            logger.warning(f"Failed to record upload provenance in project graph: {e}")
 
-            def _touch_node(node_id: str, **attrs: Any) -> None:
-                default_attrs = {"first_seen": created_ts, "last_seen": now}
-                if graph.has_node(node_id):
-                    existing = graph.nodes[node_id]
-                    existing.setdefault("first_seen", created_ts)
-                    existing["last_seen"] = now
-                    existing.update({k: v for k, v in attrs.items() if v is not None})
-                else:
-                    default_attrs.update({k: v for k, v in attrs.items() if v is not None})
-                    graph.add_node(node_id, **default_attrs)
+    def _add_upload_provenance(
+        self,
+        graph: nx.DiGraph,
+        context: ProjectContext,
+        now: float,
+        *,
+        uid: str,
+        notebook_id: str,
+        page_title: str,
+        file_path: Path | str,
+        page_tree_id: str,
+        entry_id: str | None,
+        page_url: str,
+        created_at: str | float | datetime | None,
+        file_size_bytes: int | None,
+        filename: str,
+        metadata: ProvenanceMetadata,
+        server_version: str,
+        as_page_text: bool,
+        sha256: str | None = None,
+        parent_folder_id: str | None = None,
+    ) -> None:
+        """Add the page, artifact, activity and agent nodes of one upload to `graph`."""
+        created_ts = self._coerce_timestamp(created_at) or metadata.executed_at.timestamp() or now
+        file_path_obj = Path(file_path)
+
+        def _touch_node(node_id: str, **attrs: Any) -> None:
+            default_attrs = {"first_seen": created_ts, "last_seen": now}
+            if graph.has_node(node_id):
+                existing = graph.nodes[node_id]
+                existing.setdefault("first_seen", created_ts)
+                existing["last_seen"] = now
+                existing.update({k: v for k, v in attrs.items() if v is not None})
+            else:
+                default_attrs.update({k: v for k, v in attrs.items() if v is not None})
+                graph.add_node(node_id, **default_attrs)
+
+        def _add_edge(src: str, dst: str, **attrs: Any) -> None:
+            if graph.has_edge(src, dst):
+                edge = graph.edges[src, dst]
+                edge["last_seen"] = now
+                edge.update({k: v for k, v in attrs.items() if v is not None})
+            else:
+                graph.add_edge(
+                    src,
+                    dst,
+                    created_at=created_ts,
+                    last_seen=now,
+                    **{k: v for k, v in attrs.items() if v is not None},
+                )
 
-            def _add_edge(src: str, dst: str, **attrs: Any) -> None:
-                if graph.has_edge(src, dst):
-                    edge = graph.edges[src, dst]
-                    edge["last_seen"] = now
-                    edge.update({k: v for k, v in attrs.items() if v is not None})
-                else:
-                    graph.add_edge(
-                        src,
-                        dst,
-                        created_at=created_ts,
-                        last_seen=now,
-                        **{k: v for k, v in attrs.items() if v is not None},
-                    )
+        artifact_suffix = entry_id or file_path_obj.stem or "upload"
+        page_node_id = f"page:{page_tree_id}"
+        notebook_node_id = f"notebook:{notebook_id}"
+        artifact_node_id = f"artifact:{page_tree_id}:{artifact_suffix}"
+        activity_node_id = f"activity:upload:{page_tree_id}:{artifact_suffix}"
+        user_node_id = f"user:{uid}"
+        software_node_id = "software_agent:labarchives-mcp-pol"
+
+        _touch_node(
+            context.id,
+            type="project",
+            label=context.name,
+            description=context.description,
+            created_at=context.created_at,
+        )
+        _touch_node(
+            notebook_node_id,
+            type="notebook",
+            label=notebook_id,
+            notebook_id=notebook_id,
+        )
+        _touch_node(
+            page_node_id,
+            type="page",
+            label=page_title,
+            page_id=page_tree_id,
+            notebook_id=notebook_id,
+            page_url=page_url,
+            created_at=created_ts,
+            upload_count=(
+                (graph.nodes[page_node_id].get("upload_count", 0) + 1)
+                if graph.has_node(page_node_id)
+                else 1
+            ),
+        )
+        _touch_node(
+            artifact_node_id,
+            type="artifact",
+            label=filename,
+            filename=filename,
+            entry_id=entry_id,
+            page_id=page_tree_id,
+            notebook_id=notebook_id,
+            page_url=page_url,
+            file_size_bytes=file_size_bytes,
+            created_at=created_ts,
+            encoding_format=file_path_obj.suffix.lower() or None,
+            entry_kind=self._entry_kind(as_page_text),
+            sha256=sha256,
+            folder_id=self._folder_key(parent_folder_id) if sha256 else None,
+        )
+        _touch_node(
+            activity_node_id,
+            type="activity",
+            label=f"Upload {filename}",
+            activity_type="upload_to_labarchives",
+            notebook_id=notebook_id,
+            page_id=page_tree_id,
+            entry_id=entry_id,
+            executed_at=metadata.executed_at.timestamp(),
+            completed_at=created_ts,
+            git_commit_sha=metadata.git_commit_sha,
+            git_branch=metadata.git_branch,
+            git_repo_url=metadata.git_repo_url,
+            git_is_dirty=metadata.git_is_dirty,
+            code_version=metadata.code_version or server_version,
+            python_version=metadata.python_version,
+            dependencies=metadata.dependencies,
+            os_name=metadata.os_name,
+            hostname=metadata.hostname,
+            server_version=server_version,
+        )
+        _touch_node(
+            user_node_id,
+            type="user",
+            label=uid,
+            uid=uid,
+        )
+        _touch_node(
+            software_node_id,
+            type="software_agent",
+            label="LabArchives MCP Server",
+            identifier="labarchives-mcp-pol",
+            server_version=server_version,
+            created_at=datetime.now(UTC).timestamp(),
+        )
 
-            artifact_suffix = entry_id or file_path_obj.stem or "upload"
-            page_node_id = f"page:{page_tree_id}"
-            notebook_node_id = f"notebook:{notebook_id}"
-            artifact_node_id = f"artifact:{page_tree_id}:{artifact_suffix}"
-            activity_node_id = f"activity:upload:{page_tree_id}:{artifact_suffix}"
-            user_node_id = f"user:{uid}"
-            software_node_id = "software_agent:labarchives-mcp-pol"
+        _add_edge(context.id, notebook_node_id, relation="uses_notebook")
+        _add_edge(notebook_node_id, page_node_id, relation="contains")
+        _add_edge(context.id, page_node_id, relation="tracked")
+        _add_edge(context.id, artifact_node_id, relation="tracked")
+        _add_edge(context.id, activity_node_id, relation="tracked")
+        _add_edge(page_node_id, artifact_node_id, relation="contains_artifact")
+        _add_edge(page_node_id, activity_node_id, relation="was_generated_by")
+        _add_edge(artifact_node_id, activity_node_id, relation="was_generated_by")
+        _add_edge(page_node_id, user_node_id, relation="was_attributed_to")
+        _add_edge(artifact_node_id, user_node_id, relation="was_attributed_to")
+        _add_edge(activity_node_id, user_node_id, relation="was_associated_with")
+        _add_edge(activity_node_id, software_node_id, relation="was_associated_with")
+
+    def find_upload(
+        self,
+        *,
+        sha256: str,
+        notebook_id: str,
+        parent_folder_id: str | None,
+        page_title: str,
+        as_page_text: bool,
+    ) -> dict[str, Any] | None:
+        """Return a recorded identical upload to the same destination, if any.
 
-            _touch_node(
-                context.id,
-                type="project",
-                label=context.name,
-                description=context.description,
-                created_at=context.created_at,
-            )
-            _touch_node(
-                notebook_node_id,
-                type="notebook",
-                label=notebook_id,
-                notebook_id=notebook_id,
-            )
-            _touch_node(
-                page_node_id,
-                type="page",
-                label=page_title,
-                page_id=page_tree_id,
-                notebook_id=notebook_id,
-                page_url=page_url,
-                created_at=created_ts,
-                upload_count=(
-                    (graph.nodes[page_node_id].get("upload_count", 0) + 1)
-                    if graph.has_node(page_node_id)
-                    else 1
-                ),
-            )
-            _touch_node(
-                artifact_node_id,
-                type="artifact",
-                label=filename,
-                filename=filename,
-                entry_id=entry_id,
-                page_id=page_tree_id,
-                notebook_id=notebook_id,
-                page_url=page_url,
-                file_size_bytes=file_size_bytes,
-                created_at=created_ts,
-                encoding_format=file_path_obj.suffix.lower() or None,
-                entry_kind="page_text" if as_page_text else "attachment",
-            )
-            _touch_node(
-                activity_node_id,
-                type="activity",
-                label=f"Upload {filename}",
-                activity_type="upload_to_labarchives",
-                notebook_id=notebook_id,
-                page_id=page_tree_id,
-                entry_id=entry_id,
-                executed_at=metadata.executed_at.timestamp(),
-                completed_at=created_ts,
-                git_commit_sha=metadata.git_commit_sha,
-                git_branch=metadata.git_branch,
-                git_repo_url=metadata.git_repo_url,
-                git_is_dirty=metadata.git_is_dirty,
-                code_version=metadata.code_version or server_version,
-                python_version=metadata.python_version,
-                dependencies=metadata.dependencies,
-                os_name=metadata.os_name,
-                hostname=metadata.hostname,
-                server_version=server_version,
-            )
-            _touch_node(
-                user_node_id,
-                type="user",
-                label=uid,
-                uid=uid,
-            )
-            _touch_node(
-                software_node_id,
-                type="software_agent",
-                label="LabArchives MCP Server",
-                identifier="labarchives-mcp-pol",
-                server_version=server_version,
-                created_at=datetime.now(UTC).timestamp(),
-            )
+        Looks up an index of artifact nodes (from every project graph) keyed by content
+        hash, notebook, folder, page title and upload mode, so the same bytes stored
+        under another title or as page text instead of an attachment are not treated
+        as duplicates. Uploads whose page has since been pruned by `validate_graph`
+        are not returned.
 
-            _add_edge(context.id, notebook_node_id, relation="uses_notebook")
-            _add_edge(notebook_node_id, page_node_id, relation="contains")
-            _add_edge(context.id, page_node_id, relation="tracked")
-            _add_edge(context.id, artifact_node_id, relation="tracked")
-            _add_edge(context.id, activity_node_id, relation="tracked")
-            _add_edge(page_node_id, artifact_node_id, relation="contains_artifact")
-            _add_edge(page_node_id, activity_node_id, relation="was_generated_by")
-            _add_edge(artifact_node_id, activity_node_id, relation="was_generated_by")
-            _add_edge(page_node_id, user_node_id, relation="was_attributed_to")
-            _add_edge(artifact_node_id, user_node_id, relation="was_attributed_to")
-            _add_edge(activity_node_id, user_node_id, relation="was_associated_with")
-            _add_edge(activity_node_id, software_node_id, relation="was_associated_with")
+        Returns:
+            The artifact's attributes (page_id, entry_id, page_url, filename, ...), or None
+        """
+        if self._upload_index is None:
+            self._upload_index = self._build_upload_index()
+        key = (
+            sha256,
+            notebook_id,
+            self._folder_key(parent_folder_id),
+            page_title,
+            self._entry_kind(as_page_text),
+        )
+        return self._upload_index.get(key)
+
+    def _build_upload_index(self) -> dict[UploadKey, dict[str, Any]]:
+        index: dict[UploadKey, dict[str, Any]] = {}
+        for context in self._state.contexts.values():
+            nodes = context.graph_data.get("nodes", [])
+            page_titles = {
+                node.get("id"): str(node.get("label", ""))
+                for node in nodes
+                if node.get("type") == "page"
+            }
+            for node in nodes:
+                if node.get("type") != "artifact" or not node.get("sha256"):
+                    continue
+                page_title = page_titles.get(f"page:{node.get('page_id')}")
+                if page_title is None:
+                    continue
+                key = (
+                    node["sha256"],
+                    str(node.get("notebook_id")),
+                    node.get("folder_id", ""),
+                    page_title,
+                    node.get("entry_kind", ""),
+                )
+                current = index.get(key)
+                # Keep the most recent upload of the same content
+                if current is None or node.get("created_at", 0) > current.get("created_at", 0):
+                    index[key] = dict(node)
+        return index
 
-            context.graph_data = nx.node_link_data(graph, edges="links")
-            self._save_state()
-        except Exception as e:
-            logger.warning(f"Failed to record upload provenance in project graph: {e}")
+    @staticmethod
+    def _entry_kind(as_page_text: bool) -> str:
+        """Name the artifact kind an upload mode produces."""
+        return "page_text" if as_page_text else "attachment"
+
+    @staticmethod
+    def _folder_key(parent_folder_id: str | None) -> str:
+        """Normalize a destination folder ("" for the notebook root)."""
+        folder = str(parent_folder_id or "")
+        return "" if folder == "0" else folder
 
     def create_project(
         self, name: str, description: str, linked_notebook_ids: list[str] | None = None
@@ -0,0 +1,389 @@
+"""Client-side rate limiting, adaptive concurrency and retry for LabArchives calls.
+
+One `RequestThrottle` is shared by every `LabArchivesClient` built on the same
+`httpx.AsyncClient` (see `throttle_for`). Each call first takes a concurrency slot,
+then a token from a token bucket, and is retried with jittered exponential backoff
+when LabArchives answers with a retryable fault (see
+`transform.translate_labarchives_fault`) or the transport fails. Faults shrink the
+concurrency limit multiplicatively; successes grow it back additively (AIMD), so
+bulk work settles at the throughput the server tolerates.
+
+Calls carry a `Priority` taken from the calling context. Bulk work (indexing,
+onboarding, graph validation) runs inside `background_priority()`; its calls queue
+behind every waiting interactive call, never take the concurrency slots reserved
+for interactive use, and only spend request tokens the bucket has spare, so
+agent-facing latency stays flat while a reindex runs.
+
+The primitives avoid loop-bound asyncio locks so a throttle survives being used
+from successive event loops (as `asyncio.run`-based callers do).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import enum
+import os
+import random
+import time
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from .transform import parse_labarchives_fault, translate_labarchives_fault
+
+# HTTP statuses that signal throttling or a transient outage even without a fault body
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Statuses that show the server rejected the request unprocessed, so even a
+# non-idempotent call can be repeated (a 5xx gateway error may follow a landed write)
+REJECTED_STATUS_CODES = frozenset({429})
+
+# Transport failures after which the server cannot have seen the request
+UNSENT_TRANSPORT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class Priority(enum.IntEnum):
+    """Scheduling class of a LabArchives call (lower values are served first)."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Priority] = ContextVar("labarchives_priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    """Return the priority of calls made from the current context."""
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def background_priority() -> Iterator[None]:
+    """Run LabArchives calls made in this block (and tasks it spawns) as background work."""
+    token = _priority.set(Priority.BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts of up to `burst`.
+
+    Interactive tokens are reserved synchronously, so concurrent callers queue up
+    in arrival order and the bucket may briefly go into debt; a caller sleeps until
+    its reserved token has been refilled. Background callers never borrow: they
+    only take a token that is already available, leaving refills to interactive
+    callers first.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before it becomes valid."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_take(self) -> float:
+        """Take a token if one is available now; otherwise return how long until one is."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Wait for one token."""
+        if priority is Priority.INTERACTIVE:
+            delay = self.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return
+        # Poll at the refill horizon: each wake re-checks for a token left spare
+        delay = self.try_take()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.try_take()
+
+
+class AIMDLimiter:
+    """Concurrency limit with additive increase and multiplicative decrease.
+
+    Each success raises the limit by `1 / limit` (about +1 per window of calls);
+    a fault multiplies it by `decrease_factor`, at most once per `cooldown_seconds`
+    so one burst of failures counts as a single congestion signal.
+
+    Waiting interactive calls are always granted before waiting background calls,
+    and background calls may only use `capacity - reserved` slots (at least one),
+    keeping headroom for interactive calls that arrive mid-reindex.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 16,
+        *,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 1.0,
+        reserved: int = 1,
+    ) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.reserved = max(0, reserved)
+        self.in_flight = 0
+        self._waiters: dict[Priority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in Priority
+        }
+        self._last_decrease = float("-inf")
+
+    @property
+    def capacity(self) -> int:
+        """Whole number of calls currently allowed in flight."""
+        return max(self.minimum, int(self.limit))
+
+    @property
+    def waiting(self) -> dict[str, int]:
+        """Number of queued calls per priority class."""
+        return {priority.name.lower(): len(queue) for priority, queue in self._waiters.items()}
+
+    def _fits(self, priority: Priority) -> bool:
+        if priority is Priority.INTERACTIVE:
+            return self.in_flight < self.capacity
+        return self.in_flight < max(1, self.capacity - self.reserved)
+
+    def _queued_ahead(self, priority: Priority) -> bool:
+        return any(self._waiters[p] for p in Priority if p <= priority)
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Wait for a slot; slots go to higher priorities first, then in arrival order."""
+        if not self._queued_ahead(priority) and self._fits(priority):
+            self.in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot and wake waiters that now fit under the limit."""
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        """Grow the limit additively."""
+        if self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._wake()
+
+    def on_fault(self) -> None:
+        """Shrink the limit multiplicatively (once per cooldown window)."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_seconds:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        logger.info(f"LabArchives concurrency limit {previous:.1f} -> {self.limit:.1f}")
+
+    def _wake(self) -> None:
+        for priority in Priority:
+            queue = self._waiters[priority]
+            while queue and self._fits(priority):
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                self.in_flight += 1
+                waiter.set_result(None)
+            if queue:
+                # Lower priorities wait until this class has drained
+                return
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry budget with full-jitter exponential backoff.
+
+    Attributes:
+        max_attempts: Total attempts per call, including the first
+        base_delay: Backoff ceiling for the first retry, in seconds
+        max_delay: Upper bound on any single backoff, in seconds
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def backoff(self, attempt: int) -> float:
+        """Return a random delay in [0, min(max_delay, base_delay * 2**attempt)]."""
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class RequestThrottle:
+    """Rate limit, bound and retry LabArchives HTTP calls.
+
+    The priority of each call is read from the calling context (see
+    `background_priority`).
+
+    Attributes:
+        bucket: Request-rate limiter
+        concurrency: Adaptive in-flight limit
+        retry: Retry policy for retryable faults and transport errors
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_per_second: float = 10.0,
+        burst: int = 10,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 16,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self.concurrency = AIMDLimiter(initial_concurrency, 1, max_concurrency)
+        self.retry = retry or RetryPolicy()
+        self.requests = 0
+        self.background_requests = 0
+        self.retries = 0
+        self.faults = 0
+        self.transport_errors = 0
+
+    async def send(
+        self, request: Callable[[], Awaitable[httpx.Response]], *, idempotent: bool = True
+    ) -> httpx.Response:
+        """Issue `request` under the rate and concurrency limits, retrying transient failures.
+
+        `request` is called once per attempt, so it should sign its own parameters.
+        Non-idempotent requests are only retried after retryable faults, HTTP 429
+        and transport errors that happen before anything is sent
+        (`UNSENT_TRANSPORT_ERRORS`); never after a 5xx status, since the write may
+        already have been applied.
+        The first response that is not retryable is returned; once attempts run out
+        the last response is returned, so the caller inspects faults either way.
+
+        Raises:
+            httpx.TransportError: The transport failed on the last attempt
+        """
+        priority = current_priority()
+        failure: Exception | None = None
+        response: httpx.Response | None = None
+        for attempt in range(self.retry.max_attempts):
+            if attempt:
+                self.retries += 1
+                delay = self.retry.backoff(attempt - 1)
+                logger.warning(
+                    f"Retrying LabArchives call in {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{self.retry.max_attempts}): {failure!r}"
+                )
+                await asyncio.sleep(delay)
+
+            await self.concurrency.acquire(priority)
+            try:
+                await self.bucket.acquire(priority)
+                self.requests += 1
+                if priority is Priority.BACKGROUND:
+                    self.background_requests += 1
+                try:
+                    response = await request()
+                except httpx.TransportError as exc:
+                    self.transport_errors += 1
+                    failure, response = exc, None
+                    if not idempotent and not isinstance(exc, UNSENT_TRANSPORT_ERRORS):
+                        self.concurrency.on_fault()
+                        raise
+                else:
+                    failure = self._retryable_failure(response, idempotent)
+                    if failure is None:
+                        if not response.is_error:
+                            self.concurrency.on_success()
+                        return response
+                    self.faults += 1
+                self.concurrency.on_fault()
+            finally:
+                self.concurrency.release()
+
+        if response is not None:
+            return response
+        assert failure is not None
+        raise failure
+
+    def stats(self) -> dict[str, Any]:
+        """Return request, retry and concurrency counters."""
+        return {
+            "requests": self.requests,
+            "background_requests": self.background_requests,
+            "retries": self.retries,
+            "faults": self.faults,
+            "transport_errors": self.transport_errors,
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "in_flight": self.concurrency.in_flight,
+            "waiting": self.concurrency.waiting,
+        }
+
+    @staticmethod
+    def _retryable_failure(response: httpx.Response, idempotent: bool) -> Exception | None:
+        if not response.is_error:
+            return None
+        fault = parse_labarchives_fault(response.content)
+        if fault is not None:
+            return fault if translate_labarchives_fault(fault)["retryable"] else None
+        statuses = RETRYABLE_STATUS_CODES if idempotent else REJECTED_STATUS_CODES
+        if response.status_code in statuses:
+            return httpx.HTTPStatusError(
+                f"HTTP {response.status_code}", request=response.request, response=response
+            )
+        return None
+
+
+_throttles: weakref.WeakKeyDictionary[httpx.AsyncClient, RequestThrottle] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def throttle_for(client: httpx.AsyncClient) -> RequestThrottle:
+    """Return the throttle shared by every caller using `client`.
+
+    Limits default to the `LABARCHIVES_RATE_LIMIT` (requests per second, 0 for
+    unlimited) and `LABARCHIVES_MAX_CONCURRENCY` environment variables.
+    """
+    throttle = _throttles.get(client)
+    if throttle is None:
+        rate = float(os.environ.get("LABARCHIVES_RATE_LIMIT", "10"))
+        max_concurrency = int(os.environ.get("LABARCHIVES_MAX_CONCURRENCY", "16"))
+        throttle = RequestThrottle(
+            rate_per_second=rate,
+            burst=max(1, int(rate)),
+            initial_concurrency=min(4, max_concurrency),
+            max_concurrency=max_concurrency,
+        )
+        _throttles[client] = throttle
+    return throttle
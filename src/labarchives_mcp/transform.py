@@ -132,13 +132,38 @@ class NotebookTransformer:
         return parsed.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+RETRYABLE_FAULT_CODES = frozenset({4505, 4506})
+# Faults meaning the uid itself was rejected (4507: uid not found)
+UID_FAULT_CODES = frozenset({4507})
+
+
 def translate_labarchives_fault(error: LabArchivesAPIError) -> dict[str, Any]:
     """Convert a LabArchives-specific error into an MCP error payload."""
 
-    retryable = error.code in {4505, 4506}
+    retryable = error.code in RETRYABLE_FAULT_CODES
     return {
         "code": f"labarchives:{error.code}",
         "message": error.message,
         "retryable": retryable,
         "domain": "labarchives",
     }
+
+
+def parse_labarchives_fault(content: bytes) -> LabArchivesAPIError | None:
+    """Return the fault described by a LabArchives `<error>` body, if there is one.
+
+    Failed calls answer with a non-200 status and, usually, an element such as
+    ``<error><error-code>4505</error-code><error-description>...</error-description>``.
+    Bodies without a numeric error code (or that are not XML) yield None.
+    """
+
+    try:
+        root = etree.fromstring(content)
+    except (etree.XMLSyntaxError, ValueError, TypeError):
+        return None
+
+    code_text = root.findtext(".//error-code")
+    if code_text is None or not code_text.strip().isdigit():
+        return None
+    message = (root.findtext(".//error-description") or "").strip()
+    return LabArchivesAPIError(code=int(code_text), message=message or f"Fault {code_text}")
@@ -0,0 +1,96 @@
+"""Chunked file streaming for LabArchives uploads.
+
+`FileUploadStream` is an async iterable over a file's bytes that httpx accepts as
+a request body, so attachments are sent from disk without loading them into
+memory or blocking the event loop on the read. The byte count and SHA-256 digest
+are accumulated while the file streams, and an optional progress callback is
+invoked after every chunk. `file_sha256` hashes a file up front, e.g. to look for
+an identical earlier upload before sending anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+
+# Called with (bytes streamed so far, total bytes); may be sync or async
+ProgressCallback = Callable[[int, int], Awaitable[None] | None]
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Return the hex SHA-256 of a file, read in chunks (blocking; use a thread)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileUploadStream:
+    """Re-iterable async byte stream over a file on disk.
+
+    Each iteration re-opens the file and restarts the counters, so a request that
+    is retried sends the whole file again. `sha256` is only set once a complete
+    pass has finished.
+
+    Attributes:
+        path: File being streamed
+        total_bytes: File size when the stream was created
+        bytes_streamed: Bytes yielded by the current (or last) pass
+        sha256: Hex digest of the last complete pass, else None
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: ProgressCallback | None = None,
+    ) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.total_bytes = path.stat().st_size
+        self.bytes_streamed = 0
+        self.sha256: str | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Request headers for sending the stream with a known length (not chunked)."""
+        return {
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(self.total_bytes),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        import aiofiles  # type: ignore[import-untyped]
+
+        digest = hashlib.sha256()
+        self.bytes_streamed = 0
+        self.sha256 = None
+        async with aiofiles.open(self.path, "rb") as handle:
+            while chunk := await handle.read(self.chunk_size):
+                self.bytes_streamed += len(chunk)
+                if self.bytes_streamed > self.total_bytes:
+                    raise ValueError(f"{self.path} grew while it was being uploaded")
+                digest.update(chunk)
+                yield chunk
+                await self._report()
+        if self.bytes_streamed != self.total_bytes:
+            raise ValueError(f"{self.path} shrank while it was being uploaded")
+        self.sha256 = digest.hexdigest()
+
+    async def read(self) -> bytes:
+        """Read the whole file through the stream (hashing and reporting as usual)."""
+        return b"".join([chunk async for chunk in self])
+
+    async def _report(self) -> None:
+        if self.progress is None:
+            return
+        result = self.progress(self.bytes_streamed, self.total_bytes)
+        if inspect.isawaitable(result):
+            await result
@@ -22,13 +22,18 @@ from vector_backend.models import BuildRecord
 def _safe_subset(config: VectorSearchConfig) -> dict[str, Any]:
     """Extract a deterministic, non-secret subset of configuration for hashing."""
     # Only include fields relevant to index structure and chunk/embedding behavior.
+    chunking: dict[str, Any] = {
+        "chunk_size": config.chunking.chunk_size,
+        "overlap": config.chunking.overlap,
+        "tokenizer": config.chunking.tokenizer,
+        "preserve_boundaries": config.chunking.preserve_boundaries,
+    }
+    # Records written before chunking strategies existed used the recursive chunker;
+    # only the opt-in strategies enter the hash so those builds stay current.
+    if config.chunking.strategy != "recursive":
+        chunking["strategy"] = config.chunking.strategy
     return {
-        "chunking": {
-            "chunk_size": config.chunking.chunk_size,
-            "overlap": config.chunking.overlap,
-            "tokenizer": config.chunking.tokenizer,
-            "preserve_boundaries": config.chunking.preserve_boundaries,
-        },
+        "chunking": chunking,
         "embedding": {
             "model": config.embedding.model,
             "version": config.embedding.version,
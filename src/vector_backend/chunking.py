@@ -4,10 +4,12 @@ Implements configurable chunking with token-aware splitting and boundary preserv
 All chunking is deterministic: same input + config → same chunks.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from functools import cache
 from typing import Protocol
 
+import numpy as np
 import tiktoken
 
 try:
@@ -17,6 +19,12 @@ except ImportError:
     from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 
+CHUNKING_STRATEGIES = frozenset({"recursive", "token"})
+
+# Break points tried in order of preference when preserve_boundaries is set
+BOUNDARY_SEPARATORS = ("\n\n", "\n", ". ", " ")
+
+
 @cache
 def _get_token_encoding(tokenizer: str) -> tiktoken.Encoding:
     """Return a cached tiktoken encoding for deterministic token counting."""
@@ -26,6 +34,41 @@ def _get_token_encoding(tokenizer: str) -> tiktoken.Encoding:
         raise ValueError(f"Unknown tokenizer: {tokenizer!r}") from exc
 
 
+@cache
+def _token_byte_lengths(tokenizer: str) -> np.ndarray:
+    """Return a lookup table of UTF-8 byte lengths indexed by token id."""
+    encoding = _get_token_encoding(tokenizer)
+    lengths = np.zeros(encoding.n_vocab, dtype=np.int64)
+    for token in range(encoding.n_vocab):
+        try:
+            lengths[token] = len(encoding.decode_single_token_bytes(token))
+        except KeyError:  # unused ids between regular and special tokens
+            continue
+    return lengths
+
+
+def _token_char_offsets(text: str, tokens: list[int], tokenizer: str) -> list[int]:
+    """Map each token to the character offset where it starts, plus a final sentinel.
+
+    Matches `tiktoken.Encoding.decode_with_offsets`: a token that starts inside a
+    multi-byte character maps to the start of that character. Vectorized over a
+    byte-length table instead of decoding every token in Python.
+    """
+    raw = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    byte_offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+    np.cumsum(_token_byte_lengths(tokenizer)[tokens], out=byte_offsets[1:])
+    if byte_offsets[-1] != len(raw):
+        _, offsets = _get_token_encoding(tokenizer).decode_with_offsets(tokens)
+        return [*offsets, len(text)]
+
+    is_char_start = np.append((raw & 0xC0) != 0x80, True)
+    chars_before = np.zeros(len(raw) + 1, dtype=np.int64)
+    np.cumsum(is_char_start[:-1], out=chars_before[1:])
+    char_offsets = chars_before[byte_offsets] - ~is_char_start[byte_offsets]
+    result: list[int] = char_offsets.tolist()
+    return result
+
+
 @dataclass(frozen=True)
 class ChunkingConfig:
     """Configuration for text chunking.
@@ -35,12 +78,14 @@ class ChunkingConfig:
         overlap: Number of overlapping tokens between chunks
         tokenizer: Tokenizer name (tiktoken encoding, e.g., "cl100k_base")
         preserve_boundaries: If True, adjust chunk boundaries to sentence ends
+        strategy: Chunker implementation ("recursive", the default, or the opt-in "token")
     """
 
     chunk_size: int = 400
     overlap: int = 50
     tokenizer: str = "cl100k_base"
     preserve_boundaries: bool = True
+    strategy: str = "recursive"
 
     def __post_init__(self) -> None:
         """Validate configuration parameters."""
@@ -52,6 +97,10 @@ class ChunkingConfig:
             raise ValueError(
                 f"overlap ({self.overlap}) must be less than chunk_size ({self.chunk_size})"
             )
+        if self.strategy not in CHUNKING_STRATEGIES:
+            raise ValueError(
+                f"strategy must be one of {sorted(CHUNKING_STRATEGIES)}, got {self.strategy!r}"
+            )
 
 
 @dataclass(frozen=True)
@@ -196,6 +245,119 @@ class RecursiveTokenChunker:
         return chunks
 
 
+class TokenChunker:
+    """Token-native chunker that encodes each text exactly once.
+
+    The text is tokenized once and windows of `chunk_size` tokens are cut on token
+    offsets, overlapping by `overlap` tokens. With preserve_boundaries=True a window
+    is shortened to the last paragraph, line, sentence or word break in its second
+    half. Chunk character offsets come from the tokenizer's own offset map, so
+    `chunk.text == text[chunk.start_byte:chunk.end_byte]` always holds.
+    """
+
+    def __init__(self, config: ChunkingConfig):
+        """Initialize chunker with configuration.
+
+        Args:
+            config: Chunking configuration
+        """
+        self.config = config
+        self.encoding = _get_token_encoding(config.tokenizer)
+
+    def chunk(self, text: str) -> list[Chunk]:
+        """Split text into overlapping chunks.
+
+        Args:
+            text: Input text to chunk
+
+        Returns:
+            List of Chunk objects in order
+
+        Raises:
+            ValueError: If input text is empty
+        """
+        if not text or not text.strip():
+            raise ValueError("Input text cannot be empty")
+
+        tokens = self.encoding.encode_ordinary(text)
+        n_tokens = len(tokens)
+        # offsets[n_tokens] == len(text), so offsets[end] is valid for the last window
+        offsets = _token_char_offsets(text, tokens, self.config.tokenizer)
+
+        chunk_size = self.config.chunk_size
+        chunks: list[Chunk] = []
+        start = 0
+        while start < n_tokens:
+            end = min(start + chunk_size, n_tokens)
+            if end < n_tokens and self.config.preserve_boundaries:
+                end = self._boundary(text, offsets, start, end)
+
+            start_char, end_char = offsets[start], offsets[end]
+            # A multi-byte character split across tokens maps to one offset; widen
+            while end_char <= start_char and end < n_tokens:
+                end += 1
+                end_char = offsets[end]
+
+            chunk_text = text[start_char:end_char]
+            if chunk_text.strip():
+                chunks.append(
+                    Chunk(
+                        text=chunk_text,
+                        start_byte=start_char,  # Note: These are character positions, not bytes
+                        end_byte=end_char,
+                        token_count=end - start,
+                        chunk_index=len(chunks),
+                    )
+                )
+
+            if end >= n_tokens:
+                break
+            start = self._overlap_start(
+                text, offsets, max(end - self.config.overlap, start + 1), end
+            )
+
+        return chunks
+
+    @staticmethod
+    def _overlap_start(text: str, offsets: list[int], candidate: int, end: int) -> int:
+        """Move the next window's start forward to a word start so it does not open mid-word."""
+        for token in range(candidate, end):
+            char = offsets[token]
+            if text[char].isspace() or text[char - 1].isspace():
+                return token
+        return candidate
+
+    @staticmethod
+    def _boundary(text: str, offsets: list[int], start: int, end: int) -> int:
+        """Return the token index of the preferred break in the window's second half."""
+        lo = start + (end - start) // 2
+        lo_char, hi_char = offsets[lo], offsets[end]
+        for separator in BOUNDARY_SEPARATORS:
+            idx = text.rfind(separator, lo_char, hi_char)
+            if idx == -1:
+                continue
+            # Last token starting at or before the end of the separator; tokenizers
+            # often glue the separator's trailing space onto the next word.
+            boundary = bisect_right(offsets, idx + len(separator), lo, end + 1) - 1
+            if boundary > lo:
+                return boundary
+        return end
+
+
+def create_chunker(config: ChunkingConfig) -> Chunker:
+    """Factory function to create the chunker selected by `config.strategy`.
+
+    Args:
+        config: Chunking configuration
+
+    Returns:
+        Chunker implementation
+    """
+    if config.strategy == "token":
+        return TokenChunker(config)
+    return RecursiveTokenChunker(config)
+
+
 def chunk_text(
     text: str,
     chunk_size: int = 400,
@@ -22,32 +22,50 @@ class VectorSearchConfig(BaseModel):
         embedding: Embedding model configuration
         index: Vector index configuration
         incremental_updates: Incremental update configuration
+        indexing: Bulk indexing execution settings (optional)
     """
 
     chunking: ChunkingConfig
     embedding: EmbeddingConfig
     index: "IndexConfig"
     incremental_updates: "IncrementalUpdateConfig"
+    indexing: "IndexingConfig" = Field(default_factory=lambda: IndexingConfig())
 
 
 class IndexConfig(BaseModel):
     """Vector index configuration.
 
     Attributes:
-        backend: Index backend ("pinecone" or "qdrant")
+        backend: Index backend ("pinecone", "qdrant" or "local")
         index_name: Name of the index/collection
         namespace: Optional namespace for multi-tenancy
         api_key: API key for hosted service
         environment: Environment name (for Pinecone)
         url: URL for self-hosted Qdrant
+        local_path: Directory of `LocalPersistence` Parquet files (for the local backend)
+        compact_threshold: Buffered upserts that trigger a compaction (local backend)
+        ann: Approximate search engine for the local backend ("none" or "ivf")
+        nlist: IVF cell count (default 4 * sqrt(chunks))
+        nprobe: IVF cells scored per query (higher is slower with better recall)
+        ann_min_rows: Chunk count below which the local backend searches exactly
+        quantization: Compact vector codes for the local backend ("none", "int8" or "binary")
+        rescore_factor: Code-ranked candidates rescored in float32 per result
     """
 
-    backend: str = Field(pattern="^(pinecone|qdrant)$")
+    backend: str = Field(pattern="^(pinecone|qdrant|local)$")
     index_name: str
     namespace: str | None = None
     api_key: str | None = None
     environment: str | None = None  # Pinecone
     url: str | None = None  # Qdrant
+    local_path: str = "data/embeddings"  # Local
+    compact_threshold: int = Field(default=1024, ge=1)  # Local
+    ann: str = Field(default="none", pattern="^(none|ivf)$")  # Local
+    nlist: int | None = Field(default=None, ge=1)  # Local
+    nprobe: int = Field(default=8, ge=1)  # Local
+    ann_min_rows: int = Field(default=10000, ge=1)  # Local
+    quantization: str = Field(default="none", pattern="^(none|int8|binary)$")  # Local
+    rescore_factor: int = Field(default=4, ge=1, le=100)  # Local
 
 
 class IncrementalUpdateConfig(BaseModel):
@@ -66,6 +84,31 @@ class IncrementalUpdateConfig(BaseModel):
     last_indexed_file: str = "data/.last_indexed"
 
 
+class IndexingConfig(BaseModel):
+    """Execution settings for bulk indexing.
+
+    Attributes:
+        process_workers: Worker processes for HTML extraction and chunking
+            (0 runs them in the calling process)
+        crawl_concurrency: Concurrent notebook tree requests while crawling
+        fetch_concurrency: Concurrent page entry fetches
+        extract_concurrency: Concurrent pages in text extraction
+        chunk_concurrency: Concurrent pages in chunking
+        embed_concurrency: Concurrent pages being embedded
+        upsert_concurrency: Concurrent page upserts to the vector index
+        queue_size: Capacity of each queue between pipeline stages
+    """
+
+    process_workers: int = Field(default=0, ge=0, le=64)
+    crawl_concurrency: int = Field(default=4, ge=1, le=64)
+    fetch_concurrency: int = Field(default=4, ge=1, le=64)
+    extract_concurrency: int = Field(default=2, ge=1, le=64)
+    chunk_concurrency: int = Field(default=2, ge=1, le=64)
+    embed_concurrency: int = Field(default=2, ge=1, le=64)
+    upsert_concurrency: int = Field(default=2, ge=1, le=64)
+    queue_size: int = Field(default=8, ge=1, le=1024)
+
+
 def load_config(
     config_name: str = "default",
     config_path: str | Path | None = None,
@@ -131,6 +174,7 @@ def create_default_config() -> dict[str, dict[str, object]]:
             "overlap": 50,
             "tokenizer": "cl100k_base",
             "preserve_boundaries": True,
+            "strategy": "recursive",
         },
         "embedding": {
             "model": "openai/text-embedding-3-small",
@@ -140,6 +184,7 @@ def create_default_config() -> dict[str, dict[str, object]]:
             "max_retries": 3,
             "timeout_seconds": 30.0,
             "api_key": "${oc.env:OPENAI_API_KEY}",
+            "cache_path": "data/embedding_cache.sqlite",
         },
         "index": {
             "backend": "pinecone",
@@ -148,6 +193,14 @@ def create_default_config() -> dict[str, dict[str, object]]:
             "api_key": "${oc.env:PINECONE_API_KEY}",
             "environment": "${oc.env:PINECONE_ENVIRONMENT,us-east-1}",
             "url": None,
+            "local_path": "data/embeddings",
+            "compact_threshold": 1024,
+            "ann": "none",
+            "nlist": None,
+            "nprobe": 8,
+            "ann_min_rows": 10000,
+            "quantization": "none",
+            "rescore_factor": 4,
         },
         "incremental_updates": {
             "enabled": True,
@@ -155,4 +208,14 @@ def create_default_config() -> dict[str, dict[str, object]]:
             "batch_size": 200,
             "last_indexed_file": "data/.last_indexed",
         },
+        "indexing": {
+            "process_workers": 0,
+            "crawl_concurrency": 4,
+            "fetch_concurrency": 4,
+            "extract_concurrency": 2,
+            "chunk_concurrency": 2,
+            "embed_concurrency": 2,
+            "upsert_concurrency": 2,
+            "queue_size": 8,
+        },
     }
@@ -11,6 +11,9 @@ import httpx
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from vector_backend.chunking import _get_token_encoding
+from vector_backend.embedding_cache import EmbeddingCache
+
 
 class EmbeddingConfig(BaseModel):
     """Configuration for embedding generation.
@@ -19,19 +22,35 @@ class EmbeddingConfig(BaseModel):
         model: Model identifier (e.g., "openai/text-embedding-3-small")
         version: Version tag for reindexing triggers (e.g., "v1")
         dimensions: Expected embedding dimensionality
-        batch_size: Number of texts to embed per API call
+        batch_size: Maximum number of texts per API call; larger inputs are split
+        tokenizer: tiktoken encoding used to budget tokens per API call
+        max_tokens_per_batch: Maximum total input tokens per API call
+        max_concurrency: Maximum number of API calls in flight for one input
         max_retries: Maximum retry attempts for transient failures
         timeout_seconds: API request timeout
         api_key: API key for external services (set via env var)
+        cache_path: Optional SQLite file for the persistent embedding cache
+        api_base: Base URL of the OpenAI-compatible embeddings API
+        max_connections: Connection pool size of the shared HTTP client
+        max_keepalive_connections: Idle connections kept open for reuse
+        http2: Negotiate HTTP/2 when the optional `h2` package is installed
     """
 
     model: str
     version: str
     dimensions: int = Field(ge=128, le=4096)
     batch_size: int = Field(default=100, ge=1, le=500)
+    tokenizer: str = "cl100k_base"
+    max_tokens_per_batch: int = Field(default=250_000, ge=1, le=300_000)
+    max_concurrency: int = Field(default=8, ge=1, le=64)
     max_retries: int = Field(default=3, ge=1, le=10)
     timeout_seconds: float = Field(default=30.0, ge=1.0, le=300.0)
     api_key: str | None = None
+    cache_path: str | None = None
+    api_base: str = "https://api.openai.com/v1"
+    max_connections: int = Field(default=16, ge=1, le=256)
+    max_keepalive_connections: int = Field(default=8, ge=0, le=256)
+    http2: bool = False
 
 
 class EmbeddingClient(Protocol):
@@ -41,13 +60,12 @@ class EmbeddingClient(Protocol):
         """Generate embeddings for a batch of texts.
 
         Args:
-            texts: List of input texts (max batch_size)
+            texts: List of input texts (any length)
 
         Returns:
             List of embedding vectors (same order as inputs)
 
         Raises:
-            ValueError: If batch size exceeds limit
             httpx.HTTPError: For API failures after retries
         """
         ...
@@ -65,16 +83,29 @@ class EmbeddingClient(Protocol):
 
 
 class OpenAIEmbedding:
-    """OpenAI embedding client with retry logic and batching."""
+    """OpenAI embedding client with retry logic and batching.
 
-    def __init__(self, config: EmbeddingConfig):
+    Inputs of any size are split into sub-batches bounded by `batch_size` texts and
+    `max_tokens_per_batch` tokens, sent concurrently (at most `max_concurrency` at a
+    time) and reassembled in input order. When a cache is supplied, `embed_batch`
+    serves previously embedded texts from it and only sends misses upstream.
+
+    All requests share one pooled `httpx.AsyncClient`, created on first use, so
+    keep-alive connections are reused across batches. Call `aclose()` (or use the
+    client as an async context manager) to release it.
+    """
+
+    def __init__(self, config: EmbeddingConfig, cache: EmbeddingCache | None = None):
         """Initialize OpenAI client.
 
         Args:
             config: Embedding configuration with API key
+            cache: Optional persistent embedding cache
         """
         self.config = config
+        self.cache = cache
         # Use plain HTTP client to avoid tight coupling to SDK versions
+        self._http: httpx.AsyncClient | None = None
 
         # Extract model name (strip "openai/" prefix if present)
         self.model_name = (
@@ -87,88 +118,180 @@ class OpenAIEmbedding:
         """Generate embeddings for a batch of texts with retry logic.
 
         Args:
-            texts: List of input texts (max batch_size)
+            texts: List of input texts (split into sub-batches as needed)
 
         Returns:
             List of embedding vectors (same order as inputs)
 
         Raises:
-            ValueError: If batch size exceeds config limit
             httpx.HTTPError: For API failures after all retries
         """
-        if len(texts) > self.config.batch_size:
-            raise ValueError(f"Batch size {len(texts)} exceeds limit {self.config.batch_size}")
-
         if not texts:
             return []
 
-        async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as http:
-            for attempt in range(self.config.max_retries):
+        if self.cache is None:
+            return await self._embed_uncached(texts)
+
+        cfg = self.config
+        vectors = await self.cache.get_many(cfg.model, cfg.dimensions, cfg.version, texts)
+        # Each distinct uncached text is embedded once, even if repeated in the batch
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors, strict=True) if v is None))
+        if missing:
+            fresh = await self._embed_uncached(missing)
+            await self.cache.put_many(cfg.model, cfg.dimensions, cfg.version, missing, fresh)
+            by_text = dict(zip(missing, fresh, strict=True))
+            vectors = [
+                v if v is not None else by_text[t] for t, v in zip(texts, vectors, strict=True)
+            ]
+
+        return [v for v in vectors if v is not None]
+
+    async def _embed_uncached(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts via concurrent, token-budgeted API calls."""
+        # Token counting is CPU-bound; keep it off the event loop
+        batches = await asyncio.to_thread(self._plan_batches, texts)
+        if len(batches) > 1:
+            logger.debug(f"Splitting {len(texts)} texts into {len(batches)} embedding requests")
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        http = self._get_http()
+
+        async def _bounded(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._request_embeddings(http, batch)
+
+        results = await asyncio.gather(*(_bounded(batch) for batch in batches))
+        return [vector for batch_vectors in results for vector in batch_vectors]
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the shared pooled HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            http2 = self.config.http2
+            if http2:
                 try:
-                    # Call OpenAI embeddings REST endpoint directly
-                    resp = await http.post(
-                        "https://api.openai.com/v1/embeddings",
-                        headers={
-                            "Authorization": f"Bearer {self.config.api_key or ''}",
-                            "Content-Type": "application/json",
-                        },
-                        json={"model": self.model_name, "input": texts},
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("http2 requested but 'h2' is not installed; using HTTP/1.1")
+                    http2 = False
+            self._http = httpx.AsyncClient(
+                base_url=self.config.api_base,
+                timeout=self.config.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                ),
+                http2=http2,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and the embedding cache, if any."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self.cache is not None:
+            self.cache.close()
+
+    async def __aenter__(self) -> "OpenAIEmbedding":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _plan_batches(self, texts: list[str]) -> list[list[str]]:
+        """Greedily pack texts into order-preserving sub-batches within both limits.
+
+        A single text larger than the token budget is sent on its own.
+        """
+        encoding = _get_token_encoding(self.config.tokenizer)
+        token_counts = [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
+
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for text, n_tokens in zip(texts, token_counts, strict=True):
+            if current and (
+                len(current) >= self.config.batch_size
+                or current_tokens + n_tokens > self.config.max_tokens_per_batch
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += n_tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _request_embeddings(
+        self, http: httpx.AsyncClient, texts: list[str]
+    ) -> list[list[float]]:
+        """Call the OpenAI embeddings endpoint with retry logic."""
+        for attempt in range(self.config.max_retries):
+            try:
+                # Call OpenAI embeddings REST endpoint directly
+                resp = await http.post(
+                    "/embeddings",
+                    headers={
+                        "Authorization": f"Bearer {self.config.api_key or ''}",
+                        "Content-Type": "application/json",
+                    },
+                    json={"model": self.model_name, "input": texts},
+                )
+
+                if resp.status_code == 429:
+                    # Rate limited
+                    logger.warning(
+                        f"Rate limited (attempt {attempt + 1}/{self.config.max_retries})"
                     )
-
-                    if resp.status_code == 429:
-                        # Rate limited
-                        logger.warning(
-                            f"Rate limited (attempt {attempt + 1}/{self.config.max_retries})"
-                        )
-                        if attempt < self.config.max_retries - 1:
-                            await asyncio.sleep(2 ** (attempt + 1))
-                            continue
-                        resp.raise_for_status()
-
-                    # Raise on non-OK responses
+                    if attempt < self.config.max_retries - 1:
+                        await asyncio.sleep(2 ** (attempt + 1))
+                        continue
                     resp.raise_for_status()
 
-                    payload = resp.json()
-                    data = payload.get("data", [])
-                    if len(data) != len(texts):
-                        raise ValueError(
-                            f"Expected {len(texts)} embeddings, got {len(data)} from OpenAI"
-                        )
+                # Raise on non-OK responses
+                resp.raise_for_status()
 
-                    try:
-                        ordered = sorted(data, key=lambda item: int(item.get("index", 0)))
-                    except Exception:
-                        ordered = data
+                payload = resp.json()
+                data = payload.get("data", [])
+                if len(data) != len(texts):
+                    raise ValueError(
+                        f"Expected {len(texts)} embeddings, got {len(data)} from OpenAI"
+                    )
 
-                    embeddings = [item.get("embedding", []) for item in ordered]
+                try:
+                    ordered = sorted(data, key=lambda item: int(item.get("index", 0)))
+                except Exception:
+                    ordered = data
 
-                    # Validate dimensionality
-                    for i, emb in enumerate(embeddings):
-                        if len(emb) != self.config.dimensions:
-                            raise ValueError(
-                                f"Expected {self.config.dimensions} dimensions, "
-                                f"got {len(emb)} for text {i}"
-                            )
+                embeddings = [item.get("embedding", []) for item in ordered]
 
-                    logger.debug(
-                        f"Embedded {len(texts)} texts with {self.model_name} "
-                        f"(attempt {attempt + 1}/{self.config.max_retries})"
-                    )
-                    return embeddings
+                # Validate dimensionality
+                for i, emb in enumerate(embeddings):
+                    if len(emb) != self.config.dimensions:
+                        raise ValueError(
+                            f"Expected {self.config.dimensions} dimensions, "
+                            f"got {len(emb)} for text {i}"
+                        )
 
-                except httpx.TimeoutException as e:
-                    logger.warning(
-                        f"Timeout embedding batch "
-                        f"(attempt {attempt + 1}/{self.config.max_retries}): {e}"
-                    )
-                    if attempt < self.config.max_retries - 1:
-                        await asyncio.sleep(2**attempt)  # Exponential backoff
-                    else:
-                        raise
-                except httpx.HTTPStatusError as e:
-                    # Non-retryable HTTP error (other than 429 handled above)
-                    logger.error(f"HTTP error embedding batch: {e}")
+                logger.debug(
+                    f"Embedded {len(texts)} texts with {self.model_name} "
+                    f"(attempt {attempt + 1}/{self.config.max_retries})"
+                )
+                return embeddings
+
+            except httpx.TimeoutException as e:
+                logger.warning(
+                    f"Timeout embedding batch "
+                    f"(attempt {attempt + 1}/{self.config.max_retries}): {e}"
+                )
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(2**attempt)  # Exponential backoff
+                else:
                     raise
+            except httpx.HTTPStatusError as e:
+                # Non-retryable HTTP error (other than 429 handled above)
+                logger.error(f"HTTP error embedding batch: {e}")
+                raise
 
         raise RuntimeError("Exhausted all retry attempts")
 
@@ -209,6 +332,19 @@ class LocalEmbedding:
         raise NotImplementedError
 
 
+async def close_embedding_client(client: EmbeddingClient) -> None:
+    """Release resources held by an embedding client.
+
+    Clients without an `aclose()` method (e.g., lightweight test doubles) are ignored.
+
+    Args:
+        client: Embedding client to close
+    """
+    aclose = getattr(client, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
 def create_embedding_client(config: EmbeddingConfig) -> EmbeddingClient:
     """Factory function to create embedding client based on model config.
 
@@ -228,7 +364,8 @@ def create_embedding_client(config: EmbeddingConfig) -> EmbeddingClient:
         >>> client = create_embedding_client(config)
     """
     if config.model.startswith("openai/"):
-        return OpenAIEmbedding(config)
+        cache = EmbeddingCache(config.cache_path) if config.cache_path else None
+        return OpenAIEmbedding(config, cache=cache)
     elif config.model.startswith("local/"):
         return LocalEmbedding(config)
     else:
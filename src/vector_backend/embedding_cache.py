@@ -0,0 +1,165 @@
+"""Persistent, content-addressed cache for embedding vectors.
+
+Vectors are keyed by (model, dimensions, embedding version, sha256 of text) so
+a rebuild of unchanged content is served entirely from disk, while a model or
+version bump naturally misses. Storage is a single SQLite file; vectors are
+stored as packed float64 so cached values round-trip exactly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+
+from loguru import logger
+
+# SQLite limits the number of bound parameters per statement
+_SQL_CHUNK = 500
+
+
+def text_digest(text: str) -> str:
+    """Return the hex SHA256 digest used as the content address of `text`."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache with hit/miss counters.
+
+    The database is opened lazily on first use, so constructing a cache is free.
+    Blocking SQLite work runs in a worker thread; a lock serialises access to the
+    shared connection.
+
+    Attributes:
+        path: Location of the SQLite database file
+        hits: Number of texts served from the cache
+        misses: Number of texts that had to be embedded upstream
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file (parent directories are created on demand)
+        """
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    async def get_many(
+        self, model: str, dimensions: int, version: str, texts: list[str]
+    ) -> list[list[float] | None]:
+        """Look up cached vectors for `texts`.
+
+        Args:
+            model: Embedding model identifier
+            dimensions: Embedding dimensionality
+            version: Embedding version tag
+            texts: Input texts
+
+        Returns:
+            One entry per input text: the cached vector, or None on a miss
+        """
+        if not texts:
+            return []
+        digests = [text_digest(text) for text in texts]
+        found = await asyncio.to_thread(self._select, model, dimensions, version, digests)
+
+        vectors: list[list[float] | None] = [found.get(digest) for digest in digests]
+        hits = sum(vector is not None for vector in vectors)
+        self.hits += hits
+        self.misses += len(vectors) - hits
+        return vectors
+
+    async def put_many(
+        self,
+        model: str,
+        dimensions: int,
+        version: str,
+        texts: list[str],
+        vectors: list[list[float]],
+    ) -> None:
+        """Store vectors for `texts` (existing entries are replaced).
+
+        Args:
+            model: Embedding model identifier
+            dimensions: Embedding dimensionality
+            version: Embedding version tag
+            texts: Input texts
+            vectors: Embedding vectors (same order as texts)
+        """
+        if len(texts) != len(vectors):
+            raise ValueError(f"Got {len(vectors)} vectors for {len(texts)} texts")
+        if not texts:
+            return
+        rows = [
+            (model, dimensions, version, text_digest(text), array("d", vector).tobytes())
+            for text, vector in zip(texts, vectors, strict=True)
+        ]
+        await asyncio.to_thread(self._insert, rows)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " model TEXT NOT NULL,"
+                " dimensions INTEGER NOT NULL,"
+                " version TEXT NOT NULL,"
+                " text_sha256 TEXT NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " PRIMARY KEY (model, dimensions, version, text_sha256)"
+                ") WITHOUT ROWID"
+            )
+            conn.commit()
+            logger.debug(f"Opened embedding cache at {self.path}")
+            self._conn = conn
+        return self._conn
+
+    def _select(
+        self, model: str, dimensions: int, version: str, digests: list[str]
+    ) -> dict[str, list[float]]:
+        unique = list(dict.fromkeys(digests))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(unique), _SQL_CHUNK):
+                chunk = unique[start : start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    "SELECT text_sha256, vector FROM embeddings"
+                    " WHERE model = ? AND dimensions = ? AND version = ?"
+                    f" AND text_sha256 IN ({placeholders})",
+                    (model, dimensions, version, *chunk),
+                )
+                for digest, blob in cursor:
+                    vector = array("d")
+                    vector.frombytes(blob)
+                    found[digest] = vector.tolist()
+        return found
+
+    def _insert(self, rows: list[tuple[str, int, str, str, bytes]]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)", rows)
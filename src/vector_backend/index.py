@@ -1,19 +1,21 @@
 """Vector index management and search operations.
 
-Provides unified interface for Pinecone and Qdrant backends with:
+Provides unified interface for Pinecone, Qdrant and in-process local backends with:
 - Bulk upsert with retry logic
 - Semantic search with metadata filtering
 - Index statistics and health checks
-- DVC-tracked local persistence
+- DVC-tracked local persistence with columnar (Arrow/NumPy) reads and writes
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast, overload
 
 from vector_backend.models import (
+    MAX_VECTOR_DIM,
+    MIN_VECTOR_DIM,
     ChunkMetadata,
     EmbeddedChunk,
     IndexStats,
@@ -21,6 +23,130 @@ from vector_backend.models import (
     SearchResult,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+    from vector_backend.config import IndexConfig
+
+# Parquet columns holding ChunkMetadata fields
+METADATA_COLUMNS = (
+    "notebook_id",
+    "notebook_name",
+    "page_id",
+    "page_title",
+    "entry_id",
+    "entry_type",
+    "author",
+    "date",
+    "folder_path",
+    "tags",
+    "labarchives_url",
+    "embedding_version",
+)
+
+# Version of the Parquet chunk schema, stored in the file's schema metadata.
+# 1: pandas-written, `vector` as list<double> (files without the key)
+# 2: pyarrow-written, `vector` as fixed_size_list<float32, dim>
+CHUNK_SCHEMA_VERSION = 2
+SCHEMA_VERSION_KEY = b"vector_backend.schema_version"
+
+
+def chunk_schema(dim: int | None) -> "pa.Schema":
+    """Return the current Parquet schema for chunks with `dim`-dimensional vectors.
+
+    An empty notebook has no dimension (`dim=None`) and stores `vector` as a
+    variable-length float32 list.
+    """
+    import pyarrow as pa
+
+    vector = pa.list_(pa.float32()) if dim is None else pa.list_(pa.float32(), dim)
+    string = pa.string()
+    return pa.schema(
+        [
+            pa.field("id", string, nullable=False),
+            pa.field("text", string, nullable=False),
+            pa.field("vector", vector, nullable=False),
+            pa.field("notebook_id", string, nullable=False),
+            pa.field("notebook_name", string, nullable=False),
+            pa.field("page_id", string, nullable=False),
+            pa.field("page_title", string, nullable=False),
+            pa.field("entry_id", string, nullable=False),
+            pa.field("entry_type", string, nullable=False),
+            pa.field("author", string, nullable=False),
+            pa.field("date", pa.timestamp("us"), nullable=False),
+            pa.field("folder_path", string),
+            pa.field("tags", pa.list_(string)),
+            pa.field("labarchives_url", string, nullable=False),
+            pa.field("embedding_version", string, nullable=False),
+        ],
+        metadata={SCHEMA_VERSION_KEY: str(CHUNK_SCHEMA_VERSION).encode()},
+    )
+
+
+def row_schema() -> "pa.Schema":
+    """Return the current schema of every chunk column except `vector`.
+
+    Tables read from any schema version are cast to it, so notebooks written
+    before and after an upgrade can be concatenated.
+    """
+    schema = chunk_schema(None)
+    return schema.remove(schema.get_field_index("vector"))
+
+
+def schema_version(schema: "pa.Schema") -> int:
+    """Return the chunk schema version of a Parquet file (1 if it predates versioning)."""
+    raw = (schema.metadata or {}).get(SCHEMA_VERSION_KEY)
+    return int(raw) if raw is not None else 1
+
+
+def rows_table(chunks: Sequence[EmbeddedChunk]) -> "pa.Table":
+    """Build an Arrow table of the chunks' id, text and metadata (`row_schema()`)."""
+    import pyarrow as pa
+
+    schema = row_schema()
+    values: dict[str, list[Any]] = {
+        "id": [chunk.id for chunk in chunks],
+        "text": [chunk.text for chunk in chunks],
+    }
+    for name in METADATA_COLUMNS:
+        values[name] = [getattr(chunk.metadata, name) for chunk in chunks]
+    return pa.table(
+        [pa.array(values[name], type=schema.field(name).type) for name in schema.names],
+        schema=schema,
+    )
+
+
+def chunks_to_table(chunks: Sequence[EmbeddedChunk]) -> "pa.Table":
+    """Build an Arrow table in the current chunk schema.
+
+    Vectors are packed into one float32 buffer and wrapped as a fixed-size
+    list column, without per-float Python objects on the Arrow side.
+
+    Raises:
+        ValueError: If the chunks' vectors differ in length
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if not chunks:
+        return chunk_schema(None).empty_table()
+
+    dims = {len(chunk.vector) for chunk in chunks}
+    if len(dims) > 1:
+        raise ValueError(f"Chunk vectors differ in length: {sorted(dims)}")
+    dim = dims.pop()
+    schema = chunk_schema(dim)
+
+    vectors = np.asarray([chunk.vector for chunk in chunks], dtype=np.float32)
+    values = pa.array(vectors.reshape(-1), type=pa.float32())
+    vector = pa.FixedSizeListArray.from_arrays(values, dim)
+    rows = rows_table(chunks)
+    return pa.table(
+        [vector if name == "vector" else rows.column(name) for name in schema.names],
+        schema=schema,
+    )
+
 
 class VectorIndex(ABC):
     """Abstract base class for vector index implementations."""
@@ -48,11 +174,14 @@ class VectorIndex(ABC):
         ...
 
     @abstractmethod
-    async def search(self, request: SearchRequest) -> list[SearchResult]:
+    async def search(
+        self, request: SearchRequest, query_vector: list[float] | None = None
+    ) -> list[SearchResult]:
         """Perform semantic search.
 
         Args:
             request: Search query with filters and limits
+            query_vector: Optional pre-computed query embedding
 
         Returns:
             List of search results ranked by similarity
@@ -313,7 +442,9 @@ class QdrantIndex(VectorIndex):
         """Delete chunks from Qdrant."""
         raise NotImplementedError
 
-    async def search(self, request: SearchRequest) -> list[SearchResult]:
+    async def search(
+        self, request: SearchRequest, query_vector: list[float] | None = None
+    ) -> list[SearchResult]:
         """Search Qdrant collection."""
         raise NotImplementedError
 
@@ -326,6 +457,199 @@ class QdrantIndex(VectorIndex):
         raise NotImplementedError
 
 
+class MetadataColumns(Sequence[ChunkMetadata]):
+    """Metadata columns of saved chunks, read as `ChunkMetadata` one row at a time.
+
+    Whole columns are available as Python lists through `column()`, converted
+    from Arrow once per column, so filters never build per-row objects.
+
+    Attributes:
+        table: Arrow table holding (at least) the `METADATA_COLUMNS`
+    """
+
+    def __init__(self, table: "pa.Table") -> None:
+        self.table = table
+        self._columns: dict[str, list[Any]] = {}
+
+    @classmethod
+    def empty(cls) -> "MetadataColumns":
+        """Return metadata of zero rows."""
+        return cls(row_schema().empty_table())
+
+    def take(self, rows: "np.ndarray") -> "MetadataColumns":
+        """Return the metadata of the given rows, in the order given."""
+        return MetadataColumns(self.table.take(rows) if len(self.table) else self.table)
+
+    def extend(self, chunks: Sequence[EmbeddedChunk]) -> "MetadataColumns":
+        """Return this metadata followed by that of `chunks`."""
+        import pyarrow as pa
+
+        if not chunks:
+            return self
+        added = rows_table(chunks)
+        if not len(self.table):
+            return MetadataColumns(added)
+        schema = row_schema()
+        return MetadataColumns(pa.concat_tables([self.table.select(schema.names), added]))
+
+    def column(self, name: str) -> list[Any]:
+        """Return all values of one metadata column."""
+        values = self._columns.get(name)
+        if values is None:
+            values = self.table.column(name).to_pylist() if len(self.table) else []
+            self._columns[name] = values
+        return values
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @overload
+    def __getitem__(self, index: int) -> ChunkMetadata: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ChunkMetadata]: ...
+
+    def __getitem__(self, index: int | slice) -> ChunkMetadata | list[ChunkMetadata]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("metadata row out of range")
+        fields = {name: self.column(name)[index] for name in METADATA_COLUMNS}
+        fields["tags"] = list(fields["tags"] or [])
+        return ChunkMetadata(**fields)
+
+
+class ChunkColumns(Sequence[EmbeddedChunk]):
+    """Saved chunks as columns: a vector matrix plus Arrow id/text/metadata columns.
+
+    Indexing builds an `EmbeddedChunk` for just that row; the vectors were
+    validated for the whole matrix at once, so the per-float model validator
+    is skipped.
+
+    Attributes:
+        table: Arrow table with the id, text and metadata columns
+        vectors: One vector per row, shape (rows, dim)
+        metadata: Lazy `ChunkMetadata` view of the metadata columns
+    """
+
+    def __init__(self, table: "pa.Table", vectors: "np.ndarray") -> None:
+        self.table = table
+        self.vectors = vectors
+        self.metadata = MetadataColumns(table)
+        self._ids: list[str] | None = None
+        self._texts: list[str] | None = None
+
+    @classmethod
+    def concat(cls, parts: Iterable["ChunkColumns"]) -> "ChunkColumns":
+        """Combine the chunks of several notebooks (all vectors must share a dimension)."""
+        import numpy as np
+        import pyarrow as pa
+
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls(pa.table({}), np.zeros((0, 0)))
+        dims = {part.vectors.shape[1] for part in parts}
+        if len(dims) > 1:
+            raise ValueError(f"Notebooks have different vector dimensions: {sorted(dims)}")
+        table = pa.concat_tables([part.table for part in parts], promote_options="default")
+        return cls(table, np.concatenate([part.vectors for part in parts]))
+
+    @property
+    def ids(self) -> list[str]:
+        """Chunk IDs in row order."""
+        if self._ids is None:
+            self._ids = self.table.column("id").to_pylist() if len(self) else []
+        return self._ids
+
+    @property
+    def texts(self) -> list[str]:
+        """Chunk texts in row order."""
+        if self._texts is None:
+            self._texts = self.table.column("text").to_pylist() if len(self) else []
+        return self._texts
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @overload
+    def __getitem__(self, index: int) -> EmbeddedChunk: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[EmbeddedChunk]: ...
+
+    def __getitem__(self, index: int | slice) -> EmbeddedChunk | list[EmbeddedChunk]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        metadata = self.metadata[index]
+        return EmbeddedChunk.model_construct(
+            id=self.ids[index],
+            text=self.texts[index],
+            vector=self.vectors[index].tolist(),
+            metadata=metadata,
+        )
+
+
+def vector_matrix(column: "pa.ChunkedArray | pa.Array") -> "np.ndarray":
+    """Return an Arrow vector column as a (rows, dim) NumPy matrix.
+
+    A single-chunk `fixed_size_list<float32>` column (the current schema) is
+    viewed without copying; the result is then read-only. Variable-length
+    lists from schema version 1 files are copied.
+
+    Raises:
+        ValueError: If a vector is null or contains nulls, or the vectors differ in length
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if isinstance(column, pa.ChunkedArray):
+        array = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    else:
+        array = column
+    if len(array) == 0 or pa.types.is_null(array.type):
+        return np.zeros((len(array), 0))
+    if array.null_count:
+        raise ValueError("Chunk vectors must not be null")
+
+    if pa.types.is_fixed_size_list(array.type):
+        dim = array.type.list_size
+    else:
+        lengths = np.diff(np.asarray(array.offsets))
+        dim = int(lengths[0])
+        if (lengths != dim).any():
+            raise ValueError(f"Chunk vectors differ in length: {sorted(set(lengths.tolist()))}")
+    values = array.flatten()
+    if values.null_count:
+        raise ValueError("Chunk vectors must not contain null values")
+    return cast("np.ndarray", values.to_numpy(zero_copy_only=False).reshape(len(array), dim))
+
+
+def validate_vectors(vectors: "np.ndarray", ids: Sequence[str] = ()) -> None:
+    """Check a whole vector matrix at once (the columnar form of EmbeddedChunk's validator).
+
+    Raises:
+        ValueError: If the dimension is unsupported or any value is not finite
+    """
+    import numpy as np
+
+    if not len(vectors):
+        return
+    dim = vectors.shape[1]
+    if not MIN_VECTOR_DIM <= dim <= MAX_VECTOR_DIM:
+        raise ValueError(
+            f"Vectors have {dim} dimensions, expected {MIN_VECTOR_DIM}-{MAX_VECTOR_DIM}"
+        )
+    finite = np.isfinite(vectors)
+    if not finite.all():
+        row, col = (int(i) for i in np.argwhere(~finite)[0])
+        chunk = f"chunk {ids[row]!r}" if len(ids) > row else f"row {row}"
+        raise ValueError(
+            f"Vector of {chunk} contains non-finite value at index {col}: {vectors[row, col]}"
+        )
+
+
 class LocalPersistence:
     """DVC-tracked local persistence for embeddings with concurrent write safety.
 
@@ -373,139 +697,107 @@ class LocalPersistence:
         Returns:
             Path to saved Parquet file
 
+        Raises:
+            ValueError: If the chunks' vectors differ in length
+
         Note:
-            Uses per-notebook file locking to prevent concurrent write corruption.
-            Lock timeout is 30 seconds.
+            Writes the current chunk schema (`CHUNK_SCHEMA_VERSION`), with
+            vectors stored as float32. Uses per-notebook file locking to
+            prevent concurrent write corruption. Lock timeout is 30 seconds.
         """
-        import pandas as pd
+        import pyarrow.parquet as pq
         from filelock import FileLock
 
         output_path = self.version_path / f"{notebook_id}.parquet"
         lock_path = self.version_path / f".{notebook_id}.lock"
+        table = chunks_to_table(chunks)
 
         # Acquire lock before writing
         with FileLock(lock_path, timeout=30):
-            if not chunks:
-                # Create empty DataFrame with expected schema
-                df = pd.DataFrame(
-                    columns=[
-                        "id",
-                        "text",
-                        "vector",
-                        "notebook_id",
-                        "notebook_name",
-                        "page_id",
-                        "page_title",
-                        "entry_id",
-                        "entry_type",
-                        "author",
-                        "date",
-                        "folder_path",
-                        "tags",
-                        "labarchives_url",
-                        "embedding_version",
-                    ]
-                )
-            else:
-                # Convert chunks to flat dictionaries
-                records = []
-                for chunk in chunks:
-                    record = {
-                        "id": chunk.id,
-                        "text": chunk.text,
-                        "vector": chunk.vector,
-                        # Flatten metadata
-                        "notebook_id": chunk.metadata.notebook_id,
-                        "notebook_name": chunk.metadata.notebook_name,
-                        "page_id": chunk.metadata.page_id,
-                        "page_title": chunk.metadata.page_title,
-                        "entry_id": chunk.metadata.entry_id,
-                        "entry_type": chunk.metadata.entry_type,
-                        "author": chunk.metadata.author,
-                        "date": chunk.metadata.date,
-                        "folder_path": chunk.metadata.folder_path,
-                        "tags": chunk.metadata.tags,
-                        "labarchives_url": chunk.metadata.labarchives_url,
-                        "embedding_version": chunk.metadata.embedding_version,
-                    }
-                    records.append(record)
-
-                df = pd.DataFrame(records)
-
-            # Save with compression
-            df.to_parquet(output_path, engine="pyarrow", compression="snappy", index=False)
+            pq.write_table(table, output_path, compression="snappy")
 
             # Track with DVC if enabled
             self._track_with_dvc(output_path)
 
         return output_path
 
-    def load_chunks(self, notebook_id: str) -> list[EmbeddedChunk]:
-        """Load chunks for a notebook from Parquet.
+    def load_table(self, notebook_id: str) -> "pa.Table":
+        """Read a notebook's Parquet file as an Arrow table, without pandas.
 
         Args:
             notebook_id: Notebook ID
 
         Returns:
-            List of embedded chunks
+            Table with one row per chunk (no columns for an empty notebook)
 
         Raises:
             FileNotFoundError: If notebook not found
+            ValueError: If the file was written with a newer chunk schema
         """
-        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.parquet as pq
 
         parquet_path = self.version_path / f"{notebook_id}.parquet"
 
         if not parquet_path.exists():
             raise FileNotFoundError(f"Notebook {notebook_id!r} not found in {self.version_path}")
 
-        df = pd.read_parquet(parquet_path, engine="pyarrow")
+        table = pq.read_table(parquet_path)
+        version = schema_version(table.schema)
+        if version > CHUNK_SCHEMA_VERSION:
+            raise ValueError(
+                f"{parquet_path} uses chunk schema version {version}; "
+                f"this version reads up to {CHUNK_SCHEMA_VERSION}"
+            )
+        return table if len(table) else pa.table({})
 
-        if df.empty:
-            return []
+    def load_columns(self, notebook_id: str) -> ChunkColumns:
+        """Load a notebook's chunks as a vector matrix plus metadata columns.
 
-        # Reconstruct EmbeddedChunk objects
-        chunks = []
-        for _, row in df.iterrows():
-            # Handle tags carefully - Parquet returns numpy arrays for lists
-            tags_value = row["tags"]
-            # Check if it's None or a scalar NaN before trying list conversion
-            tags: list[str] = []
-            try:
-                if tags_value is None:
-                    tags = []
-                elif isinstance(tags_value, float) and pd.isna(tags_value):
-                    tags = []
-                else:
-                    # Convert numpy array or list to list
-                    tags = list(tags_value)
-            except (TypeError, ValueError):
-                tags = []
+        Vectors are validated for the whole matrix at once; no per-row objects
+        are built until rows of the result are accessed. The other columns are
+        cast to `row_schema()` whatever schema version the file was written with.
 
-            metadata = ChunkMetadata(
-                notebook_id=row["notebook_id"],
-                notebook_name=row["notebook_name"],
-                page_id=row["page_id"],
-                page_title=row["page_title"],
-                entry_id=row["entry_id"],
-                entry_type=row["entry_type"],
-                author=row["author"],
-                date=row["date"],
-                folder_path=row["folder_path"] if pd.notna(row["folder_path"]) else None,
-                tags=tags,
-                labarchives_url=row["labarchives_url"],
-                embedding_version=row["embedding_version"],
-            )
+        Args:
+            notebook_id: Notebook ID
 
-            chunk = EmbeddedChunk(
-                id=row["id"],
-                text=row["text"],
-                vector=row["vector"],
-                metadata=metadata,
-            )
-            chunks.append(chunk)
+        Returns:
+            Columnar chunks
+
+        Raises:
+            FileNotFoundError: If notebook not found
+            ValueError: If stored vectors are ragged, unsupported or not finite
+        """
+        import numpy as np
+
+        table = self.load_table(notebook_id)
+        if not len(table):
+            return ChunkColumns(table, np.zeros((0, 0)))
+
+        vectors = vector_matrix(table.column("vector"))
+        ids = table.column("id").to_pylist()
+        validate_vectors(vectors, ids)
+        schema = row_schema()
+        columns = ChunkColumns(table.select(schema.names).cast(schema), vectors)
+        columns._ids = ids
+        return columns
+
+    def load_chunks(self, notebook_id: str) -> list[EmbeddedChunk]:
+        """Load chunks for a notebook from Parquet as `EmbeddedChunk` objects.
+
+        Builds one object per row from `load_columns`; bulk readers should use
+        `load_columns` directly.
+
+        Args:
+            notebook_id: Notebook ID
+
+        Returns:
+            List of embedded chunks
 
-        return chunks
+        Raises:
+            FileNotFoundError: If notebook not found
+        """
+        return list(self.load_columns(notebook_id))
 
     def list_notebooks(self) -> list[str]:
         """List all notebook IDs with saved embeddings.
@@ -580,3 +872,48 @@ class LocalPersistence:
             import warnings
 
             warnings.warn(f"DVC tracking failed for {file_path}: {e}", UserWarning, stacklevel=2)
+
+
+def create_vector_index(config: "IndexConfig", embedding_version: str) -> VectorIndex:
+    """Factory function to create a vector index based on the backend config.
+
+    Args:
+        config: Index configuration
+        embedding_version: Embedding version whose local Parquet files to load
+
+    Returns:
+        Vector index implementation
+
+    Example:
+        >>> config = IndexConfig(backend="local", index_name="labarchives")
+        >>> index = create_vector_index(config, embedding_version="v1")
+    """
+    if config.backend == "pinecone":
+        return PineconeIndex(
+            index_name=config.index_name,
+            api_key=config.api_key or "",
+            environment=config.environment or "us-east-1",
+            namespace=config.namespace,
+        )
+    elif config.backend == "qdrant":
+        return QdrantIndex(
+            collection_name=config.index_name, url=config.url or "", api_key=config.api_key
+        )
+    elif config.backend == "local":
+        from vector_backend.local_index import LocalVectorIndex
+
+        persistence = LocalPersistence(Path(config.local_path), version=embedding_version)
+        return LocalVectorIndex(
+            persistence,
+            compact_threshold=config.compact_threshold,
+            ann=None if config.ann == "none" else config.ann,
+            nlist=config.nlist,
+            nprobe=config.nprobe,
+            ann_min_rows=config.ann_min_rows,
+            quantization=None if config.quantization == "none" else config.quantization,
+            rescore_factor=config.rescore_factor,
+        )
+    else:
+        raise ValueError(
+            f"Unknown index backend {config.backend!r}. Expected 'pinecone', 'qdrant' or 'local'"
+        )
@@ -0,0 +1,174 @@
+"""Inverted-file (IVF) approximate nearest-neighbour search for the local index.
+
+Brute-force search over the whole matrix is linear in the corpus size. An IVF
+index partitions the normalised vectors with spherical k-means into `nlist`
+cells; a query scores the centroids first and then only the rows of its
+`nprobe` closest cells. Raising `nprobe` trades speed for recall, and
+`nprobe == nlist` is an exact search.
+
+Rows are identified by their position in the matrix of `LocalVectorIndex`,
+so the index only stores one cell number per row plus the centroids. Instances
+are immutable: `keep` and `add` return a new index, which lets searches keep
+using a snapshot while the matrix is compacted.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import numpy as np
+
+# Rows scored against the centroids at once (bounds the temporary score matrix)
+ASSIGN_BLOCK_ROWS = 65536
+
+
+def default_nlist(rows: int) -> int:
+    """Return the usual `4 * sqrt(rows)` cell count (at least 1)."""
+    return max(1, int(4 * math.sqrt(rows)))
+
+
+def assign_to_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Return the index of the most similar centroid for every row."""
+    labels = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_BLOCK_ROWS):
+        block = vectors[start : start + ASSIGN_BLOCK_ROWS]
+        labels[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def spherical_kmeans(
+    vectors: np.ndarray, k: int, *, iterations: int = 20, seed: int = 0
+) -> np.ndarray:
+    """Cluster unit-length rows by cosine similarity and return unit centroids.
+
+    Empty clusters are re-seeded with random rows; iteration stops early once
+    no row changes cluster.
+    """
+    rng = np.random.default_rng(seed)
+    k = max(1, min(k, len(vectors)))
+    centroids = vectors[rng.choice(len(vectors), k, replace=False)].astype(np.float32)
+    labels: np.ndarray | None = None
+    for _ in range(iterations):
+        new_labels = assign_to_centroids(vectors, centroids)
+        if labels is not None and np.array_equal(labels, new_labels):
+            break
+        labels = new_labels
+
+        counts = np.bincount(labels, minlength=k)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        filled = counts > 0
+        sums = np.zeros_like(centroids)
+        sums[filled] = np.add.reduceat(
+            vectors[np.argsort(labels, kind="stable")], starts[filled], axis=0
+        )
+        norms = np.linalg.norm(sums, axis=1)
+        moved = norms > 0
+        centroids[moved] = sums[moved] / norms[moved, None]
+        empty = np.flatnonzero(~filled)
+        if len(empty):
+            centroids[empty] = vectors[rng.choice(len(vectors), len(empty))]
+    return centroids
+
+
+class IVFIndex:
+    """Centroids plus the cell of every matrix row, grouped for fast probing.
+
+    Attributes:
+        centroids: Unit-length cell centroids, shape (nlist, dim)
+        assignments: Cell number of every matrix row
+        trained_rows: Number of rows the centroids were trained on
+    """
+
+    def __init__(self, centroids: np.ndarray, assignments: np.ndarray, trained_rows: int) -> None:
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.assignments = np.asarray(assignments, dtype=np.int32)
+        self.trained_rows = trained_rows
+        # Rows sorted by cell, with cell c at order[offsets[c]:offsets[c + 1]]
+        self._order = np.argsort(self.assignments, kind="stable")
+        counts = np.bincount(self.assignments, minlength=self.nlist)
+        self._offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    @property
+    def nlist(self) -> int:
+        """Number of cells."""
+        return len(self.centroids)
+
+    @property
+    def size(self) -> int:
+        """Number of indexed rows."""
+        return len(self.assignments)
+
+    @classmethod
+    def train(
+        cls,
+        vectors: np.ndarray,
+        nlist: int | None = None,
+        *,
+        sample_size: int | None = None,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> IVFIndex:
+        """Train centroids on (a sample of) unit-length `vectors` and index all of them.
+
+        Args:
+            vectors: Normalised float32 rows
+            nlist: Number of cells (default `default_nlist(len(vectors))`)
+            sample_size: Rows used for k-means (default 64 per cell)
+            iterations: Maximum k-means iterations
+            seed: Seed for sampling and initial centroids
+        """
+        nlist = nlist or default_nlist(len(vectors))
+        sample_size = sample_size or 64 * nlist
+        sample = vectors
+        if len(vectors) > sample_size:
+            rng = np.random.default_rng(seed)
+            sample = vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))]
+        centroids = spherical_kmeans(sample, nlist, iterations=iterations, seed=seed)
+        return cls(centroids, assign_to_centroids(vectors, centroids), len(vectors))
+
+    def add(self, vectors: np.ndarray) -> IVFIndex:
+        """Return an index with `vectors` appended as new rows, without retraining."""
+        if not len(vectors):
+            return self
+        assignments = np.concatenate(
+            [self.assignments, assign_to_centroids(vectors, self.centroids)]
+        )
+        return IVFIndex(self.centroids, assignments, self.trained_rows)
+
+    def keep(self, rows: np.ndarray) -> IVFIndex:
+        """Return an index of only the given rows, renumbered in the order given."""
+        return IVFIndex(self.centroids, self.assignments[rows], self.trained_rows)
+
+    def reassign(self, vectors: np.ndarray) -> IVFIndex:
+        """Return an index of `vectors` that reuses these centroids."""
+        return IVFIndex(
+            self.centroids, assign_to_centroids(vectors, self.centroids), self.trained_rows
+        )
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """Return the rows of the `nprobe` cells closest to a unit-length query."""
+        nprobe = min(max(1, nprobe), self.nlist)
+        scores = self.centroids @ query
+        cells = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        return np.concatenate([self._order[self._offsets[c] : self._offsets[c + 1]] for c in cells])
+
+    def save(self, path: Path, ids: list[str]) -> None:
+        """Write the index, keyed by the chunk ID of every row, to an `.npz` file."""
+        tmp = path.with_name(f".{path.name}.tmp")
+        with tmp.open("wb") as f:
+            np.savez(
+                f,
+                centroids=self.centroids,
+                assignments=self.assignments,
+                trained_rows=np.int64(self.trained_rows),
+                ids=np.asarray(ids, dtype=str),
+            )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> tuple[IVFIndex, list[str]]:
+        """Read an index written by `save` and the chunk IDs of its rows."""
+        with np.load(path, allow_pickle=False) as data:
+            index = cls(data["centroids"], data["assignments"], int(data["trained_rows"]))
+            return index, data["ids"].tolist()
@@ -0,0 +1,618 @@
+"""In-process vector index over `LocalPersistence` Parquet files.
+
+`LocalVectorIndex` answers searches without any network service, for air-gapped
+use and to avoid a round-trip per query:
+
+- All chunks of an embedding version are loaded into one contiguous float32
+  matrix whose rows are normalised once, so cosine similarity is a single
+  matrix-vector product and top-k selection is an `argpartition`.
+- Metadata filters are equality masks over dictionary-encoded columns, built
+  once per (field, value) and reused until the next compaction.
+- `upsert` and `delete` never rewrite the matrix: replaced or deleted rows are
+  tombstoned and new chunks go to an append buffer that is searched alongside
+  it. Once the buffer or the tombstones grow past a threshold the index is
+  compacted into a new matrix and the touched notebooks are written back
+  through `LocalPersistence`.
+- With `ann="ivf"` and at least `ann_min_rows` rows, searches only score the
+  rows of the `nprobe` nearest IVF cells (see `vector_backend.ivf`). The IVF
+  index is saved next to the Parquet files, new rows are added to it at each
+  compaction, and it is retrained once the corpus outgrows its training set
+  by `retrain_growth`.
+- With `quantization="int8"` or `"binary"`, searches scan compact codes (see
+  `vector_backend.quantization`) and rescore only the best
+  `limit * rescore_factor` rows in float32. The float32 matrix is then kept in
+  a memory-mapped file next to the Parquet files instead of in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, cast
+
+import numpy as np
+
+from vector_backend.index import ChunkColumns, LocalPersistence, MetadataColumns, VectorIndex
+from vector_backend.ivf import IVFIndex
+from vector_backend.models import (
+    EmbeddedChunk,
+    IndexStats,
+    SearchRequest,
+    SearchResult,
+)
+from vector_backend.quantization import (
+    QUANTIZERS,
+    Quantizer,
+    create_quantizer,
+    rescored_top_k,
+)
+from vector_backend.similarity import normalize_rows, top_k_indices
+
+# ChunkMetadata fields that `SearchRequest.filters` may constrain
+FILTER_FIELDS = frozenset(
+    {
+        "notebook_id",
+        "notebook_name",
+        "page_id",
+        "page_title",
+        "entry_id",
+        "entry_type",
+        "author",
+        "folder_path",
+        "embedding_version",
+    }
+)
+
+
+class _ColumnCodes:
+    """Dictionary-encoded metadata column for vectorised equality masks."""
+
+    def __init__(self, values: Sequence[str | None]) -> None:
+        import pandas as pd
+
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=True)
+        self.codes = codes.astype(np.int32, copy=False)
+        self.code_of = {value: code for code, value in enumerate(uniques)}
+
+    def mask(self, value: str | None) -> np.ndarray:
+        code = -1 if value is None else self.code_of.get(value)
+        if code is None:
+            return np.zeros(len(self.codes), dtype=bool)
+        return cast(np.ndarray, self.codes == code)
+
+    def values(self, rows: np.ndarray) -> set[str]:
+        """Return the distinct non-null values of the rows selected by a boolean mask."""
+        uniques = list(self.code_of)
+        return {uniques[code] for code in np.unique(self.codes[rows]) if code >= 0}
+
+
+class _MainRows(NamedTuple):
+    """The compacted rows of the index, captured together for a consistent read."""
+
+    ids: list[str]
+    texts: list[str]
+    metadata: MetadataColumns
+    matrix: np.ndarray
+    norms: np.ndarray
+    ivf: IVFIndex | None
+    codes: np.ndarray | None
+    quantizer: Quantizer | None
+
+    def chunk(self, row: int) -> EmbeddedChunk:
+        vector = self.matrix[row] * self.norms[row]
+        # Rows were validated when they were stored; skip re-validating every float
+        return EmbeddedChunk.model_construct(
+            id=self.ids[row],
+            text=self.texts[row],
+            vector=vector.tolist(),
+            metadata=self.metadata[row],
+        )
+
+
+class LocalVectorIndex(VectorIndex):
+    """Cosine-similarity index held in memory, exact or via IVF and compact codes.
+
+    The Parquet files of `persistence` are loaded on first use. Searches run in a
+    worker thread on a snapshot of the index, so upserts may proceed meanwhile.
+
+    Attributes:
+        persistence: Storage the index is loaded from and written back to
+        compact_threshold: Buffered chunks that trigger a compaction
+        tombstone_ratio: Fraction of dead matrix rows that triggers a compaction
+        persist: Write touched notebooks (and the IVF index) back when compacting;
+            with quantization, also keep the float32 matrix in a memory-mapped file
+        ann: Approximate search engine ("ivf"), or None for exact search only
+        nlist: IVF cell count (default `4 * sqrt(rows)`)
+        nprobe: IVF cells scored per query; higher is slower with better recall
+        ann_min_rows: Matrix rows below which search stays exact
+        retrain_growth: Retrain IVF centroids once rows exceed this multiple of
+            the rows they were trained on
+        quantization: Compact codes scanned before rescoring ("int8" or "binary"),
+            or None to scan float32 rows
+        rescore_factor: Code-ranked candidates rescored in float32 per result
+        compactions: Number of compactions performed
+    """
+
+    def __init__(
+        self,
+        persistence: LocalPersistence,
+        *,
+        compact_threshold: int = 1024,
+        tombstone_ratio: float = 0.25,
+        persist: bool = True,
+        ann: str | None = None,
+        nlist: int | None = None,
+        nprobe: int = 8,
+        ann_min_rows: int = 10_000,
+        retrain_growth: float = 4.0,
+        quantization: str | None = None,
+        rescore_factor: int = 4,
+    ) -> None:
+        if ann not in (None, "ivf"):
+            raise ValueError(f"Unknown ANN engine {ann!r}. Expected 'ivf' or None")
+        if quantization is not None and quantization not in QUANTIZERS:
+            raise ValueError(
+                f"Unknown quantization {quantization!r}. Expected one of {sorted(QUANTIZERS)}"
+            )
+        self.persistence = persistence
+        self.compact_threshold = max(1, compact_threshold)
+        self.tombstone_ratio = tombstone_ratio
+        self.persist = persist
+        self.ann = ann
+        self.nlist = nlist
+        self.nprobe = max(1, nprobe)
+        self.ann_min_rows = ann_min_rows
+        self.retrain_growth = retrain_growth
+        self.quantization = quantization
+        self.rescore_factor = max(1, rescore_factor)
+        self.compactions = 0
+        self.last_updated = datetime.now()
+
+        self._loaded = False
+        self._dim: int | None = None
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: list[str] = []
+        self._texts: list[str] = []
+        self._metadata = MetadataColumns.empty()
+        self._rows: dict[str, int] = {}
+        self._columns: dict[str, _ColumnCodes] = {}
+        self._masks: dict[tuple[str, str | None], np.ndarray] = {}
+        self._tombstones = 0
+        self._buffer: dict[str, EmbeddedChunk] = {}
+        self._buffer_matrix: np.ndarray | None = None
+        self._dirty_notebooks: set[str] = set()
+        self._ivf: IVFIndex | None = None
+        self._codes: np.ndarray | None = None
+        self._quantizer: Quantizer | None = None
+
+    @property
+    def ivf_path(self) -> Path:
+        """File the IVF index is persisted to, next to the Parquet files."""
+        return self.persistence.version_path / "ivf.npz"
+
+    @property
+    def vectors_path(self) -> Path:
+        """File the float32 matrix is memory-mapped from when quantization is enabled."""
+        return self.persistence.version_path / "vectors.f32.npy"
+
+    def load(self) -> None:
+        """(Re)load every notebook of the persistence version into the matrix.
+
+        Notebooks are read as columns, so no per-chunk objects are built.
+        """
+        columns = ChunkColumns.concat(
+            self.persistence.load_columns(notebook_id)
+            for notebook_id in sorted(self.persistence.list_notebooks())
+        )
+        self._set_main(columns.ids, columns.texts, columns.metadata, columns.vectors)
+        self._buffer.clear()
+        self._buffer_matrix = None
+        self._dirty_notebooks.clear()
+        self._ivf = self._load_ivf()
+        self._loaded = True
+
+    def _wants_ivf(self) -> bool:
+        return self.ann == "ivf" and len(self._ids) >= max(1, self.ann_min_rows)
+
+    def _train_ivf(self) -> IVFIndex:
+        return IVFIndex.train(self._matrix, self.nlist)
+
+    def _load_ivf(self) -> IVFIndex | None:
+        """Reuse the persisted IVF index if it still fits the matrix, else train one."""
+        if not self._wants_ivf():
+            return None
+        ivf: IVFIndex | None = None
+        if self.ivf_path.exists():
+            try:
+                ivf, ids = IVFIndex.load(self.ivf_path)
+            except (OSError, ValueError, KeyError):
+                ivf = None
+            if ivf is not None and (
+                ivf.centroids.shape[1] != self._dim
+                or len(self._ids) > self.retrain_growth * ivf.trained_rows
+            ):
+                ivf = None
+            if ivf is not None and ids == self._ids:
+                return ivf
+        ivf = ivf.reassign(self._matrix) if ivf is not None else self._train_ivf()
+        if self.persist:
+            ivf.save(self.ivf_path, self._ids)
+        return ivf
+
+    def train_ann(self) -> None:
+        """(Re)train the IVF index on the current matrix, e.g. after changing `nlist`."""
+        self._ensure_loaded()
+        self._ivf = self._train_ivf() if self._wants_ivf() else None
+        if self.persist and self._ivf is not None:
+            self._ivf.save(self.ivf_path, self._ids)
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def _set_main(
+        self,
+        ids: list[str],
+        texts: list[str],
+        metadata: MetadataColumns,
+        vectors: np.ndarray,
+    ) -> None:
+        if len(ids):
+            self._matrix, self._norms = normalize_rows(
+                np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1)
+            )
+            self._dim = self._matrix.shape[1]
+        else:
+            self._matrix = np.zeros((0, self._dim or 0), dtype=np.float32)
+            self._norms = np.zeros(0, dtype=np.float32)
+        self._codes = self._quantizer = None
+        if self.quantization is not None and len(ids):
+            self._quantizer = create_quantizer(self.quantization, self._matrix)
+            self._codes = self._quantizer.encode(self._matrix)
+            if self.persist:
+                self._matrix = self._map_matrix(self._matrix)
+        self._alive = np.ones(len(ids), dtype=bool)
+        self._ids, self._texts, self._metadata = ids, texts, metadata
+        self._rows = {chunk_id: row for row, chunk_id in enumerate(ids)}
+        self._columns = {}
+        self._masks = {}
+        self._tombstones = 0
+
+    def _map_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """Write the matrix to `vectors_path` and return a read-only memory map of it.
+
+        Searches still holding the previous map keep reading the replaced file.
+        """
+        tmp = self.vectors_path.with_name(f".{self.vectors_path.name}.tmp")
+        with tmp.open("wb") as f:
+            np.save(f, matrix)
+        tmp.replace(self.vectors_path)
+        return cast(np.ndarray, np.load(self.vectors_path, mmap_mode="r"))
+
+    def _column_codes(self, field: str) -> _ColumnCodes:
+        column = self._columns.get(field)
+        if column is None:
+            column = _ColumnCodes(self._metadata.column(field))
+            self._columns[field] = column
+        return column
+
+    def _column_mask(self, field: str, value: str | None) -> np.ndarray:
+        key = (field, value)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._column_codes(field).mask(value)
+            self._masks[key] = mask
+        return mask
+
+    def _filter_mask(self, filters: dict[str, str] | None) -> np.ndarray:
+        mask = self._alive.copy()
+        for field, value in (filters or {}).items():
+            mask &= self._column_mask(field, value)
+        return mask
+
+    @staticmethod
+    def _check_filters(filters: dict[str, str] | None) -> None:
+        unknown = set(filters or {}) - FILTER_FIELDS
+        if unknown:
+            raise ValueError(f"Unsupported filter fields: {sorted(unknown)}")
+
+    def _snapshot(self) -> _MainRows:
+        return _MainRows(
+            self._ids,
+            self._texts,
+            self._metadata,
+            self._matrix,
+            self._norms,
+            self._ivf,
+            self._codes,
+            self._quantizer,
+        )
+
+    def _main_chunk(self, row: int) -> EmbeddedChunk:
+        return self._snapshot().chunk(row)
+
+    def _buffered(self) -> tuple[list[EmbeddedChunk], np.ndarray]:
+        chunks = list(self._buffer.values())
+        if self._buffer_matrix is None or len(self._buffer_matrix) != len(chunks):
+            vectors = np.asarray([chunk.vector for chunk in chunks], dtype=np.float32)
+            self._buffer_matrix = normalize_rows(vectors.reshape(len(chunks), self._dim or 0))[0]
+        return chunks, self._buffer_matrix
+
+    async def upsert(self, chunks: list[EmbeddedChunk]) -> None:
+        """Insert or replace chunks (buffered until the next compaction).
+
+        Raises:
+            ValueError: If the list is empty or a vector has the wrong dimension
+        """
+        if not chunks:
+            raise ValueError("Cannot upsert empty chunk list")
+        self._ensure_loaded()
+        for chunk in chunks:
+            if self._dim is None:
+                self._dim = len(chunk.vector)
+            elif len(chunk.vector) != self._dim:
+                raise ValueError(
+                    f"Chunk {chunk.id!r} has {len(chunk.vector)} dimensions, index has {self._dim}"
+                )
+        for chunk in chunks:
+            self._remove(chunk.id)
+            self._buffer[chunk.id] = chunk
+            self._dirty_notebooks.add(chunk.metadata.notebook_id)
+        self._buffer_matrix = None
+        self.last_updated = datetime.now()
+        await self._maybe_compact()
+
+    async def delete(self, chunk_ids: list[str]) -> None:
+        """Delete chunks by ID (tombstoned until the next compaction)."""
+        if not chunk_ids:
+            return
+        self._ensure_loaded()
+        for chunk_id in chunk_ids:
+            self._remove(chunk_id)
+        self._buffer_matrix = None
+        self.last_updated = datetime.now()
+        await self._maybe_compact()
+
+    def _remove(self, chunk_id: str) -> None:
+        buffered = self._buffer.pop(chunk_id, None)
+        if buffered is not None:
+            self._dirty_notebooks.add(buffered.metadata.notebook_id)
+        row = self._rows.get(chunk_id)
+        if row is not None and self._alive[row]:
+            self._alive[row] = False
+            self._tombstones += 1
+            self._dirty_notebooks.add(self._metadata.column("notebook_id")[row])
+
+    async def _maybe_compact(self) -> None:
+        too_many_dead = self._tombstones > self.tombstone_ratio * max(1, len(self._ids))
+        if len(self._buffer) >= self.compact_threshold or too_many_dead:
+            await self.compact()
+
+    async def compact(self) -> None:
+        """Fold the append buffer into the matrix, drop tombstones and persist changes."""
+        self._ensure_loaded()
+        live = np.flatnonzero(self._alive)
+        chunks, buffer_matrix = self._buffered()
+        buffer_norms = np.asarray(
+            [np.linalg.norm(np.asarray(chunk.vector, dtype=np.float32)) for chunk in chunks],
+            dtype=np.float32,
+        )
+        dim = self._dim or 0
+        vectors = np.concatenate(
+            [
+                (self._matrix[live] * self._norms[live][:, None]).reshape(len(live), dim),
+                buffer_matrix.reshape(len(chunks), dim) * buffer_norms[:, None],
+            ]
+        )
+        ivf = self._ivf
+        self._set_main(
+            [self._ids[row] for row in live] + [chunk.id for chunk in chunks],
+            [self._texts[row] for row in live] + [chunk.text for chunk in chunks],
+            self._metadata.take(live).extend(chunks),
+            vectors,
+        )
+        self._buffer.clear()
+        self._buffer_matrix = None
+        self.compactions += 1
+
+        if not self._wants_ivf():
+            self._ivf = None
+        elif ivf is None or len(self._ids) > self.retrain_growth * ivf.trained_rows:
+            self._ivf = await asyncio.to_thread(self._train_ivf)
+        else:
+            # Incremental insertion: new rows join their nearest existing cell
+            self._ivf = ivf.keep(live).add(self._matrix[len(live) :])
+
+        dirty, self._dirty_notebooks = self._dirty_notebooks, set()
+        if self.persist and dirty:
+            snapshot = {
+                notebook_id: [
+                    self._main_chunk(int(row))
+                    for row in np.flatnonzero(self._column_mask("notebook_id", notebook_id))
+                ]
+                for notebook_id in sorted(dirty)
+            }
+            await asyncio.to_thread(self._write_notebooks, snapshot, self._ivf, self._ids)
+
+    def _write_notebooks(
+        self,
+        snapshot: dict[str, list[EmbeddedChunk]],
+        ivf: IVFIndex | None,
+        ids: list[str],
+    ) -> None:
+        for notebook_id, chunks in snapshot.items():
+            self.persistence.save_chunks(notebook_id, chunks)
+        if ivf is not None:
+            ivf.save(self.ivf_path, ids)
+
+    async def search(
+        self, request: SearchRequest, query_vector: list[float] | None = None
+    ) -> list[SearchResult]:
+        """Return the chunks most similar to `query_vector`.
+
+        Args:
+            request: Limit, minimum score and optional metadata equality filters
+            query_vector: Pre-computed query embedding
+
+        Raises:
+            ValueError: Missing or mis-sized query vector, or unsupported filter field
+        """
+        if query_vector is None:
+            raise ValueError("query_vector must be provided")
+        self._check_filters(request.filters)
+        self._ensure_loaded()
+        if self._dim is None:
+            return []
+        query = np.asarray(query_vector, dtype=np.float32)
+        if query.shape != (self._dim,):
+            raise ValueError(f"Query has {query.size} dimensions, index has {self._dim}")
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+        query = query / norm
+
+        # Snapshot on the event loop; the scan runs in a thread
+        main = self._snapshot()
+        mask = self._filter_mask(request.filters)
+        buffered, buffer_matrix = self._buffered()
+        keep = [
+            i
+            for i, chunk in enumerate(buffered)
+            if all(getattr(chunk.metadata, f) == v for f, v in (request.filters or {}).items())
+        ]
+        hits = await asyncio.to_thread(
+            self._scan,
+            query,
+            request.limit,
+            main,
+            mask,
+            buffer_matrix[keep],
+            self.nprobe,
+            self.rescore_factor,
+        )
+
+        results: list[SearchResult] = []
+        for score, source, index in hits:
+            if score < request.min_score:
+                break
+            chunk = main.chunk(index) if source == 0 else buffered[keep[index]]
+            results.append(
+                SearchResult(chunk=chunk, score=min(1.0, max(0.0, score)), rank=len(results) + 1)
+            )
+        return results
+
+    @staticmethod
+    def _scan(
+        query: np.ndarray,
+        limit: int,
+        main: _MainRows,
+        mask: np.ndarray,
+        buffer_matrix: np.ndarray,
+        nprobe: int = 1,
+        rescore_factor: int = 1,
+    ) -> list[tuple[float, int, int]]:
+        """Return (score, 0 for matrix / 1 for buffer, index) of the best hits."""
+        hits: list[tuple[float, int, int]] = []
+        matrix = main.matrix
+        if len(matrix):
+            rows: np.ndarray | None = None
+            if main.ivf is not None:
+                rows = main.ivf.candidates(query, nprobe)
+                rows = rows[mask[rows]]
+            elif main.quantizer is not None and not mask.all():
+                rows = np.flatnonzero(mask)
+
+            if main.quantizer is not None and main.codes is not None:
+                found, scores = rescored_top_k(
+                    query, matrix, main.codes, main.quantizer, limit, rescore_factor, rows
+                )
+            elif rows is None:
+                scores = np.where(mask, matrix @ query, -np.inf)
+                found = top_k_indices(scores, limit)
+                scores = scores[found]
+            else:
+                scores = matrix[rows] @ query
+                best = top_k_indices(scores, limit)
+                found, scores = rows[best], scores[best]
+            hits += [(float(score), 0, int(row)) for score, row in zip(scores, found, strict=True)]
+        if len(buffer_matrix):
+            scores = buffer_matrix @ query
+            hits += [(float(scores[i]), 1, int(i)) for i in top_k_indices(scores, limit)]
+        hits.sort(key=lambda hit: -hit[0])
+        return hits[:limit]
+
+    def evaluate_recall(
+        self, queries: int = 100, k: int = 10, *, seed: int = 0
+    ) -> dict[str, float]:
+        """Measure recall@k of the configured search path against exact search.
+
+        Stored rows are sampled as queries, and the IVF/quantised scan used by
+        `search` is compared with a brute-force float32 scan of the matrix.
+
+        Args:
+            queries: Number of sampled query rows
+            k: Neighbours compared per query
+            seed: Seed for sampling the queries
+
+        Returns:
+            `recall_at_k`, the number of `queries` evaluated, the in-memory
+            `bytes_per_vector` scanned and its `compression` relative to float32
+        """
+        self._ensure_loaded()
+        main = self._snapshot()
+        rows = len(main.matrix)
+        dim = self._dim or 0
+        if main.quantizer is not None:
+            bytes_per_vector = main.quantizer.bytes_per_vector(dim)
+        else:
+            bytes_per_vector = 4 * dim
+        stats: dict[str, float] = {
+            "recall_at_k": 1.0,
+            "queries": 0,
+            "bytes_per_vector": bytes_per_vector,
+            "compression": 4 * dim / bytes_per_vector if bytes_per_vector else 1.0,
+        }
+        if not rows:
+            return stats
+
+        rng = np.random.default_rng(seed)
+        sample = rng.choice(rows, min(queries, rows), replace=False)
+        everything = np.ones(rows, dtype=bool)
+        no_buffer = np.zeros((0, dim), dtype=np.float32)
+        found = 0
+        for row in sample:
+            query = np.asarray(main.matrix[row], dtype=np.float32)
+            exact = set(top_k_indices(main.matrix @ query, k).tolist())
+            hits = self._scan(
+                query, k, main, everything, no_buffer, self.nprobe, self.rescore_factor
+            )
+            found += len(exact & {index for _, _, index in hits})
+        stats["recall_at_k"] = found / (min(k, rows) * len(sample))
+        stats["queries"] = len(sample)
+        return stats
+
+    async def stats(self) -> IndexStats:
+        """Return live chunk and notebook counts and on-disk size."""
+        self._ensure_loaded()
+        notebooks = self._column_codes("notebook_id").values(self._alive)
+        notebooks.update(chunk.metadata.notebook_id for chunk in self._buffer.values())
+        size = sum(path.stat().st_size for path in self.persistence.version_path.glob("*.parquet"))
+        return IndexStats(
+            total_chunks=int(self._alive.sum()) + len(self._buffer),
+            total_notebooks=len(notebooks),
+            embedding_version=self.persistence.version,
+            last_updated=self.last_updated,
+            storage_size_mb=size / (1024 * 1024),
+        )
+
+    async def health_check(self) -> bool:
+        """Return True if the Parquet files could be loaded."""
+        try:
+            self._ensure_loaded()
+        except Exception:
+            return False
+        return True
@@ -8,6 +8,10 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+# Supported embedding dimensions (EmbeddedChunk.vector length)
+MIN_VECTOR_DIM = 768
+MAX_VECTOR_DIM = 3072
+
 
 class ChunkMetadata(BaseModel):
     """Metadata for a single text chunk from LabArchives.
@@ -70,7 +74,7 @@ class EmbeddedChunk(BaseModel):
 
     id: str
     text: str = Field(min_length=1, max_length=5000)
-    vector: list[float] = Field(min_length=768, max_length=3072)
+    vector: list[float] = Field(min_length=MIN_VECTOR_DIM, max_length=MAX_VECTOR_DIM)
     metadata: ChunkMetadata
 
     @field_validator("id")
@@ -3,17 +3,139 @@
 Combines text extraction, chunking, embedding, and vector indexing.
 """
 
+import asyncio
+import multiprocessing
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from functools import cache
+from typing import Any, Protocol
 
 from loguru import logger
 
-from vector_backend.chunking import ChunkingConfig, RecursiveTokenChunker
+from vector_backend.chunking import Chunker, ChunkingConfig, create_chunker
+from vector_backend.config import IndexingConfig
 from vector_backend.embedding import EmbeddingClient
 from vector_backend.index import VectorIndex
 from vector_backend.labarchives_indexer import extract_text_from_entry
 from vector_backend.models import ChunkMetadata, EmbeddedChunk
 
+# (entry position on the page, entry id, entry type, cleaned text)
+ExtractedEntry = tuple[int, str, str, str]
+# (entry position on the page, entry id, entry type, chunk index, chunk text)
+ChunkRow = tuple[int, str, str, int, str]
+
+
+@cache
+def _chunker_for(config: ChunkingConfig) -> Chunker:
+    """Return a chunker per config, reused across pages within one process."""
+    return create_chunker(config)
+
+
+def extract_page_entries(
+    entries: list[dict[str, Any]],
+) -> tuple[list[ExtractedEntry], list[int]]:
+    """Extract searchable text from a page's entries (HTML cleaning happens here).
+
+    Args:
+        entries: Page entry dictionaries
+
+    Returns:
+        Tuple of (extracted entries in page order, positions of skipped entries)
+    """
+    extracted: list[ExtractedEntry] = []
+    skipped: list[int] = []
+    for position, entry_dict in enumerate(entries):
+        indexable_entry = extract_text_from_entry(entry_dict)
+        if indexable_entry is None:
+            skipped.append(position)
+            continue
+        extracted.append(
+            (
+                position,
+                indexable_entry.entry_id,
+                indexable_entry.entry_type.value,
+                indexable_entry.text,
+            )
+        )
+    return extracted, skipped
+
+
+def chunk_extracted_entries(
+    extracted: list[ExtractedEntry], chunking_config: ChunkingConfig
+) -> list[ChunkRow]:
+    """Chunk extracted entry text.
+
+    Args:
+        extracted: Output of `extract_page_entries`
+        chunking_config: Configuration for text chunking
+
+    Returns:
+        Chunk rows in page order
+    """
+    chunker = _chunker_for(chunking_config)
+    return [
+        (position, entry_id, entry_type, chunk.chunk_index, chunk.text)
+        for position, entry_id, entry_type, text in extracted
+        for chunk in chunker.chunk(text)
+    ]
+
+
+def prepare_page_chunks(
+    entries: list[dict[str, Any]], chunking_config: ChunkingConfig
+) -> tuple[list[ChunkRow], list[int]]:
+    """Extract text from a page's entries and chunk it.
+
+    This is the CPU-bound part of indexing. It (like its two halves,
+    `extract_page_entries` and `chunk_extracted_entries`) takes and returns only
+    plain data (dicts, tuples, strings) so it can run in a worker process and its
+    results pickle cheaply.
+
+    Args:
+        entries: Page entry dictionaries
+        chunking_config: Configuration for text chunking
+
+    Returns:
+        Tuple of (chunk rows in page order, positions of skipped entries)
+    """
+    extracted, skipped = extract_page_entries(entries)
+    return chunk_extracted_entries(extracted, chunking_config), skipped
+
+
+def create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool suitable for `NotebookIndexer(executor=...)`.
+
+    Uses the "spawn" start method: the server process runs threads (asyncio
+    helpers, HTTP clients), which makes fork-based pools unsafe.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Returns:
+        Process pool executor (the caller is responsible for shutting it down)
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class NotebookSource(Protocol):
+    """Read-only notebook access used by the indexing pipeline (see `LabArchivesClient`)."""
+
+    async def get_notebook_tree(
+        self, uid: str, nbid: str, parent_tree_id: int | str = 0
+    ) -> list[dict[str, Any]]:
+        """Return one level of the notebook tree."""
+        ...
+
+    async def get_page_entries(
+        self, uid: str, nbid: str, page_tree_id: str, /
+    ) -> list[dict[str, Any]]:
+        """Return the entries of one page."""
+        ...
+
 
 class NotebookIndexer:
     """Indexes LabArchives notebook pages into vector store.
@@ -23,6 +145,10 @@ class NotebookIndexer:
     2. Chunk long text
     3. Generate embeddings
     4. Store in vector index
+
+    Steps 1-2 are CPU-bound. When an executor (e.g. from `create_process_pool`) is
+    given, they run there so the event loop stays responsive and pages are
+    processed on multiple cores.
     """
 
     def __init__(
@@ -31,6 +157,7 @@ class NotebookIndexer:
         vector_index: VectorIndex,
         embedding_version: str,
         chunking_config: ChunkingConfig | None = None,
+        executor: Executor | None = None,
     ):
         """Initialize notebook indexer.
 
@@ -39,13 +166,13 @@ class NotebookIndexer:
             vector_index: Vector index for storage
             embedding_version: Version identifier for embeddings
             chunking_config: Configuration for text chunking (uses defaults if None)
+            executor: Optional executor for extraction and chunking (not owned)
         """
         self.embedding_client = embedding_client
         self.vector_index = vector_index
         self.embedding_version = embedding_version
-
-        # Initialize chunker with provided config or defaults
-        self.chunker = RecursiveTokenChunker(chunking_config or ChunkingConfig())
+        self.chunking_config = chunking_config or ChunkingConfig()
+        self.executor = executor
 
     async def index_page(
         self,
@@ -71,7 +198,6 @@ class NotebookIndexer:
                 - skipped_count: Number of entries skipped
                 - page_id: Page ID that was indexed
         """
-        notebook_id = page_data["notebook_id"]
         notebook_name = page_data["notebook_name"]
         page_id = page_data["page_id"]
         page_title = page_data["page_title"]
@@ -81,24 +207,25 @@ class NotebookIndexer:
             f"Indexing page '{page_title}' (ID: {page_id}) " f"from notebook '{notebook_name}'"
         )
 
-        # Extract text from all entries
-        indexable_entries = []
-        skipped_count = 0
+        # Extract text and chunk (in the executor when one is configured)
+        if self.executor is None:
+            rows, skipped = prepare_page_chunks(entries, self.chunking_config)
+        else:
+            loop = asyncio.get_running_loop()
+            rows, skipped = await loop.run_in_executor(
+                self.executor, prepare_page_chunks, entries, self.chunking_config
+            )
 
-        for entry_dict in entries:
-            indexable_entry = extract_text_from_entry(entry_dict)
-            if indexable_entry:
-                indexable_entries.append((indexable_entry, entry_dict))
-            else:
-                skipped_count += 1
-                entry_type = entry_dict.get("part_type", "unknown")
-                logger.info(
-                    f"  Skipped entry {entry_dict.get('eid', 'unknown')[:20]} "
-                    f"(type: {entry_type})"
-                )
+        skipped_count = len(skipped)
+        for position in skipped:
+            entry_dict = entries[position]
+            entry_type = entry_dict.get("part_type", "unknown")
+            logger.info(
+                f"  Skipped entry {entry_dict.get('eid', 'unknown')[:20]} " f"(type: {entry_type})"
+            )
 
         # If no indexable content, return early
-        if not indexable_entries:
+        if not rows:
             logger.warning(f"No indexable content found on page {page_id}")
             return {
                 "indexed_count": 0,
@@ -106,28 +233,106 @@ class NotebookIndexer:
                 "page_id": page_id,
             }
 
-        # Chunk all entries first
-        all_chunks_with_metadata = []
+        # Batch embed all chunks at once
+        all_vectors = await self.embedding_client.embed_batch([row[4] for row in rows])
 
-        for indexable_entry, entry_dict in indexable_entries:
-            # Chunk the text
-            chunks = self.chunker.chunk(indexable_entry.text)
+        embedded_chunks = self._build_embedded_chunks(
+            page_data, rows, all_vectors, author, labarchives_url
+        )
 
-            # Store chunks with their entry metadata for later
-            for chunk in chunks:
-                all_chunks_with_metadata.append((chunk, indexable_entry, entry_dict))
+        # Upsert to vector index
+        if embedded_chunks:
+            await self.vector_index.upsert(embedded_chunks)
+            logger.info(
+                f"Indexed {len(embedded_chunks)} chunks from {len(entries) - skipped_count} "
+                f"entries on page '{page_title}'"
+            )
 
-        # Batch embed all chunks at once
-        all_chunk_texts = [chunk.text for chunk, _, _ in all_chunks_with_metadata]
-        all_vectors = await self.embedding_client.embed_batch(all_chunk_texts)
+        return {
+            "indexed_count": len(embedded_chunks),
+            "skipped_count": skipped_count,
+            "page_id": page_id,
+        }
+
+    async def index_notebook(
+        self,
+        notebook_client: NotebookSource,
+        uid: str,
+        notebook_id: str,
+        *,
+        labarchives_url: str,
+        page_ids: list[str] | None = None,
+        pages: AsyncIterable[dict[str, Any]] | None = None,
+        notebook_name: str | None = None,
+        author: str = "unknown@example.com",
+        entry_filter: Callable[[list[dict[str, Any]]], list[dict[str, Any]]] | None = None,
+        settings: IndexingConfig | None = None,
+    ) -> dict[str, Any]:
+        """Index a whole notebook with a streaming, staged pipeline.
 
-        # Create embedded chunks
+        Pages flow through crawl -> fetch -> extract -> chunk -> embed -> upsert.
+        Stages are connected by bounded queues (`settings.queue_size`), so fetching
+        one page overlaps embedding another and memory stays bounded regardless of
+        notebook size. Each stage runs its own number of workers
+        (`settings.*_concurrency`). A failure on one page drops that page and is
+        reported in `errors`; a failure to read the notebook root aborts the run.
+
+        Args:
+            notebook_client: Source of tree levels and page entries (e.g. LabArchivesClient)
+            uid: LabArchives user ID
+            notebook_id: LabArchives notebook ID
+            labarchives_url: URL stored in chunk metadata
+            page_ids: Specific pages to index (skips the tree crawl); None for all pages
+            pages: Optional page nodes (`tree_id`, `display_text`), e.g. from a shared
+                `NotebookTreeCrawler.iter_pages`, whose caller reports skipped folders via
+                `on_folder_error`; by default the notebook is crawled with a fresh
+                `NotebookTreeCrawler` and skipped folders land in `errors`
+            notebook_name: Display name stored in chunk metadata
+            author: Author stored in chunk metadata
+            entry_filter: Optional selector applied to each page's entries
+                (e.g. incremental selection); pages left empty are skipped
+            settings: Stage concurrency and queue sizes (defaults if None)
+
+        Returns:
+            Dictionary with indexing statistics:
+                - pages_found / pages_processed: Pages crawled / indexed
+                - indexed_count / skipped_count: Chunks indexed / entries skipped
+                - elapsed_seconds: Wall time of the whole run
+                - stages: Per-stage items, errors, busy/wall seconds, items_per_second
+                - errors: Per-page failures as {"stage", "page_id", "error"}
+        """
+        return await _index_notebook_pipeline(
+            self,
+            notebook_client,
+            uid,
+            notebook_id,
+            page_ids=page_ids,
+            pages=pages,
+            notebook_name=notebook_name or f"Notebook {notebook_id}",
+            author=author,
+            labarchives_url=labarchives_url,
+            entry_filter=entry_filter,
+            settings=settings or IndexingConfig(),
+        )
+
+    def _build_embedded_chunks(
+        self,
+        page_data: dict[str, Any],
+        rows: list[ChunkRow],
+        vectors: list[list[float]],
+        author: str,
+        labarchives_url: str,
+    ) -> list[EmbeddedChunk]:
+        """Attach metadata and vectors to a page's chunk rows."""
+        notebook_id = page_data["notebook_id"]
+        page_id = page_data["page_id"]
+        entries = page_data["entries"]
         embedded_chunks = []
-        for (chunk, indexable_entry, entry_dict), vector in zip(
-            all_chunks_with_metadata, all_vectors, strict=False
+        for (position, entry_id, entry_type, chunk_index, chunk_text), vector in zip(
+            rows, vectors, strict=False
         ):
             # Parse entry date
-            created_at_str = entry_dict.get("created_at", "")
+            created_at_str = entries[position].get("created_at", "")
             try:
                 entry_date = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
             except (ValueError, AttributeError):
@@ -136,11 +341,11 @@ class NotebookIndexer:
             # Create metadata
             metadata = ChunkMetadata(
                 notebook_id=notebook_id,
-                notebook_name=notebook_name,
+                notebook_name=page_data["notebook_name"],
                 page_id=page_id,
-                page_title=page_title,
-                entry_id=indexable_entry.entry_id,
-                entry_type=indexable_entry.entry_type.value,
+                page_title=page_data["page_title"],
+                entry_id=entry_id,
+                entry_type=entry_type,
                 author=author,
                 date=entry_date,
                 labarchives_url=labarchives_url,
@@ -148,54 +353,292 @@ class NotebookIndexer:
             )
 
             # Create embedded chunk
-            chunk_id = f"{notebook_id}_{page_id}_{indexable_entry.entry_id}_{chunk.chunk_index}"
-            embedded_chunk = EmbeddedChunk(
-                id=chunk_id,
-                text=chunk.text,
-                vector=vector,
-                metadata=metadata,
+            chunk_id = f"{notebook_id}_{page_id}_{entry_id}_{chunk_index}"
+            embedded_chunks.append(
+                EmbeddedChunk(id=chunk_id, text=chunk_text, vector=vector, metadata=metadata)
             )
-            embedded_chunks.append(embedded_chunk)
+        return embedded_chunks
 
-        # Upsert to vector index
-        if embedded_chunks:
-            await self.vector_index.upsert(embedded_chunks)
-            logger.info(
-                f"Indexed {len(embedded_chunks)} chunks from {len(indexable_entries)} "
-                f"entries on page '{page_title}'"
-            )
 
+PIPELINE_STAGES = ("crawl", "fetch", "extract", "chunk", "embed", "upsert")
+
+
+@dataclass
+class StageStats:
+    """Throughput counters for one pipeline stage.
+
+    Attributes:
+        name: Stage name
+        items: Pages the stage completed
+        errors: Pages dropped because the stage failed on them
+        busy_seconds: Summed time workers spent processing (may exceed wall time)
+        started_at: Monotonic time the first item started
+        finished_at: Monotonic time the last item finished
+    """
+
+    name: str
+    items: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def wall_seconds(self) -> float:
+        """Time between the first item starting and the last one finishing."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def items_per_second(self) -> float:
+        """Completed pages per second of stage wall time."""
+        wall = self.wall_seconds
+        return self.items / wall if wall > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary."""
         return {
-            "indexed_count": len(embedded_chunks),
-            "skipped_count": skipped_count,
-            "page_id": page_id,
+            "items": self.items,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 4),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "items_per_second": round(self.items_per_second, 2),
         }
 
 
+@dataclass
+class _PageWork:
+    """A page travelling through the pipeline; each stage fills in one field."""
+
+    page_id: str
+    title: str
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    extracted: list[ExtractedEntry] = field(default_factory=list)
+    skipped: list[int] = field(default_factory=list)
+    rows: list[ChunkRow] = field(default_factory=list)
+    vectors: list[list[float]] = field(default_factory=list)
+
+
+_DONE = object()
+
+
+async def _run_stage(
+    stats: StageStats,
+    inbox: "asyncio.Queue[Any]",
+    outbox: "asyncio.Queue[Any]",
+    workers: int,
+    process: Callable[[_PageWork], Awaitable[bool]],
+    errors: list[dict[str, str]],
+) -> None:
+    """Run `workers` consumers of `inbox`, forwarding pages that `process` keeps.
+
+    `process` returns False to drop a page without error (e.g. nothing to index);
+    an exception drops the page and records the error. End of input is signalled by
+    a sentinel, which every worker re-queues for its siblings before exiting.
+    """
+
+    async def worker() -> None:
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                inbox.put_nowait(_DONE)
+                return
+            start = time.monotonic()
+            if stats.started_at is None:
+                stats.started_at = start
+            try:
+                keep = await process(item)
+            except Exception as exc:  # noqa: BLE001 - isolate failures per page
+                stats.errors += 1
+                errors.append({"stage": stats.name, "page_id": item.page_id, "error": str(exc)})
+                logger.warning(f"{stats.name} failed for page {item.page_id}: {exc}")
+                keep = False
+            else:
+                stats.items += 1
+            finally:
+                stats.finished_at = time.monotonic()
+                stats.busy_seconds += stats.finished_at - start
+            if keep:
+                await outbox.put(item)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    await outbox.put(_DONE)
+
+
+async def _index_notebook_pipeline(
+    indexer: NotebookIndexer,
+    notebook_client: NotebookSource,
+    uid: str,
+    notebook_id: str,
+    *,
+    page_ids: list[str] | None,
+    pages: AsyncIterable[dict[str, Any]] | None,
+    notebook_name: str,
+    author: str,
+    labarchives_url: str,
+    entry_filter: Callable[[list[dict[str, Any]]], list[dict[str, Any]]] | None,
+    settings: IndexingConfig,
+) -> dict[str, Any]:
+    stats = {name: StageStats(name) for name in PIPELINE_STAGES}
+    errors: list[dict[str, str]] = []
+    totals = {"pages_processed": 0, "indexed_count": 0, "skipped_count": 0}
+    queues: list[asyncio.Queue[Any]] = [
+        asyncio.Queue(maxsize=settings.queue_size) for _ in PIPELINE_STAGES
+    ]
+    loop = asyncio.get_running_loop()
+
+    async def run_cpu(func: Callable[..., Any], *args: Any) -> Any:
+        if indexer.executor is None:
+            return func(*args)
+        return await loop.run_in_executor(indexer.executor, func, *args)
+
+    async def crawl() -> None:
+        crawl_stats = stats["crawl"]
+        crawl_stats.started_at = time.monotonic()
+        if page_ids is not None:
+            for pid in page_ids:
+                await queues[0].put(_PageWork(page_id=str(pid), title=str(pid)))
+                crawl_stats.items += 1
+        else:
+            nodes = pages
+            if nodes is None:
+                from labarchives_mcp.eln_client import NotebookTreeCrawler
+
+                def folder_failed(folder: int | str, exc: Exception) -> None:
+                    crawl_stats.errors += 1
+                    errors.append({"stage": "crawl", "page_id": str(folder), "error": str(exc)})
+
+                crawler = NotebookTreeCrawler(
+                    notebook_client, concurrency=settings.crawl_concurrency, ttl_seconds=0
+                )
+                nodes = crawler.iter_pages(uid, notebook_id, on_folder_error=folder_failed)
+            async for node in nodes:
+                tree_id = str(node.get("tree_id"))
+                title = node.get("display_text", "") or node.get("name", "") or tree_id
+                await queues[0].put(_PageWork(page_id=tree_id, title=str(title)))
+                crawl_stats.items += 1
+        crawl_stats.finished_at = time.monotonic()
+        await queues[0].put(_DONE)
+
+    async def fetch(page: _PageWork) -> bool:
+        entries = await notebook_client.get_page_entries(uid, notebook_id, page.page_id)
+        page.entries = entry_filter(entries) if entry_filter is not None else entries
+        return bool(page.entries)
+
+    async def extract(page: _PageWork) -> bool:
+        page.extracted, page.skipped = await run_cpu(extract_page_entries, page.entries)
+        return True
+
+    async def chunk(page: _PageWork) -> bool:
+        page.rows = await run_cpu(chunk_extracted_entries, page.extracted, indexer.chunking_config)
+        page.extracted = []  # release text no longer needed downstream
+        return True
+
+    async def embed(page: _PageWork) -> bool:
+        if page.rows:
+            page.vectors = await indexer.embedding_client.embed_batch([r[4] for r in page.rows])
+        return True
+
+    async def upsert(page: _PageWork) -> bool:
+        page_data = {
+            "notebook_id": notebook_id,
+            "notebook_name": notebook_name,
+            "page_id": page.page_id,
+            "page_title": page.title,
+            "entries": page.entries,
+        }
+        embedded = indexer._build_embedded_chunks(
+            page_data, page.rows, page.vectors, author, labarchives_url
+        )
+        if embedded:
+            await indexer.vector_index.upsert(embedded)
+        totals["pages_processed"] += 1
+        totals["indexed_count"] += len(embedded)
+        totals["skipped_count"] += len(page.skipped)
+        return False  # end of the line
+
+    started = time.monotonic()
+    sink: asyncio.Queue[Any] = asyncio.Queue()
+    try:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(crawl())
+            stages = [
+                (fetch, settings.fetch_concurrency),
+                (extract, settings.extract_concurrency),
+                (chunk, settings.chunk_concurrency),
+                (embed, settings.embed_concurrency),
+                (upsert, settings.upsert_concurrency),
+            ]
+            for i, (process, workers) in enumerate(stages):
+                outbox = queues[i + 1] if i + 1 < len(stages) else sink
+                group.create_task(
+                    _run_stage(
+                        stats[PIPELINE_STAGES[i + 1]], queues[i], outbox, workers, process, errors
+                    )
+                )
+    except BaseExceptionGroup as group_error:
+        # Only the crawl of the notebook root escapes its stage; surface it unwrapped
+        raise group_error.exceptions[0] from None
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Indexed notebook {notebook_id}: {totals['indexed_count']} chunks from "
+        f"{totals['pages_processed']} pages in {elapsed:.2f}s"
+    )
+    return {
+        "notebook_id": notebook_id,
+        "pages_found": stats["crawl"].items,
+        **totals,
+        "elapsed_seconds": round(elapsed, 4),
+        "stages": {name: stage.as_dict() for name, stage in stats.items()},
+        "errors": errors,
+    }
+
+
 async def index_notebook(
     notebook_id: str,
     page_ids: list[str] | None = None,
+    *,
+    notebook_client: NotebookSource,
+    uid: str,
+    labarchives_url: str,
+    pages: AsyncIterable[dict[str, Any]] | None = None,
+    notebook_name: str | None = None,
+    author: str = "unknown@example.com",
+    entry_filter: Callable[[list[dict[str, Any]]], list[dict[str, Any]]] | None = None,
+    settings: IndexingConfig | None = None,
     **kwargs: Any,
 ) -> dict[str, Any]:
-    """Convenience function for indexing a notebook.
+    """Convenience function to index an entire notebook.
 
     Args:
         notebook_id: LabArchives notebook ID
         page_ids: Optional list of specific page IDs to index.
                  If None, indexes all pages.
+        notebook_client: Source of tree levels and page entries
+        uid: LabArchives user ID
+        labarchives_url: URL stored in chunk metadata
+        pages: Optional page nodes from an external crawler
+        notebook_name: Display name stored in chunk metadata
+        author: Author stored in chunk metadata
+        entry_filter: Optional per-page entry selector
+        settings: Stage concurrency and queue sizes (defaults if None)
         **kwargs: Additional arguments passed to NotebookIndexer
 
     Returns:
-        Dictionary with indexing statistics
-
-    Note:
-        This is a placeholder. Full implementation will integrate
-        with LabArchives MCP server to fetch notebook data.
+        Indexing statistics (see `NotebookIndexer.index_notebook`)
     """
-    # TODO: Implement full notebook indexing
-    # This will require integrating with the LabArchives MCP server
-    # to fetch notebook and page data
-    raise NotImplementedError(
-        "Full notebook indexing not yet implemented. "
-        "Use NotebookIndexer.index_page() directly for now."
+    indexer = NotebookIndexer(**kwargs)
+    return await indexer.index_notebook(
+        notebook_client,
+        uid,
+        notebook_id,
+        labarchives_url=labarchives_url,
+        page_ids=page_ids,
+        pages=pages,
+        notebook_name=notebook_name,
+        author=author,
+        entry_filter=entry_filter,
+        settings=settings,
     )
@@ -0,0 +1,195 @@
+"""Compact vector codes for the local index.
+
+A float32 row of a 1536-dimension embedding takes 6 KB. The quantisers here
+encode unit-length rows into smaller codes that can be scanned quickly and
+then rescored in float32 for the few best candidates:
+
+- `ScalarQuantizer` (int8): one signed byte per dimension with a per-dimension
+  scale, 4x smaller than float32. Scores are close to exact.
+- `BinaryQuantizer`: one sign bit per dimension packed into bytes, 32x smaller
+  than float32. Candidates are ranked by Hamming distance, which only roughly
+  follows cosine similarity, so rescoring more candidates matters.
+
+`measure_recall` compares quantised-plus-rescored search against exact search
+on a set of queries, so a quantiser and rescore factor can be chosen per corpus.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from vector_backend.similarity import top_k_indices
+
+# Rows decoded or compared at once (bounds the temporary arrays of a scan)
+SCORE_BLOCK_ROWS = 65536
+
+# Number of set bits of every byte value
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(
+    axis=1, dtype=np.uint8
+)
+
+
+class ScalarQuantizer:
+    """Symmetric int8 codes with one scale per dimension.
+
+    Attributes:
+        scale: Value of one code step for each dimension
+    """
+
+    name = "int8"
+
+    def __init__(self, scale: np.ndarray) -> None:
+        self.scale = np.asarray(scale, dtype=np.float32)
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray) -> ScalarQuantizer:
+        """Choose scales so the largest magnitude of each dimension maps to 127."""
+        peak = np.abs(vectors).max(axis=0) if len(vectors) else np.ones(vectors.shape[1])
+        return cls(np.where(peak > 0, peak / 127.0, 1.0))
+
+    def bytes_per_vector(self, dim: int) -> int:
+        """Size of one code in bytes."""
+        return dim
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Return int8 codes of float rows."""
+        return np.clip(np.rint(vectors / self.scale), -127, 127).astype(np.int8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Return approximate float32 rows of int8 codes."""
+        return codes.astype(np.float32) * self.scale
+
+    def score(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Return approximate dot products of every code with `query` (higher is closer)."""
+        weighted = (query * self.scale).astype(np.float32)
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_BLOCK_ROWS):
+            block = codes[start : start + SCORE_BLOCK_ROWS]
+            scores[start : start + len(block)] = block.astype(np.float32) @ weighted
+        return scores
+
+
+class BinaryQuantizer:
+    """Sign-bit codes compared by Hamming distance."""
+
+    name = "binary"
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray) -> BinaryQuantizer:
+        """Return a quantiser (sign bits need no training)."""
+        return cls()
+
+    def bytes_per_vector(self, dim: int) -> int:
+        """Size of one code in bytes."""
+        return (dim + 7) // 8
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Return packed sign bits of float rows."""
+        return np.packbits(np.asarray(vectors) > 0, axis=-1)
+
+    def score(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Return minus the Hamming distance of every code to the query's signs."""
+        query_code = self.encode(query)
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_BLOCK_ROWS):
+            block = codes[start : start + SCORE_BLOCK_ROWS]
+            distances = _POPCOUNT[block ^ query_code].sum(axis=1, dtype=np.int32)
+            scores[start : start + len(block)] = -distances
+        return scores
+
+
+Quantizer = ScalarQuantizer | BinaryQuantizer
+
+QUANTIZERS: dict[str, type[ScalarQuantizer] | type[BinaryQuantizer]] = {
+    "int8": ScalarQuantizer,
+    "binary": BinaryQuantizer,
+}
+
+
+def create_quantizer(name: str, vectors: np.ndarray) -> Quantizer:
+    """Fit the quantiser called `name` ("int8" or "binary") to unit-length rows.
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        cls = QUANTIZERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown quantization {name!r}. Expected one of {sorted(QUANTIZERS)}"
+        ) from None
+    return cls.fit(vectors)
+
+
+def rescored_top_k(
+    query: np.ndarray,
+    matrix: np.ndarray,
+    codes: np.ndarray,
+    quantizer: Quantizer,
+    k: int,
+    rescore_factor: int,
+    rows: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rank by code score, then rescore the best `k * rescore_factor` rows in float32.
+
+    Args:
+        query: Unit-length float32 query
+        matrix: Unit-length float32 rows (only candidate rows are read)
+        codes: Codes of `matrix` rows
+        quantizer: Quantiser that produced `codes`
+        k: Results wanted
+        rescore_factor: Candidates rescored per result
+        rows: Restrict the search to these row numbers
+
+    Returns:
+        Row numbers and float32 scores of the best `k` rows, best first
+    """
+    if rows is None:
+        approx = quantizer.score(codes, query)
+        shortlist = top_k_indices(approx, k * max(1, rescore_factor))
+    else:
+        approx = quantizer.score(codes[rows], query)
+        shortlist = rows[top_k_indices(approx, k * max(1, rescore_factor))]
+    # Read candidate rows in storage order (friendlier to memory-mapped matrices)
+    shortlist = np.sort(shortlist)
+    exact = matrix[shortlist] @ query
+    best = top_k_indices(exact, k)
+    return shortlist[best], exact[best]
+
+
+def measure_recall(
+    matrix: np.ndarray,
+    queries: np.ndarray,
+    quantizer: Quantizer,
+    *,
+    k: int = 10,
+    rescore_factor: int = 4,
+) -> dict[str, float]:
+    """Compare quantised search against exact search over `matrix`.
+
+    Args:
+        matrix: Unit-length float32 rows
+        queries: Unit-length float32 queries
+        quantizer: Quantiser fitted to `matrix`
+        k: Neighbours compared per query
+        rescore_factor: Candidates rescored per result
+
+    Returns:
+        `recall_at_k` without rescoring, `rescored_recall_at_k` with it, and the
+        `compression` of the codes relative to float32
+    """
+    codes = quantizer.encode(matrix)
+    k = min(k, len(matrix))
+    raw = rescored = 0
+    for query in queries:
+        exact = set(top_k_indices(matrix @ query, k).tolist())
+        raw += len(exact & set(top_k_indices(quantizer.score(codes, query), k).tolist()))
+        rows, _ = rescored_top_k(query, matrix, codes, quantizer, k, rescore_factor)
+        rescored += len(exact & set(rows.tolist()))
+    total = max(1, k * len(queries))
+    dim = matrix.shape[1]
+    return {
+        "recall_at_k": raw / total,
+        "rescored_recall_at_k": rescored / total,
+        "compression": 4 * dim / quantizer.bytes_per_vector(dim),
+    }
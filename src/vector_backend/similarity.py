@@ -0,0 +1,28 @@
+"""Vectorised cosine-similarity helpers shared by the local index modules."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import numpy as np
+
+
+def normalize_rows(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return float32 unit-length rows and the original row norms.
+
+    All-zero rows are left as zeros (they score 0 against every query).
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1).astype(np.float32)
+    safe = np.where(norms > 0, norms, np.float32(1.0))
+    return vectors / safe[:, None], norms
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the indices of the `k` highest finite scores, best first."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return cast(np.ndarray, top[np.isfinite(scores[top])])
@@ -4,6 +4,7 @@ This file ensures that:
 - `src/` is importable
 - Integration tests can read credentials from `conf/secrets.yml`
 - DVC uses a local, writable site cache to avoid macOS permission issues
+- The LabArchives uid cache is written to a per-test temporary directory
 """
 
 from __future__ import annotations
@@ -12,6 +13,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure src directory is in path for imports
 repo_root = Path(__file__).parent.parent
 src_path = repo_root / "src"
@@ -78,3 +81,9 @@ def _ensure_local_dvc_site_cache() -> None:
 def pytest_sessionstart(session: object) -> None:
     _ensure_local_dvc_site_cache()
     _load_secrets_into_env()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_uid_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep `AuthenticationManager`'s uid cache out of the real home directory."""
+    monkeypatch.setenv("LABARCHIVES_UID_CACHE", str(tmp_path / "uid_cache.json"))
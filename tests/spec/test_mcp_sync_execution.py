@@ -307,3 +307,145 @@ def test_sync_rebuild_exec_indexes_all_and_saves_record(
     assert result["processed_pages"] == 2
     assert result["indexed_chunks"] >= 2
     assert saved["calls"] >= 1
+
+
+def test_sync_page_failures_are_reported_and_record_not_saved(
+    monkeypatch: pytest.MonkeyPatch, mcp_env_exec: dict[str, Any]
+) -> None:
+    # Plan: rebuild
+    import importlib
+
+    from vector_backend.sync import plan_sync as _plan
+
+    _mod_sync = importlib.import_module(_plan.__module__)
+    monkeypatch.setattr(
+        _mod_sync,
+        "plan_sync",
+        lambda *_, **__: {"action": "rebuild", "reason": "no_record", "built_at": None},
+    )
+
+    # Dummy notebook: one page whose entries cannot be fetched
+    class NB:
+        async def get_notebook_tree(
+            self, uid: str, nbid: str, parent_tree_id: int | str = 0
+        ) -> list[dict[str, Any]]:  # noqa: ARG002
+            if parent_tree_id == 0:
+                return [
+                    {"tree_id": "p1", "display_text": "Page 1", "is_page": True, "is_folder": False}
+                ]
+            return []
+
+        async def get_page_entries(
+            self, uid: str, nbid: str, pid: str
+        ) -> list[dict[str, Any]]:  # noqa: ARG002
+            raise RuntimeError("entries unavailable")
+
+    mcp_env_exec["module"].LabArchivesClient = lambda *_: NB()
+
+    import vector_backend.build_state as vbs
+    import vector_backend.embedding as vbe
+    import vector_backend.index as vbi
+
+    class DummyEmbed:
+        async def embed_batch(self, texts: list[str]) -> list[list[float]]:  # noqa: D401
+            return [[0.0] * 1536 for _ in texts]
+
+    class DummyIndex:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401, ARG002
+            return None
+
+        async def upsert(self, chunks: list[Any]) -> None:  # noqa: D401, ANN401
+            return None
+
+    saved = {"calls": 0}
+
+    def fake_save(path: Any, record: Any) -> None:  # noqa: ANN001
+        saved["calls"] += 1
+
+    monkeypatch.setattr(vbe, "create_embedding_client", lambda cfg: DummyEmbed())
+    monkeypatch.setattr(vbi, "PineconeIndex", DummyIndex)
+    monkeypatch.setattr(vbs, "save_build_record", fake_save)
+
+    tool = mcp_env_exec["tool_callbacks"]["sync_vector_index"]
+    result = asyncio.run(tool(force=False, dry_run=False, max_age_hours=None, notebook_id="nb1"))
+
+    assert result["processed_pages"] == 0
+    assert result["record_saved"] is False
+    assert [(e["notebook_id"], e["page_id"]) for e in result["errors"]] == [("nb1", "p1")]
+    assert "entries unavailable" in result["errors"][0]["error"]
+    assert saved["calls"] == 0
+
+
+def test_sync_subfolder_failures_are_reported_and_record_not_saved(
+    monkeypatch: pytest.MonkeyPatch, mcp_env_exec: dict[str, Any]
+) -> None:
+    # Plan: rebuild
+    import importlib
+
+    from vector_backend.sync import plan_sync as _plan
+
+    _mod_sync = importlib.import_module(_plan.__module__)
+    monkeypatch.setattr(
+        _mod_sync,
+        "plan_sync",
+        lambda *_, **__: {"action": "rebuild", "reason": "no_record", "built_at": None},
+    )
+
+    # Dummy notebook: one readable page next to a folder whose listing fails
+    class NB:
+        async def get_notebook_tree(
+            self, uid: str, nbid: str, parent_tree_id: int | str = 0
+        ) -> list[dict[str, Any]]:  # noqa: ARG002
+            if parent_tree_id == 0:
+                return [
+                    {
+                        "tree_id": "p1",
+                        "display_text": "Page 1",
+                        "is_page": True,
+                        "is_folder": False,
+                    },
+                    {"tree_id": "f1", "display_text": "Data", "is_page": False, "is_folder": True},
+                ]
+            raise RuntimeError("folder unavailable")
+
+        async def get_page_entries(
+            self, uid: str, nbid: str, pid: str
+        ) -> list[dict[str, Any]]:  # noqa: ARG002
+            return [{"eid": "e1", "part_type": "text entry", "content": "<p>Hello</p>"}]
+
+    mcp_env_exec["module"].LabArchivesClient = lambda *_: NB()
+
+    import vector_backend.build_state as vbs
+    import vector_backend.embedding as vbe
+    import vector_backend.index as vbi
+
+    class DummyEmbed:
+        async def embed_batch(self, texts: list[str]) -> list[list[float]]:  # noqa: D401
+            return [[0.0] * 1536 for _ in texts]
+
+    class DummyIndex:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401, ARG002
+            return None
+
+        async def upsert(self, chunks: list[Any]) -> None:  # noqa: D401, ANN401
+            return None
+
+    saved = {"calls": 0}
+
+    def fake_save(path: Any, record: Any) -> None:  # noqa: ANN001
+        saved["calls"] += 1
+
+    monkeypatch.setattr(vbe, "create_embedding_client", lambda cfg: DummyEmbed())
+    monkeypatch.setattr(vbi, "PineconeIndex", DummyIndex)
+    monkeypatch.setattr(vbs, "save_build_record", fake_save)
+
+    tool = mcp_env_exec["tool_callbacks"]["sync_vector_index"]
+    result = asyncio.run(tool(force=False, dry_run=False, max_age_hours=None, notebook_id="nb1"))
+
+    assert result["processed_pages"] == 1
+    assert result["record_saved"] is False
+    assert [(e["notebook_id"], e["stage"], e["page_id"]) for e in result["errors"]] == [
+        ("nb1", "crawl", "f1")
+    ]
+    assert "folder unavailable" in result["errors"][0]["error"]
+    assert saved["calls"] == 0
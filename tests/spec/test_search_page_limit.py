@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from typing import Any, cast
 
 import pytest
@@ -82,6 +82,12 @@ def mcp_env(monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest) ->
         ) -> list[dict[str, Any]]:  # noqa: ARG002
             return []
 
+        async def iter_page_entries(
+            self, uid: str, nbid: str, pid: str
+        ) -> AsyncIterator[dict[str, Any]]:  # noqa: ARG002
+            for entry in await self.get_page_entries(uid, nbid, pid):
+                yield entry
+
     monkeypatch.setattr(mcp_module, "LabArchivesClient", DummyLabArchivesClient)
 
     class DummyAuthenticationManager:
@@ -8,6 +8,7 @@ import hashlib
 import hmac
 import time
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any, cast
 
 import httpx
@@ -159,3 +160,134 @@ def test_ensure_uid_fetches_via_user_access_info(monkeypatch: pytest.MonkeyPatch
         "login_or_email": "user@example.com",
         "password": "temp-token",
     }
+
+
+def test_auth_params_are_cached_per_method_until_near_expiry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Given repeated calls, when signing, then params are reused per method within the
+    validity window and re-signed before they expire, matching a fresh HMAC."""
+    credentials = Credentials(
+        akid="AK123",
+        password="super-secret",
+        region=cast(HttpUrl, "https://api.labarchives.com"),
+        uid="uid-1",
+    )
+    clock = [1_700_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    manager = AuthenticationManager(cast(httpx.AsyncClient, None), credentials)
+
+    def expected(method: str, expires: str) -> str:
+        message = f"{credentials.akid}{method}{expires}".encode()
+        digest = hmac.new(credentials.password.encode("utf-8"), message, hashlib.sha512)
+        return base64.b64encode(digest.digest()).decode("ascii")
+
+    first = manager._build_auth_params("get_tree_level")
+    assert first["sig"] == expected("get_tree_level", first["expires"])
+    assert int(first["expires"]) == int(clock[0] * 1000) + 120_000
+
+    other = manager._build_auth_params("add_entry")
+    assert other["sig"] == expected("add_entry", other["expires"])
+    assert other["sig"] != first["sig"]
+
+    # Reused until SIGNATURE_RENEW_MARGIN_MS before expiry, then renewed
+    clock[0] += 89.0
+    assert manager._build_auth_params("get_tree_level") == first
+    clock[0] += 1.0
+    renewed = manager._build_auth_params("get_tree_level")
+    assert int(renewed["expires"]) == int(clock[0] * 1000) + 120_000
+    assert renewed["sig"] == expected("get_tree_level", renewed["expires"])
+
+    # Callers get copies; mutating one does not poison the cache
+    renewed["sig"] = "tampered"
+    assert manager._build_auth_params("get_tree_level")["sig"] != "tampered"
+
+
+def _temp_token_credentials() -> Credentials:
+    return Credentials(
+        akid="AK123",
+        password="super-secret",
+        region=cast(HttpUrl, "https://api.labarchives.com"),
+        auth_email="user@example.com",
+        auth_code="temp-token",
+    )
+
+
+def _uid_handler(
+    url: str, params: dict[str, Any] | None, json: dict[str, Any] | None
+) -> httpx.Response:
+    request = httpx.Request("GET", url, params=params)
+    return httpx.Response(200, content=b"<users><id>uid-123</id></users>", request=request)
+
+
+def test_concurrent_ensure_uid_calls_share_one_resolution(tmp_path: Path) -> None:
+    """Given many concurrent callers at startup, when resolving the uid, then
+    user_access_info is called once and every caller gets its result."""
+
+    class SlowStubClient(StubAsyncClient):
+        async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return await super().request(method, url, **kwargs)
+
+    client = SlowStubClient(_uid_handler)
+    manager = AuthenticationManager(
+        cast(httpx.AsyncClient, client),
+        _temp_token_credentials(),
+        uid_cache_path=tmp_path / "uids.json",
+    )
+
+    async def scenario() -> list[str]:
+        return list(await asyncio.gather(*(manager.ensure_uid() for _ in range(10))))
+
+    assert asyncio.run(scenario()) == ["uid-123"] * 10
+    assert len(client.calls) == 1
+
+
+def test_resolved_uid_is_persisted_per_account_and_invalidated(tmp_path: Path) -> None:
+    """Given a uid resolved by one process, when another starts with the same
+    credentials, then it makes no auth round-trip; after an auth failure the cached
+    uid is dropped and resolved again."""
+    cache_path = tmp_path / "uids.json"
+    first_client = StubAsyncClient(_uid_handler)
+    first = AuthenticationManager(
+        cast(httpx.AsyncClient, first_client),
+        _temp_token_credentials(),
+        uid_cache_path=cache_path,
+    )
+    asyncio.run(first.ensure_uid())
+    assert len(first_client.calls) == 1
+    assert "temp-token" not in cache_path.read_text()
+
+    second_client = StubAsyncClient(_uid_handler)
+    second = AuthenticationManager(
+        cast(httpx.AsyncClient, second_client),
+        _temp_token_credentials(),
+        uid_cache_path=cache_path,
+    )
+    assert asyncio.run(second.ensure_uid()) == "uid-123"
+    assert not second_client.calls
+
+    other_account = _temp_token_credentials().model_copy(update={"auth_email": "b@example.com"})
+    other = AuthenticationManager(
+        cast(httpx.AsyncClient, StubAsyncClient(_uid_handler)),
+        other_account,
+        uid_cache_path=cache_path,
+    )
+    assert other._read_cached_uid() is None
+
+    second.invalidate_uid()
+    assert first._read_cached_uid() is None
+    asyncio.run(second.ensure_uid())
+    assert len(second_client.calls) == 1
+
+
+def test_invalidate_uid_keeps_a_configured_uid(tmp_path: Path) -> None:
+    """A uid from the credentials file is never dropped by an auth failure."""
+    credentials = _temp_token_credentials().model_copy(update={"uid": "configured"})
+    manager = AuthenticationManager(
+        cast(httpx.AsyncClient, None), credentials, uid_cache_path=tmp_path / "uids.json"
+    )
+
+    manager.invalidate_uid()
+
+    assert asyncio.run(manager.ensure_uid()) == "configured"
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from cli import main as cli_main
 from cli.main import _run_cli
 from labarchives_mcp import __main__ as package_main
 from labarchives_mcp.linked_data import (
@@ -186,3 +187,36 @@ def test_python_module_entrypoint_routes_to_cli(
 
     assert exc_info.value.code == 0
     assert json.loads(output.read_text()) == export_project_jsonld(project_id, state_dir=tmp_path)
+
+
+def test_mirror_sync_requires_a_mirror_path(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """mirror-sync should refuse to run without --path or LABARCHIVES_MIRROR_PATH."""
+    monkeypatch.delenv("LABARCHIVES_MIRROR_PATH", raising=False)
+
+    with pytest.raises(SystemExit) as excinfo:
+        _run_cli(["mirror-sync"])
+
+    assert excinfo.value.code == 2
+    assert "LABARCHIVES_MIRROR_PATH" in capsys.readouterr().err
+
+
+def test_mirror_sync_passes_notebooks_and_prints_summary(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    """mirror-sync should mirror the requested notebooks and print the JSON summary."""
+    calls: list[tuple[str, list[str], int]] = []
+
+    async def fake_sync(path: str, notebook_ids: list[str], concurrency: int) -> dict[str, int]:
+        calls.append((path, list(notebook_ids), concurrency))
+        return {"notebooks": 2, "pages": 5, "failed_pages": 0}
+
+    monkeypatch.setattr(cli_main, "_sync_mirror", fake_sync)
+    monkeypatch.setenv("LABARCHIVES_MIRROR_PATH", str(tmp_path / "mirror.sqlite3"))
+
+    exit_code = _run_cli(["mirror-sync", "--notebook", "nb1", "--notebook", "nb2"])
+
+    assert exit_code == 0
+    assert calls == [(str(tmp_path / "mirror.sqlite3"), ["nb1", "nb2"], 8)]
+    assert json.loads(capsys.readouterr().out)["pages"] == 5
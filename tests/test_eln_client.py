@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-from typing import cast
+from typing import Any, cast
 
 import httpx
 import pytest
 from pydantic import HttpUrl
 
 from labarchives_mcp.auth import AuthenticationManager, Credentials
-from labarchives_mcp.eln_client import LabArchivesClient, NotebookRecord
+from labarchives_mcp.eln_client import LabArchivesClient, NotebookRecord, NotebookTreeCrawler
 
 
 def test_list_notebooks_handles_http_errors(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -164,3 +164,100 @@ def test_list_notebooks_returns_notebook_records(monkeypatch: pytest.MonkeyPatch
                     modified_at="2025-01-02T08:30:00Z",
                 )
             ]
+
+
+class _FakeTree:
+    """A notebook with `width` folders per level, `depth` levels deep, one page per folder."""
+
+    def __init__(self, width: int, depth: int, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail: set[str] = set()
+        self.levels: dict[str, list[dict[str, Any]]] = {}
+        self._build("0", "", width, depth)
+
+    def _build(self, parent: str, prefix: str, width: int, depth: int) -> None:
+        nodes: list[dict[str, Any]] = [
+            {"tree_id": f"page{prefix}", "display_text": f"Page{prefix}", "is_page": True}
+        ]
+        if depth > 0:
+            for i in range(width):
+                folder = f"{prefix}.{i}"
+                nodes.append(
+                    {"tree_id": f"f{folder}", "display_text": f"F{folder}", "is_folder": True}
+                )
+                self._build(f"f{folder}", folder, width, depth - 1)
+        self.levels[parent] = nodes
+
+    async def get_notebook_tree(
+        self, uid: str, nbid: str, parent_tree_id: int | str = 0
+    ) -> list[dict[str, Any]]:
+        self.calls.append(str(parent_tree_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if str(parent_tree_id) in self.fail:
+                raise RuntimeError("folder unavailable")
+            return self.levels[str(parent_tree_id)]
+        finally:
+            self.in_flight -= 1
+
+
+def test_tree_crawler_fetches_levels_concurrently_with_folder_paths() -> None:
+    """Given a notebook 3 levels deep, when crawled, then each level's folders are
+    fetched concurrently (bounded), breadth-first, and pages carry their folder path."""
+    tree = _FakeTree(width=4, depth=2, latency=0.02)
+    crawler = NotebookTreeCrawler(tree, concurrency=3)
+
+    pages = asyncio.run(crawler.list_pages("uid", "nb"))
+
+    assert len(pages) == 1 + 4 + 16
+    assert tree.max_in_flight == 3
+    # Breadth-first: the root level, then all depth-1 folders, then depth-2 folders
+    assert tree.calls[0] == "0"
+    assert all(call.count(".") == 1 for call in tree.calls[1:5])
+    by_id = {page["tree_id"]: page for page in pages}
+    assert by_id["page"]["folder_path"] == []
+    assert by_id["page.2.1"]["folder_path"] == ["F.2", "F.2.1"]
+    assert by_id["page.2.1"]["parent_tree_id"] == "f.2.1"
+
+
+def test_tree_crawler_caches_levels_until_ttl_expires() -> None:
+    """Given a crawled notebook, when crawled again within the TTL, then no tree
+    levels are refetched; after invalidation they are."""
+    tree = _FakeTree(width=2, depth=1)
+    crawler = NotebookTreeCrawler(tree, ttl_seconds=60.0)
+
+    async def scenario() -> None:
+        await crawler.list_pages("uid", "nb")
+        await crawler.list_pages("uid", "nb")
+        assert len(tree.calls) == 3
+        assert (crawler.hits, crawler.misses) == (3, 3)
+
+        crawler.invalidate("nb")
+        await crawler.list_pages("uid", "nb")
+        assert len(tree.calls) == 6
+
+    asyncio.run(scenario())
+
+    expired = NotebookTreeCrawler(tree, ttl_seconds=0.0)
+    asyncio.run(expired.list_pages("uid", "nb"))
+    asyncio.run(expired.list_pages("uid", "nb"))
+    assert expired.hits == 0
+
+
+def test_tree_crawler_skips_failing_subfolders_but_not_root() -> None:
+    """Given an unreadable subfolder, when crawled, then its subtree is skipped; an
+    unreadable root raises."""
+    tree = _FakeTree(width=2, depth=2)
+    tree.fail = {"f.0"}
+
+    pages = asyncio.run(NotebookTreeCrawler(tree).list_pages("uid", "nb"))
+    assert {page["tree_id"] for page in pages} == {"page", "page.1", "page.1.0", "page.1.1"}
+
+    tree.fail = {"0"}
+    with pytest.raises(RuntimeError, match="folder unavailable"):
+        asyncio.run(NotebookTreeCrawler(tree).list_pages("uid", "nb"))
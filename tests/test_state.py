@@ -4,6 +4,7 @@ import json
 from collections.abc import Generator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import networkx as nx
 import pytest
@@ -319,3 +320,124 @@ def test_record_upload_provenance_without_active_context_is_noop(
     )
 
     assert state_manager._state.contexts == {}
+
+
+def test_record_upload_provenance_batch_saves_once(
+    state_manager: StateManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A batch of uploads should add every subgraph with a single state save."""
+    context = state_manager.create_project("Proj", "Desc")
+    metadata = ProvenanceMetadata(
+        git_commit_sha="f" * 40,
+        git_branch="main",
+        git_repo_url="https://github.com/SamuelBrudner/lab_archives_mcp",
+        git_is_dirty=False,
+        code_version="0.4.0",
+        executed_at=datetime(2026, 4, 20, 14, 1, 58, tzinfo=UTC),
+        python_version="3.11.8",
+        os_name="Darwin",
+        hostname=None,
+    )
+    saves: list[int] = []
+    original_save = state_manager._save_state
+
+    def counting_save() -> None:
+        saves.append(1)
+        original_save()
+
+    monkeypatch.setattr(state_manager, "_save_state", counting_save)
+
+    state_manager.record_upload_provenance_batch(
+        [
+            {
+                "uid": "uid123",
+                "notebook_id": "nb1",
+                "page_title": f"fig{i}.png",
+                "file_path": f"figures/fig{i}.png",
+                "page_tree_id": f"page-{i}",
+                "entry_id": f"ATTACH_{i}",
+                "page_url": f"https://example.org/page-{i}",
+                "created_at": None,
+                "file_size_bytes": 100 + i,
+                "filename": f"fig{i}.png",
+                "metadata": metadata,
+                "server_version": "0.4.0",
+                "as_page_text": False,
+            }
+            for i in range(3)
+        ]
+    )
+
+    graph = nx.node_link_graph(context.graph_data, edges="links")
+    assert saves == [1]
+    for i in range(3):
+        assert graph.nodes[f"artifact:page-{i}:ATTACH_{i}"]["file_size_bytes"] == 100 + i
+        assert graph.has_edge("notebook:nb1", f"page:page-{i}")
+
+
+def test_find_upload_matches_hash_destination_title_and_mode(state_manager: StateManager) -> None:
+    """Recorded uploads should be found by content hash, destination, page title and mode."""
+    state_manager.create_project("Proj", "Desc")
+    metadata = ProvenanceMetadata(
+        git_commit_sha="f" * 40,
+        git_branch="main",
+        git_repo_url="https://github.com/SamuelBrudner/lab_archives_mcp",
+        git_is_dirty=False,
+        code_version="0.4.0",
+        executed_at=datetime(2026, 4, 20, 14, 1, 58, tzinfo=UTC),
+        python_version="3.11.8",
+        os_name="Darwin",
+        hostname=None,
+    )
+
+    def record(page_id: str, folder: str | None) -> None:
+        state_manager.record_upload_provenance(
+            uid="uid123",
+            notebook_id="nb1",
+            page_title="fig.png",
+            file_path="figures/fig.png",
+            page_tree_id=page_id,
+            entry_id=f"ATTACH_{page_id}",
+            page_url=f"https://example.org/{page_id}",
+            created_at=None,
+            file_size_bytes=100,
+            filename="fig.png",
+            metadata=metadata,
+            server_version="0.4.0",
+            as_page_text=False,
+            sha256="a" * 64,
+            parent_folder_id=folder,
+        )
+
+    def find(sha256: str = "a" * 64, **kwargs: Any) -> dict[str, Any] | None:
+        destination = {
+            "notebook_id": "nb1",
+            "parent_folder_id": None,
+            "page_title": "fig.png",
+            "as_page_text": False,
+            **kwargs,
+        }
+        return state_manager.find_upload(sha256=sha256, **destination)
+
+    record("page-root", None)
+    assert find(sha256="b" * 64) is None
+    # The same bytes under another title or stored as page text are a different upload
+    assert find(page_title="Figure 2") is None
+    assert find(as_page_text=True) is None
+
+    # "0" is the notebook root, same as no folder; the index is rebuilt after each save
+    record("page-f1", "F1")
+    root = find(parent_folder_id="0")
+    assert root is not None and root["page_id"] == "page-root"
+    folder = find(parent_folder_id="F1")
+    assert folder is not None and folder["entry_id"] == "ATTACH_page-f1"
+    assert find(notebook_id="nb2") is None
+
+    # Uploads whose page node was pruned are no longer offered for reuse
+    context = state_manager.get_active_context()
+    assert context is not None
+    context.graph_data["nodes"] = [
+        node for node in context.graph_data["nodes"] if node["id"] != "page:page-f1"
+    ]
+    state_manager._save_state()
+    assert find(parent_folder_id="F1") is None
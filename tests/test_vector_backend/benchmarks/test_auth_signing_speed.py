@@ -0,0 +1,68 @@
+"""Benchmark: LabArchives request signing with and without cached signatures.
+
+Run with `pytest tests/test_vector_backend/benchmarks --benchmark-only` and compare
+within the `auth-signing` group. "uncached" signs every call with a fresh HMAC keyed
+from the password (the previous behaviour); "prototype" copies the pre-keyed HMAC
+but still signs every call; "cached" is `_build_auth_params`, which reuses signed
+params per method until shortly before they expire.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import time
+from typing import Any, cast
+
+import httpx
+import pytest
+from pydantic import HttpUrl
+
+from labarchives_mcp.auth import AuthenticationManager, Credentials
+
+METHODS = ["get_tree_level", "get_entries_for_page", "add_entry", "user_info_via_id"]
+CALLS = 10_000
+
+
+def _manager() -> AuthenticationManager:
+    credentials = Credentials(
+        akid="AK123",
+        password="super-secret-password",
+        region=cast(HttpUrl, "https://api.labarchives.com"),
+        uid="uid-1",
+    )
+    return AuthenticationManager(cast(httpx.AsyncClient, None), credentials)
+
+
+def _sign_uncached(manager: AuthenticationManager) -> None:
+    credentials = manager._credentials
+    for i in range(CALLS):
+        expires = str(int(time.time() * 1000) + 120_000)
+        message = f"{credentials.akid}{METHODS[i % 4]}{expires}".encode()
+        digest = hmac.new(credentials.password.encode("utf-8"), message, hashlib.sha512).digest()
+        base64.b64encode(digest).decode("ascii")
+
+
+def _sign_prototype(manager: AuthenticationManager) -> None:
+    for i in range(CALLS):
+        manager._sign(METHODS[i % 4], int(time.time() * 1000) + 120_000)
+
+
+def _sign_cached(manager: AuthenticationManager) -> None:
+    for i in range(CALLS):
+        manager._build_auth_params(METHODS[i % 4])
+
+
+@pytest.mark.slow  # type: ignore[misc]
+@pytest.mark.parametrize("mode", ["uncached", "prototype", "cached"])  # type: ignore[misc]
+def test_auth_signing_speed(benchmark: Any, mode: str) -> None:
+    """Sign 10k requests spread over four API methods."""
+    sign = {"uncached": _sign_uncached, "prototype": _sign_prototype, "cached": _sign_cached}[mode]
+    manager = _manager()
+
+    benchmark.group = "auth-signing"
+    benchmark.pedantic(sign, args=(manager,), rounds=5, iterations=1)
+
+    if benchmark.stats:  # None under --benchmark-disable
+        benchmark.extra_info["signatures_per_second"] = CALLS / benchmark.stats.stats.mean
@@ -0,0 +1,51 @@
+"""Benchmark: token-native chunker vs. the LangChain-based recursive chunker.
+
+Run with `pytest tests/test_vector_backend/benchmarks --benchmark-only` and compare
+within each `chunk-<size>` group.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from vector_backend.chunking import ChunkingConfig, create_chunker
+
+SIZES = {"10KB": 10_000, "100KB": 100_000, "1MB": 1_000_000}
+WORDS = (
+    "protein aggregation neurons incubated buffer sample assay méthode 蛋白质 "
+    "western blot antibody dilution centrifuge pellet supernatant"
+).split()
+
+
+def _lab_text(n_chars: int) -> str:
+    """Deterministic notebook-like prose with sentences and paragraphs."""
+    rng = random.Random(0)
+    parts: list[str] = []
+    size = 0
+    while size < n_chars:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 24)))
+        sentence = sentence.capitalize() + ". "
+        if rng.random() < 0.1:
+            sentence += "\n\n"
+        parts.append(sentence)
+        size += len(sentence)
+    return "".join(parts)[:n_chars]
+
+
+@pytest.mark.slow  # type: ignore[misc]
+@pytest.mark.parametrize("strategy", ["recursive", "token"])  # type: ignore[misc]
+@pytest.mark.parametrize("size", list(SIZES))  # type: ignore[misc]
+def test_chunking_speed(benchmark: Any, size: str, strategy: str) -> None:
+    """Chunk 10 KB / 100 KB / 1 MB inputs with each strategy."""
+    text = _lab_text(SIZES[size])
+    chunker = create_chunker(ChunkingConfig(strategy=strategy))
+    chunker.chunk("warm up the tokenizer")
+
+    benchmark.group = f"chunk-{size}"
+    chunks = benchmark.pedantic(chunker.chunk, args=(text,), rounds=3, iterations=1)
+
+    assert chunks
+    assert all(c.token_count <= 2 * ChunkingConfig().chunk_size for c in chunks)
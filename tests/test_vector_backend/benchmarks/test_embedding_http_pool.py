@@ -0,0 +1,109 @@
+"""Benchmark: per-batch overhead of a fresh vs. pooled embedding HTTP client.
+
+Run with `pytest tests/test_vector_backend/benchmarks --benchmark-only` and compare
+within the `embedding-http` group. Runs `OpenAIEmbedding` against a local stub
+embeddings server. The "fresh" mode closes the client after every batch, reproducing
+the old one-client-per-call behaviour; the "pooled" mode keeps one client (and its
+keep-alive connections).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from vector_backend.embedding import EmbeddingConfig, OpenAIEmbedding
+
+DIMENSIONS = 256
+BATCHES = 30
+BATCH_TEXTS = [f"benchmark text {i}" for i in range(16)]
+
+
+class _StubEmbeddingsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+    connections = 0  # one handler instance per accepted connection
+
+    def setup(self) -> None:
+        type(self).connections += 1
+        super().setup()
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        length = int(self.headers["Content-Length"])
+        inputs = json.loads(self.rfile.read(length))["input"]
+        body = json.dumps(
+            {"data": [{"embedding": [0.5] * DIMENSIONS, "index": i} for i in range(len(inputs))]}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture()  # type: ignore[misc]
+def stub_server() -> Iterator[str]:
+    """Serve a minimal OpenAI-compatible embeddings endpoint on localhost."""
+    _StubEmbeddingsHandler.connections = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubEmbeddingsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _embed_batches(config: EmbeddingConfig, *, reuse: bool) -> int:
+    """Embed `BATCHES` batches and return how many HTTP clients served them."""
+
+    async def scenario() -> int:
+        client = OpenAIEmbedding(config)
+        built: list[Any] = []
+        for _ in range(BATCHES):
+            await client.embed_batch(BATCH_TEXTS)
+            if client._http not in built:
+                built.append(client._http)
+            if not reuse:
+                await client.aclose()
+        await client.aclose()
+        return len(built)
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.slow  # type: ignore[misc]
+@pytest.mark.parametrize("mode", ["fresh", "pooled"])  # type: ignore[misc]
+def test_embedding_http_pool(benchmark: Any, stub_server: str, mode: str) -> None:
+    """Embed 30 batches with one client per batch or one pooled client."""
+    config = EmbeddingConfig(
+        model="openai/text-embedding-3-small",
+        version="v1",
+        dimensions=DIMENSIONS,
+        api_key="sk-bench",
+        api_base=stub_server,
+    )
+    per_round = 1 if mode == "pooled" else BATCHES
+    clients: list[int] = []
+
+    def run() -> None:
+        clients.append(_embed_batches(config, reuse=mode == "pooled"))
+
+    benchmark.group = "embedding-http"
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    if benchmark.stats:  # None under --benchmark-disable
+        benchmark.extra_info["ms_per_batch"] = benchmark.stats.stats.mean / BATCHES * 1000
+
+    # A pooled client opens one keep-alive connection for all batches of a round
+    assert clients and all(count == per_round for count in clients)
+    assert _StubEmbeddingsHandler.connections == per_round * len(clients)
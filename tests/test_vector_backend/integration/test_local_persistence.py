@@ -12,14 +12,20 @@ import importlib.util
 import shutil
 from datetime import datetime
 
+import numpy as np
 import pytest
 
-from vector_backend.index import LocalPersistence
+from vector_backend.index import CHUNK_SCHEMA_VERSION, LocalPersistence
 from vector_backend.models import ChunkMetadata, EmbeddedChunk
 
 DVC_AVAILABLE = importlib.util.find_spec("dvc") is not None
 
 
+def _as_float32(vector: list[float]) -> list[float]:
+    """Values a vector holds after a float32 save/load round trip."""
+    return np.asarray(vector, dtype=np.float32).tolist()
+
+
 # Worker functions for concurrent write tests (module-level for pickling)
 def _concurrent_write_worker(
     worker_id: int, base_path: str, version: str, chunks: list[EmbeddedChunk]
@@ -196,7 +202,7 @@ class TestLoadChunks:
         for original, loaded_chunk in zip(sample_chunks, loaded, strict=False):
             assert loaded_chunk.id == original.id
             assert loaded_chunk.text == original.text
-            assert loaded_chunk.vector == original.vector
+            assert loaded_chunk.vector == _as_float32(original.vector)
             assert loaded_chunk.metadata.notebook_id == original.metadata.notebook_id
             assert loaded_chunk.metadata.page_title == original.metadata.page_title
             assert loaded_chunk.metadata.author == original.metadata.author
@@ -239,6 +245,150 @@ class TestLoadChunks:
             assert loaded_chunk.metadata.date == original.metadata.date
 
 
+class TestLoadColumns:
+    """Test columnar loading of chunks."""
+
+    def test_load_columns_returns_vector_matrix(self, persistence, sample_chunks):
+        """Vectors come back as one (rows, dim) matrix alongside the id/text columns."""
+        persistence.save_chunks("test_nb_001", sample_chunks)
+
+        columns = persistence.load_columns("test_nb_001")
+
+        assert columns.vectors.shape == (3, 1536)
+        assert columns.vectors[2].tolist() == _as_float32(sample_chunks[2].vector)
+        assert columns.ids == [chunk.id for chunk in sample_chunks]
+        assert columns.texts == [chunk.text for chunk in sample_chunks]
+        assert columns.metadata.column("page_id") == [
+            chunk.metadata.page_id for chunk in sample_chunks
+        ]
+        assert "vector" not in columns.table.column_names
+
+    def test_load_columns_builds_chunks_on_access(self, persistence, sample_chunks):
+        """Indexing the columns yields the saved chunk for that row."""
+        persistence.save_chunks("test_nb_001", sample_chunks)
+
+        columns = persistence.load_columns("test_nb_001")
+
+        assert len(columns) == 3
+        assert columns[-1].id == sample_chunks[-1].id
+        assert columns[0].metadata == sample_chunks[0].metadata
+        assert columns[1].metadata.tags == []
+        assert [chunk.id for chunk in columns[1:]] == [chunk.id for chunk in sample_chunks[1:]]
+
+    def test_load_columns_empty_notebook(self, persistence):
+        """An empty notebook loads as zero rows."""
+        persistence.save_chunks("empty_nb", [])
+
+        columns = persistence.load_columns("empty_nb")
+
+        assert len(columns) == 0
+        assert columns.ids == []
+        assert list(columns) == []
+
+    def test_load_table_reads_arrow(self, persistence, sample_chunks):
+        """The raw Arrow table has one row per chunk."""
+        persistence.save_chunks("test_nb_001", sample_chunks)
+
+        table = persistence.load_table("test_nb_001")
+
+        assert table.num_rows == 3
+        assert "vector" in table.column_names
+
+    def test_load_columns_rejects_non_finite_vectors(self, persistence, sample_chunks):
+        """Stored NaN values are found for the whole matrix and name the chunk."""
+        import pyarrow.parquet as pq
+
+        path = persistence.save_chunks("test_nb_001", sample_chunks)
+        table = pq.read_table(path)
+        vectors = table.column("vector").to_pylist()
+        vectors[1][7] = float("nan")
+        table = table.set_column(table.schema.get_field_index("vector"), "vector", [vectors])
+        pq.write_table(table, path)
+
+        with pytest.raises(ValueError, match=f"{sample_chunks[1].id}.*index 7"):
+            persistence.load_columns("test_nb_001")
+        with pytest.raises(ValueError, match="non-finite"):
+            persistence.load_chunks("test_nb_001")
+
+    def test_load_columns_rejects_ragged_vectors(self, persistence, sample_chunks):
+        """Vectors of different lengths in one notebook are rejected."""
+        import pyarrow.parquet as pq
+
+        path = persistence.save_chunks("test_nb_001", sample_chunks)
+        table = pq.read_table(path)
+        vectors = table.column("vector").to_pylist()
+        vectors[0] = vectors[0][:768]
+        table = table.set_column(table.schema.get_field_index("vector"), "vector", [vectors])
+        pq.write_table(table, path)
+
+        with pytest.raises(ValueError, match="differ in length"):
+            persistence.load_columns("test_nb_001")
+
+
+class TestChunkSchema:
+    """Test the on-disk Parquet schema and reading older files."""
+
+    def test_vectors_stored_as_fixed_size_float32(self, persistence, sample_chunks):
+        """Saved vectors use a fixed-size float32 list column and carry the schema version."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = persistence.save_chunks("test_nb_001", sample_chunks)
+        schema = pq.read_schema(path)
+
+        assert schema.field("vector").type == pa.list_(pa.float32(), 1536)
+        assert (
+            schema.metadata[b"vector_backend.schema_version"] == str(CHUNK_SCHEMA_VERSION).encode()
+        )
+
+    def test_vectors_read_without_copy(self, persistence, sample_chunks):
+        """The loaded vector matrix is a read-only float32 view of the Arrow buffer."""
+        persistence.save_chunks("test_nb_001", sample_chunks)
+
+        columns = persistence.load_columns("test_nb_001")
+
+        assert columns.vectors.dtype == np.float32
+        assert not columns.vectors.flags.owndata
+        assert not columns.vectors.flags.writeable
+
+    def test_unversioned_pandas_file_still_loads(self, persistence, sample_chunks):
+        """Files written as list<double> by pandas (schema version 1) remain readable."""
+        import pandas as pd
+
+        records = [
+            {"id": chunk.id, "text": chunk.text, "vector": chunk.vector}
+            | chunk.metadata.model_dump()
+            for chunk in sample_chunks
+        ]
+        path = persistence.version_path / "legacy_nb.parquet"
+        pd.DataFrame(records).to_parquet(path, engine="pyarrow", index=False)
+
+        loaded = persistence.load_chunks("legacy_nb")
+
+        assert [chunk.id for chunk in loaded] == [chunk.id for chunk in sample_chunks]
+        assert loaded[1].vector == sample_chunks[1].vector
+        assert loaded[0].metadata == sample_chunks[0].metadata
+
+    def test_newer_schema_version_rejected(self, persistence, sample_chunks):
+        """A file from a newer schema version is refused rather than misread."""
+        import pyarrow.parquet as pq
+
+        path = persistence.save_chunks("test_nb_001", sample_chunks)
+        table = pq.read_table(path)
+        newer = {b"vector_backend.schema_version": str(CHUNK_SCHEMA_VERSION + 1).encode()}
+        pq.write_table(table.replace_schema_metadata(newer), path)
+
+        with pytest.raises(ValueError, match="schema version"):
+            persistence.load_chunks("test_nb_001")
+
+    def test_mixed_vector_lengths_rejected_on_save(self, persistence, sample_chunks):
+        """One notebook file holds a single vector dimension."""
+        sample_chunks[1].vector = [0.5] * 768
+
+        with pytest.raises(ValueError, match="differ in length"):
+            persistence.save_chunks("test_nb_001", sample_chunks)
+
+
 class TestListNotebooks:
     """Test listing saved notebooks."""
 
@@ -338,7 +488,7 @@ class TestRoundTripFidelity:
             loaded = persistence.load_chunks(nb_id)
 
             assert len(loaded) == 1
-            assert loaded[0].vector == vector
+            assert loaded[0].vector == _as_float32(vector)
 
 
 class TestDVCIntegration:
@@ -12,6 +12,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from vector_backend.build_state import (
+    _safe_subset,
     build_record_from_config,
     compute_config_fingerprint,
     load_build_record,
@@ -30,6 +31,7 @@ def make_config(
     overlap: int = 50,
     tokenizer: str = "cl100k_base",
     preserve_boundaries: bool = True,
+    strategy: str = "recursive",
     embedding_model: str = "openai/text-embedding-3-small",
     embedding_version: str = "v1",
     dimensions: int = 1536,
@@ -45,6 +47,7 @@ def make_config(
         overlap=overlap,
         tokenizer=tokenizer,
         preserve_boundaries=preserve_boundaries,
+        strategy=strategy,
     )
     embedding = EmbeddingConfig(
         model=embedding_model,
@@ -89,6 +92,17 @@ class TestConfigFingerprint:
         fp4 = compute_config_fingerprint(cfg4)
         assert fp4 != fp1, "Chunking changes must affect fingerprint"
 
+    def test_only_opt_in_chunking_strategies_change_the_fingerprint(self) -> None:
+        """Records from before chunking strategies existed stay current under the
+        default recursive chunker; opting into the token chunker forces a rebuild."""
+        legacy_subset = _safe_subset(make_config())
+        assert "strategy" not in legacy_subset["chunking"]
+
+        recursive = compute_config_fingerprint(make_config(strategy="recursive"))
+        token = compute_config_fingerprint(make_config(strategy="token"))
+        assert recursive == compute_config_fingerprint(make_config())
+        assert token != recursive
+
     def test_fingerprint_changes_with_backend_details(self) -> None:
         base = make_config(backend="pinecone", index_name="idx-a", namespace=None)
         fp_base = compute_config_fingerprint(base)
@@ -11,7 +11,14 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from vector_backend.chunking import Chunk, ChunkingConfig, RecursiveTokenChunker, chunk_text
+from vector_backend.chunking import (
+    Chunk,
+    ChunkingConfig,
+    RecursiveTokenChunker,
+    TokenChunker,
+    chunk_text,
+    create_chunker,
+)
 
 
 class TestChunkingConfig:
@@ -164,6 +171,74 @@ class TestRecursiveTokenChunker:
         assert all(chunk.token_count <= max_allowed for chunk in chunks)
 
 
+class TestTokenChunker:
+    """Tests for the token-native TokenChunker."""
+
+    def test_offsets_map_exactly_to_text(self) -> None:
+        """Every chunk should be the exact slice of the input at its offsets."""
+        config = ChunkingConfig(chunk_size=30, overlap=5, strategy="token")
+        text = "Protéines agrégées 蛋白质 🧬 in neurons. " * 40
+
+        chunks = TokenChunker(config).chunk(text)
+
+        assert len(chunks) > 1
+        assert all(c.text == text[c.start_byte : c.end_byte] for c in chunks)
+        assert chunks[0].start_byte == 0
+        assert chunks[-1].end_byte == len(text)
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+
+    def test_windows_respect_chunk_size_and_overlap(self) -> None:
+        """Chunks never exceed chunk_size tokens and consecutive chunks overlap."""
+        config = ChunkingConfig(chunk_size=20, overlap=5, strategy="token")
+        chunks = TokenChunker(config).chunk("Word " * 100)
+
+        assert all(c.token_count <= config.chunk_size for c in chunks)
+        assert all(b.start_byte < a.end_byte for a, b in zip(chunks, chunks[1:], strict=False))
+
+    def test_prefers_paragraph_then_sentence_breaks(self) -> None:
+        """With preserve_boundaries, windows end on the strongest nearby separator."""
+        paragraph = "One short sentence here. Another sentence follows it. "
+        text = (paragraph * 3).strip() + "\n\n" + paragraph * 6
+        config = ChunkingConfig(chunk_size=40, overlap=0, strategy="token")
+
+        chunks = TokenChunker(config).chunk(text)
+
+        assert chunks[0].text.endswith("\n\n")
+        assert all(c.text.rstrip().endswith(".") for c in chunks[1:-1])
+
+    def test_without_boundaries_cuts_on_token_count(self) -> None:
+        """preserve_boundaries=False should yield full-size windows."""
+        config = ChunkingConfig(
+            chunk_size=25, overlap=0, preserve_boundaries=False, strategy="token"
+        )
+        chunks = TokenChunker(config).chunk("alpha beta gamma. " * 60)
+
+        assert all(c.token_count == 25 for c in chunks[:-1])
+
+    def test_empty_text_raises(self) -> None:
+        """Empty text should raise ValueError."""
+        chunker = TokenChunker(ChunkingConfig(strategy="token"))
+
+        with pytest.raises(ValueError, match="Input text cannot be empty"):
+            chunker.chunk("  \n ")
+
+    @given(st.text(min_size=1, max_size=500).filter(lambda t: t.strip()))  # type: ignore[misc]
+    def test_offsets_property(self, text: str) -> None:
+        """Property-based test: offsets are exact and cover the text end to end."""
+        chunks = TokenChunker(ChunkingConfig(chunk_size=8, overlap=2, strategy="token")).chunk(text)
+
+        assert all(c.text == text[c.start_byte : c.end_byte] for c in chunks)
+        assert not text[chunks[-1].end_byte :].strip()
+
+    def test_factory_selects_strategy(self) -> None:
+        """create_chunker should honour ChunkingConfig.strategy."""
+        assert isinstance(create_chunker(ChunkingConfig(strategy="token")), TokenChunker)
+        assert isinstance(create_chunker(ChunkingConfig()), RecursiveTokenChunker)
+
+        with pytest.raises(ValueError, match="strategy must be one of"):
+            ChunkingConfig(strategy="sentence")
+
+
 class TestConvenienceFunction:
     """Tests for chunk_text convenience function."""
 
@@ -14,6 +14,7 @@ import pytest
 from vector_backend.config import (
     IncrementalUpdateConfig,
     IndexConfig,
+    IndexingConfig,
     VectorSearchConfig,
     create_default_config,
     load_config,
@@ -48,6 +49,7 @@ class TestConfigModels:
         # Valid backends
         IndexConfig(backend="pinecone", index_name="test")
         IndexConfig(backend="qdrant", index_name="test")
+        IndexConfig(backend="local", index_name="test")
 
         # Invalid backend should raise
         with pytest.raises(ValueError):
@@ -66,6 +68,17 @@ class TestConfigModels:
         with pytest.raises(ValueError):
             IncrementalUpdateConfig(batch_size=2000)
 
+    def test_indexing_section_is_optional(self) -> None:
+        """Configs without an indexing section default to in-process extraction."""
+        config_dict = create_default_config()
+        del config_dict["indexing"]
+
+        config = VectorSearchConfig(**config_dict)  # type: ignore[arg-type]
+
+        assert config.indexing.process_workers == 0
+        with pytest.raises(ValueError):
+            IndexingConfig(process_workers=-1)
+
 
 class TestConfigLoading:
     """Tests for loading config from Hydra YAML."""
@@ -1,5 +1,10 @@
 """Unit tests for embedding generation."""
 
+import asyncio
+import json
+import time
+from pathlib import Path
+
 import httpx
 import pytest
 import respx
@@ -7,6 +12,7 @@ from httpx import Response
 from openai import RateLimitError
 
 from vector_backend.embedding import EmbeddingConfig, OpenAIEmbedding, create_embedding_client
+from vector_backend.embedding_cache import EmbeddingCache
 
 
 @pytest.fixture  # type: ignore[misc]
@@ -102,12 +108,71 @@ class TestOpenAIEmbedding:
         assert vectors[1] != vectors[2]
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_batch_size_exceeded(self, embedding_config: EmbeddingConfig) -> None:
-        """Batch size over limit should raise ValueError."""
+    @respx.mock  # type: ignore[misc]
+    async def test_batch_size_exceeded_is_split(self, embedding_config: EmbeddingConfig) -> None:
+        """Inputs over batch_size should be split into ordered sub-batches."""
+        route = respx.post("https://api.openai.com/v1/embeddings").mock(
+            side_effect=_echo_embeddings
+        )
         client = OpenAIEmbedding(embedding_config)
+        texts = ["x" * (i % 50 + 1) for i in range(250)]
+
+        vectors = await client.embed_batch(texts)
+
+        sizes = sorted(len(json.loads(call.request.content)["input"]) for call in route.calls)
+        assert sizes == [50, 100, 100]
+        assert [v[0] for v in vectors] == [len(t) / 100 + 0.001 for t in texts]
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_sub_batches_respect_token_budget(
+        self, embedding_config: EmbeddingConfig
+    ) -> None:
+        """No request should exceed max_tokens_per_batch (an oversized text goes alone)."""
+        route = respx.post("https://api.openai.com/v1/embeddings").mock(
+            side_effect=_echo_embeddings
+        )
+        config = embedding_config.model_copy(update={"max_tokens_per_batch": 30})
+        client = OpenAIEmbedding(config)
+        # " word" is one cl100k_base token per repetition
+        texts = [" word" * 10, " word" * 10, " word" * 10, " word" * 50, " word" * 5]
 
-        with pytest.raises(ValueError, match="Batch size .* exceeds limit"):
-            await client.embed_batch(["text"] * 101)  # Exceeds 100
+        vectors = await client.embed_batch(texts)
+
+        batches = [json.loads(call.request.content)["input"] for call in route.calls]
+        assert sorted(len(b) for b in batches) == [1, 1, 3]
+        assert len(vectors) == 5
+        assert vectors[3][0] == len(texts[3]) / 100 + 0.001
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_sub_batches_run_concurrently(self, embedding_config: EmbeddingConfig) -> None:
+        """Sub-batches should overlap in time, bounded by max_concurrency."""
+        latency = 0.05
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_echo(request: httpx.Request) -> Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(latency)
+            in_flight -= 1
+            return _echo_embeddings(request)
+
+        respx.post("https://api.openai.com/v1/embeddings").mock(side_effect=slow_echo)
+        config = embedding_config.model_copy(update={"batch_size": 10, "max_concurrency": 4})
+        client = OpenAIEmbedding(config)
+        await client.embed_single("warm up tokenizer")
+
+        start = time.perf_counter()
+        vectors = await client.embed_batch([f"text {i}" for i in range(80)])
+        elapsed = time.perf_counter() - start
+
+        assert len(vectors) == 80
+        assert max_in_flight == 4
+        # Two waves of four requests instead of eight sequential ones
+        assert elapsed < latency * 8 * 0.75
 
     @pytest.mark.asyncio  # type: ignore[misc]
     @respx.mock  # type: ignore[misc]
@@ -177,6 +242,148 @@ class TestOpenAIEmbedding:
         assert vectors == []
 
 
+class TestPooledHttpClient:
+    """Tests for the shared HTTP client lifecycle."""
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_client_is_reused_across_batches(self, embedding_config: EmbeddingConfig) -> None:
+        """Consecutive batches should share one pooled client until closed."""
+        respx.post("https://api.openai.com/v1/embeddings").mock(side_effect=_echo_embeddings)
+
+        async with OpenAIEmbedding(embedding_config) as client:
+            await client.embed_single("one")
+            first_http = client._http
+            await client.embed_batch(["two", "three"])
+            assert client._http is first_http
+            assert first_http is not None and not first_http.is_closed
+
+        assert client._http is None
+        assert first_http.is_closed
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_custom_api_base(self, embedding_config: EmbeddingConfig) -> None:
+        """Requests should go to the configured OpenAI-compatible endpoint."""
+        route = respx.post("http://127.0.0.1:9999/v1/embeddings").mock(side_effect=_echo_embeddings)
+        config = embedding_config.model_copy(update={"api_base": "http://127.0.0.1:9999/v1"})
+
+        async with OpenAIEmbedding(config) as client:
+            await client.embed_single("hello")
+
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_http2_falls_back_without_h2(
+        self, embedding_config: EmbeddingConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Requesting HTTP/2 without the optional dependency should not fail."""
+        import sys
+
+        monkeypatch.setitem(sys.modules, "h2", None)
+        config = embedding_config.model_copy(update={"http2": True})
+        client = OpenAIEmbedding(config)
+
+        http = client._get_http()
+
+        assert isinstance(http, httpx.AsyncClient)
+        await client.aclose()
+
+
+def _echo_embeddings(request: httpx.Request) -> Response:
+    """Return a distinct vector per input text, derived from the text length."""
+    inputs = json.loads(request.content)["input"]
+    return Response(
+        200,
+        json={
+            "data": [
+                {"embedding": [len(text) / 100 + 0.001] * 1536, "index": i}
+                for i, text in enumerate(inputs)
+            ],
+            "model": "text-embedding-3-small",
+        },
+    )
+
+
+class TestEmbeddingCache:
+    """Tests for the persistent embedding cache."""
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_unchanged_texts_skip_the_api(
+        self, embedding_config: EmbeddingConfig, tmp_path: Path
+    ) -> None:
+        """Re-embedding unchanged text (even from a new process) should make no API calls."""
+        route = respx.post("https://api.openai.com/v1/embeddings").mock(
+            side_effect=_echo_embeddings
+        )
+        texts = ["alpha", "beta beta", "gamma gamma gamma"]
+
+        first = OpenAIEmbedding(embedding_config, cache=EmbeddingCache(tmp_path / "cache.db"))
+        vectors = await first.embed_batch(texts)
+        assert route.call_count == 1
+        assert first.cache is not None and first.cache.misses == 3
+        first.cache.close()
+
+        # Fresh cache object on the same file simulates a later rebuild
+        second = OpenAIEmbedding(embedding_config, cache=EmbeddingCache(tmp_path / "cache.db"))
+        assert await second.embed_batch(texts) == vectors
+        assert route.call_count == 1
+        assert second.cache is not None
+        assert (second.cache.hits, second.cache.misses) == (3, 0)
+        assert second.cache.hit_rate == 1.0
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_only_misses_are_sent_upstream(
+        self, embedding_config: EmbeddingConfig, tmp_path: Path
+    ) -> None:
+        """A partially cached batch should request only new, de-duplicated texts."""
+        route = respx.post("https://api.openai.com/v1/embeddings").mock(
+            side_effect=_echo_embeddings
+        )
+        client = OpenAIEmbedding(embedding_config, cache=EmbeddingCache(tmp_path / "c.db"))
+        alpha, beta = await client.embed_batch(["alpha", "beta beta"])
+
+        vectors = await client.embed_batch(["new text", "alpha", "new text", "beta beta"])
+
+        assert json.loads(route.calls.last.request.content)["input"] == ["new text"]
+        assert vectors[0] == vectors[2] == [8 / 100 + 0.001] * 1536
+        assert vectors[1] == alpha
+        assert vectors[3] == beta
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_version_bump_misses(
+        self, embedding_config: EmbeddingConfig, tmp_path: Path
+    ) -> None:
+        """Changing the embedding version should invalidate cached vectors."""
+        route = respx.post("https://api.openai.com/v1/embeddings").mock(
+            side_effect=_echo_embeddings
+        )
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        await OpenAIEmbedding(embedding_config, cache=cache).embed_single("alpha")
+
+        bumped = embedding_config.model_copy(update={"version": "v2"})
+        await OpenAIEmbedding(bumped, cache=cache).embed_single("alpha")
+
+        assert route.call_count == 2
+
+    def test_factory_wires_cache_from_config(self, tmp_path: Path) -> None:
+        """`cache_path` in the config should attach a cache to the client."""
+        config = EmbeddingConfig(
+            model="openai/text-embedding-3-small",
+            version="v1",
+            dimensions=1536,
+            cache_path=str(tmp_path / "cache.db"),
+        )
+        client = create_embedding_client(config)
+
+        assert isinstance(client, OpenAIEmbedding)
+        assert client.cache is not None
+        assert client.cache.path == tmp_path / "cache.db"
+
+
 class TestCreateEmbeddingClient:
     """Tests for factory function."""
 
@@ -0,0 +1,83 @@
+"""Unit tests for the IVF approximate nearest-neighbour engine."""
+
+from pathlib import Path
+
+import numpy as np
+
+from vector_backend.ivf import IVFIndex, spherical_kmeans
+from vector_backend.local_index import normalize_rows, top_k_indices
+
+
+def _clustered(rows: int, dim: int = 32, clusters: int = 16, seed: int = 0) -> np.ndarray:
+    """Unit rows scattered around `clusters` random directions."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim))
+    points = centers[rng.integers(clusters, size=rows)] + 0.3 * rng.standard_normal((rows, dim))
+    return normalize_rows(points)[0]
+
+
+def _recall(ivf: IVFIndex, vectors: np.ndarray, queries: np.ndarray, nprobe: int) -> float:
+    found = 0
+    for query in queries:
+        exact = set(top_k_indices(vectors @ query, 10).tolist())
+        rows = ivf.candidates(query, nprobe)
+        approx = set(rows[top_k_indices(vectors[rows] @ query, 10)].tolist())
+        found += len(exact & approx)
+    return found / (10 * len(queries))
+
+
+class TestIVFIndex:
+    """Tests for IVFIndex training, probing and persistence."""
+
+    def test_kmeans_returns_unit_centroids(self) -> None:
+        """Centroids are unit length and one per requested cluster."""
+        centroids = spherical_kmeans(_clustered(500), 8)
+
+        assert centroids.shape == (8, 32)
+        assert np.allclose(np.linalg.norm(centroids, axis=1), 1.0, atol=1e-5)
+
+    def test_recall_grows_with_nprobe(self) -> None:
+        """Probing more cells never loses recall, and probing all cells is exact."""
+        vectors = _clustered(4000)
+        queries = _clustered(50, seed=1)
+        ivf = IVFIndex.train(vectors, nlist=32)
+
+        recalls = [_recall(ivf, vectors, queries, nprobe) for nprobe in (1, 4, 32)]
+
+        assert recalls == sorted(recalls)
+        assert recalls[1] > 0.8
+        assert recalls[2] == 1.0
+
+    def test_candidates_are_a_fraction_of_rows(self) -> None:
+        """A single probe scores only one cell's rows."""
+        vectors = _clustered(4000)
+        ivf = IVFIndex.train(vectors, nlist=32)
+
+        assert len(ivf.candidates(vectors[0], 1)) < len(vectors) / 4
+        assert sorted(ivf.candidates(vectors[0], 32).tolist()) == list(range(len(vectors)))
+
+    def test_add_and_keep_renumber_rows(self) -> None:
+        """Added rows are appended; kept rows are renumbered in order."""
+        vectors = _clustered(1000)
+        ivf = IVFIndex.train(vectors[:800], nlist=16)
+
+        grown = ivf.add(vectors[800:])
+        assert grown.size == 1000
+        assert grown.trained_rows == 800
+        assert 999 in grown.candidates(vectors[999], 1)
+
+        kept = grown.keep(np.arange(500, 1000))
+        assert kept.size == 500
+        assert 499 in kept.candidates(vectors[999], 1)
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """The index and its row IDs survive a save/load cycle."""
+        ivf = IVFIndex.train(_clustered(300), nlist=8)
+        ids = [f"chunk{i}" for i in range(300)]
+
+        ivf.save(tmp_path / "ivf.npz", ids)
+        loaded, loaded_ids = IVFIndex.load(tmp_path / "ivf.npz")
+
+        assert loaded_ids == ids
+        assert np.array_equal(loaded.assignments, ivf.assignments)
+        assert np.allclose(loaded.centroids, ivf.centroids)
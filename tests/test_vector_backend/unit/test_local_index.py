@@ -0,0 +1,365 @@
+"""Unit tests for the in-process local vector index."""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vector_backend.config import IndexConfig
+from vector_backend.index import LocalPersistence, MetadataColumns, create_vector_index
+from vector_backend.ivf import IVFIndex
+from vector_backend.local_index import LocalVectorIndex, top_k_indices
+from vector_backend.models import ChunkMetadata, EmbeddedChunk, SearchRequest
+
+DIM = 768
+
+
+def _vector(seed: int) -> list[float]:
+    return np.random.default_rng(seed).standard_normal(DIM).tolist()
+
+
+def _chunk(notebook_id: str, idx: int, *, author: str = "a@example.com") -> EmbeddedChunk:
+    return EmbeddedChunk(
+        id=f"{notebook_id}_page{idx}_entry{idx}_0",
+        text=f"Chunk {idx} of {notebook_id}",
+        vector=_vector(sum(map(ord, notebook_id)) * 100 + idx),
+        metadata=ChunkMetadata(
+            notebook_id=notebook_id,
+            notebook_name=f"Notebook {notebook_id}",
+            page_id=f"page{idx}",
+            page_title=f"Page {idx}",
+            entry_id=f"entry{idx}",
+            entry_type="text_entry",
+            author=author,
+            date=datetime(2025, 1, 1),
+            labarchives_url="https://example.com",
+            embedding_version="v1",
+        ),
+    )
+
+
+@pytest.fixture  # type: ignore[misc]
+def persistence(tmp_path: Path) -> LocalPersistence:
+    """Persistence with two notebooks of five chunks each."""
+    store = LocalPersistence(tmp_path, version="v1")
+    store.save_chunks("nb1", [_chunk("nb1", i) for i in range(5)])
+    store.save_chunks("nb2", [_chunk("nb2", i, author="b@example.com") for i in range(5)])
+    return store
+
+
+def _request(limit: int = 3, **filters: str) -> SearchRequest:
+    return SearchRequest(query="q", limit=limit, filters=filters or None)
+
+
+class TestLocalVectorIndex:
+    """Tests for LocalVectorIndex search and updates."""
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_search_matches_brute_force_cosine(self, persistence: LocalPersistence) -> None:
+        """Results equal a reference cosine ranking over the stored chunks."""
+        index = LocalVectorIndex(persistence)
+        chunks = persistence.load_chunks("nb1") + persistence.load_chunks("nb2")
+        query = _vector(99)
+
+        results = await index.search(_request(limit=4), query_vector=query)
+
+        matrix = np.asarray([c.vector for c in chunks])
+        scores = matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+        expected = [chunks[i].id for i in np.argsort(-scores) if scores[i] > 0][:4]
+        assert [r.chunk.id for r in results] == expected
+        assert [r.rank for r in results] == list(range(1, len(results) + 1))
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_exact_vector_scores_one(self, persistence: LocalPersistence) -> None:
+        """A stored vector finds itself first, with its vector intact."""
+        index = LocalVectorIndex(persistence)
+        target = _chunk("nb2", 3, author="b@example.com")
+
+        results = await index.search(_request(limit=1), query_vector=target.vector)
+
+        assert results[0].chunk.id == target.id
+        assert results[0].score == pytest.approx(1.0, abs=1e-5)
+        assert np.allclose(results[0].chunk.vector, target.vector, atol=1e-5)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_filters_restrict_results(self, persistence: LocalPersistence) -> None:
+        """Metadata filters only return matching chunks."""
+        index = LocalVectorIndex(persistence)
+
+        results = await index.search(
+            _request(limit=10, author="b@example.com"), query_vector=_vector(1)
+        )
+        assert results
+        assert {r.chunk.metadata.notebook_id for r in results} == {"nb2"}
+
+        none = await index.search(_request(notebook_id="missing"), query_vector=_vector(1))
+        assert none == []
+
+        with pytest.raises(ValueError, match="Unsupported filter"):
+            await index.search(_request(text="x"), query_vector=_vector(1))
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_load_does_not_build_chunk_objects(
+        self, persistence: LocalPersistence, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Loading, filtering and stats read columns; only returned hits become objects."""
+        built: list[str] = []
+        construct = EmbeddedChunk.model_construct
+
+        def counting_construct(**fields: object) -> EmbeddedChunk:
+            built.append(str(fields["id"]))
+            return construct(**fields)
+
+        monkeypatch.setattr(EmbeddedChunk, "model_construct", counting_construct)
+        index = LocalVectorIndex(persistence)
+        index.load()
+        stats = await index.stats()
+        results = await index.search(
+            _request(limit=2, author="b@example.com"), query_vector=_vector(1)
+        )
+
+        assert stats.total_notebooks == 2
+        assert built == [r.chunk.id for r in results]
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_compaction_keeps_metadata_columnar(
+        self, persistence: LocalPersistence, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Compacting and deleting afterwards never build per-row metadata objects."""
+        index = LocalVectorIndex(persistence, compact_threshold=2, persist=False)
+        index.load()
+        built: list[int] = []
+        monkeypatch.setattr(MetadataColumns, "__getitem__", lambda self, i: built.append(i))
+
+        await index.delete([_chunk("nb1", 0).id])
+        await index.upsert([_chunk("nb3", 0), _chunk("nb3", 1)])
+        await index.delete([_chunk("nb2", 1).id, _chunk("nb3", 0).id])
+
+        assert index.compactions == 1
+        assert isinstance(index._metadata, MetadataColumns)
+        assert index._metadata.column("notebook_id").count("nb3") == 2
+        assert built == []
+        assert (await index.stats()).total_notebooks == 3
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_upsert_and_delete_are_visible_before_compaction(
+        self, persistence: LocalPersistence
+    ) -> None:
+        """Buffered upserts are searchable and deleted chunks disappear immediately."""
+        index = LocalVectorIndex(persistence, compact_threshold=100, tombstone_ratio=1.0)
+        new = _chunk("nb3", 0)
+        gone = _chunk("nb1", 2)
+
+        await index.upsert([new])
+        await index.delete([gone.id])
+
+        hit = await index.search(_request(limit=1), query_vector=new.vector)
+        assert hit[0].chunk.id == new.id
+        miss = await index.search(_request(limit=10), query_vector=gone.vector)
+        assert gone.id not in {r.chunk.id for r in miss}
+        assert index.compactions == 0
+        assert (await index.stats()).total_chunks == 10
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_compaction_persists_touched_notebooks(
+        self, persistence: LocalPersistence
+    ) -> None:
+        """Compaction folds the buffer into the matrix and rewrites changed notebooks."""
+        index = LocalVectorIndex(persistence, compact_threshold=2)
+        await index.delete([_chunk("nb1", 0).id])
+        await index.upsert([_chunk("nb3", 0), _chunk("nb3", 1)])
+
+        assert index.compactions == 1
+        assert sorted(persistence.list_notebooks()) == ["nb1", "nb2", "nb3"]
+        assert len(persistence.load_chunks("nb1")) == 4
+        assert len(persistence.load_chunks("nb3")) == 2
+
+        reloaded = LocalVectorIndex(persistence)
+        stats = await reloaded.stats()
+        assert stats.total_chunks == 11
+        assert stats.total_notebooks == 3
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_loads_mixed_schema_versions(self, persistence: LocalPersistence) -> None:
+        """Notebooks written by pandas before the float32 schema load alongside new ones."""
+        import pandas as pd
+
+        legacy = [_chunk("nb0", i, author="c@example.com") for i in range(3)]
+        records = [
+            {"id": c.id, "text": c.text, "vector": c.vector} | c.metadata.model_dump()
+            for c in legacy
+        ]
+        pd.DataFrame(records).to_parquet(
+            persistence.version_path / "nb0.parquet", engine="pyarrow", index=False
+        )
+        index = LocalVectorIndex(persistence)
+
+        results = await index.search(
+            _request(limit=1, author="c@example.com"), query_vector=legacy[1].vector
+        )
+
+        assert results[0].chunk.id == legacy[1].id
+        assert results[0].chunk.metadata.folder_path is None
+        assert (await index.stats()).total_notebooks == 3
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_empty_persistence(self, tmp_path: Path) -> None:
+        """An empty store searches to nothing and accepts its first chunks."""
+        index = LocalVectorIndex(LocalPersistence(tmp_path), compact_threshold=1)
+        first = _chunk("nb1", 0)
+
+        assert await index.search(_request(), query_vector=_vector(1)) == []
+        await index.upsert([first])
+
+        results = await index.search(_request(), query_vector=first.vector)
+        assert [r.chunk.id for r in results] == [first.id]
+        assert index.compactions == 1
+        assert await index.health_check()
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_rejects_wrong_dimensions(self, persistence: LocalPersistence) -> None:
+        """Queries must match the stored vector dimension."""
+        index = LocalVectorIndex(persistence)
+
+        with pytest.raises(ValueError, match="dimensions"):
+            await index.search(_request(), query_vector=[0.1] * (DIM + 1))
+        with pytest.raises(ValueError):
+            await index.search(_request())
+
+
+class TestLocalVectorIndexIVF:
+    """Tests for IVF search inside LocalVectorIndex."""
+
+    @pytest.fixture  # type: ignore[misc]
+    def persistence(self, tmp_path: Path) -> LocalPersistence:
+        """Persistence with forty chunks in one notebook."""
+        store = LocalPersistence(tmp_path, version="v1")
+        store.save_chunks("nb1", [_chunk("nb1", i) for i in range(40)])
+        return store
+
+    def _index(self, persistence: LocalPersistence, **kwargs: int) -> LocalVectorIndex:
+        return LocalVectorIndex(persistence, ann="ivf", nlist=4, ann_min_rows=10, **kwargs)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_full_probe_matches_exact_search(self, persistence: LocalPersistence) -> None:
+        """With every cell probed, IVF results equal brute-force results."""
+        exact = LocalVectorIndex(persistence)
+        approx = self._index(persistence, nprobe=4)
+        query = _chunk("nb1", 7).vector
+
+        expected = await exact.search(_request(limit=5), query_vector=query)
+        results = await approx.search(_request(limit=5), query_vector=query)
+
+        assert [r.chunk.id for r in results] == [r.chunk.id for r in expected]
+        assert approx.ivf_path.exists()
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_persisted_index_is_reused(self, persistence: LocalPersistence) -> None:
+        """A second index over unchanged Parquet files loads the saved centroids."""
+        first = self._index(persistence)
+        first.load()
+        centroids = IVFIndex.load(first.ivf_path)[0].centroids
+
+        second = self._index(persistence)
+        second.load()
+
+        assert second._ivf is not None
+        assert np.array_equal(second._ivf.centroids, centroids)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_new_chunks_are_inserted_incrementally(
+        self, persistence: LocalPersistence
+    ) -> None:
+        """Compaction adds new chunks to existing cells without retraining."""
+        index = self._index(persistence, nprobe=1, compact_threshold=1)
+        index.load()
+        assert index._ivf is not None
+        centroids = index._ivf.centroids
+        new = _chunk("nb2", 0)
+
+        await index.upsert([new])
+
+        assert index._ivf.size == 41
+        assert index._ivf.centroids is centroids
+        results = await index.search(_request(limit=1), query_vector=new.vector)
+        assert results[0].chunk.id == new.id
+        assert IVFIndex.load(index.ivf_path)[0].size == 41
+
+    def test_small_corpus_stays_exact(self, persistence: LocalPersistence) -> None:
+        """Below ann_min_rows no IVF index is built."""
+        index = LocalVectorIndex(persistence, ann="ivf", ann_min_rows=1000)
+        index.load()
+
+        assert index._ivf is None
+        assert not index.ivf_path.exists()
+
+    def test_unknown_engine_rejected(self, persistence: LocalPersistence) -> None:
+        """Only the IVF engine is available."""
+        with pytest.raises(ValueError, match="Unknown ANN engine"):
+            LocalVectorIndex(persistence, ann="hnsw")
+
+
+class TestLocalVectorIndexQuantization:
+    """Tests for quantised search inside LocalVectorIndex."""
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @pytest.mark.parametrize("quantization", ["int8", "binary"])  # type: ignore[misc]
+    async def test_results_match_exact_search(
+        self, persistence: LocalPersistence, quantization: str
+    ) -> None:
+        """Rescoring enough candidates gives the exact ranking and scores."""
+        exact = LocalVectorIndex(persistence)
+        quantized = LocalVectorIndex(persistence, quantization=quantization, rescore_factor=5)
+        query = _vector(7)
+
+        expected = await exact.search(_request(limit=2), query_vector=query)
+        results = await quantized.search(_request(limit=2), query_vector=query)
+
+        assert [r.chunk.id for r in results] == [r.chunk.id for r in expected]
+        assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_float_matrix_is_memory_mapped(self, persistence: LocalPersistence) -> None:
+        """Only codes stay in memory; float32 rows are read from disk for rescoring."""
+        index = LocalVectorIndex(persistence, quantization="binary", compact_threshold=1)
+        index.load()
+
+        assert isinstance(index._matrix, np.memmap)
+        assert index._codes is not None and index._codes.shape == (10, DIM // 8)
+
+        new = _chunk("nb3", 0)
+        await index.upsert([new])
+        results = await index.search(_request(limit=1, notebook_id="nb3"), query_vector=new.vector)
+        assert results[0].chunk.id == new.id
+        assert np.allclose(results[0].chunk.vector, new.vector, atol=1e-5)
+
+    def test_evaluate_recall(self, persistence: LocalPersistence) -> None:
+        """The harness reports recall of the configured path and the code size."""
+        index = LocalVectorIndex(persistence, quantization="int8", persist=False)
+
+        stats = index.evaluate_recall(queries=5, k=3)
+
+        assert stats["queries"] == 5
+        assert stats["recall_at_k"] == 1.0
+        assert stats["bytes_per_vector"] == DIM
+        assert stats["compression"] == 4.0
+
+
+def test_top_k_indices_orders_best_first() -> None:
+    """Top-k selection is sorted and skips masked-out scores."""
+    scores = np.array([0.1, -np.inf, 0.9, 0.5, 0.7], dtype=np.float32)
+
+    assert top_k_indices(scores, 3).tolist() == [2, 4, 3]
+    assert top_k_indices(np.array([-np.inf, 0.2]), 2).tolist() == [1]
+    assert top_k_indices(scores, 0).tolist() == []
+
+
+def test_create_vector_index_local_backend(tmp_path: Path) -> None:
+    """The "local" backend builds a LocalVectorIndex over the configured path."""
+    config = IndexConfig(backend="local", index_name="unused", local_path=str(tmp_path))
+
+    index = create_vector_index(config, embedding_version="v2")
+
+    assert isinstance(index, LocalVectorIndex)
+    assert index.persistence.version_path == tmp_path / "v2"
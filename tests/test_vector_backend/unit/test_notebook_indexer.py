@@ -1,11 +1,24 @@
 """Unit tests for end-to-end notebook indexing workflow."""
 
+import asyncio
+import json
+import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+import respx
+from httpx import Response
 
-from vector_backend.notebook_indexer import NotebookIndexer, index_notebook
+from vector_backend.chunking import ChunkingConfig
+from vector_backend.embedding import EmbeddingConfig, OpenAIEmbedding
+from vector_backend.notebook_indexer import (
+    NotebookIndexer,
+    create_process_pool,
+    index_notebook,
+    prepare_page_chunks,
+)
 
 
 class TestNotebookIndexer:
@@ -95,6 +108,75 @@ class TestNotebookIndexer:
         upserted_chunks = mock_index.upsert.call_args[0][0]
         assert len(upserted_chunks) == 2
 
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @respx.mock  # type: ignore[misc]
+    async def test_index_page_with_thousands_of_chunks(self, mock_index: MagicMock) -> None:
+        """A 2,000-chunk page should embed via concurrent sub-batches, in order."""
+        latency = 0.2
+
+        async def slow_echo(request: httpx.Request) -> Response:
+            await asyncio.sleep(latency)
+            inputs = json.loads(request.content)["input"]
+            data = [
+                {"embedding": [float(text.split()[1])] * 768, "index": i}
+                for i, text in enumerate(inputs)
+            ]
+            return Response(200, json={"data": data})
+
+        route = respx.post("https://api.openai.com/v1/embeddings").mock(side_effect=slow_echo)
+        config = EmbeddingConfig(
+            model="openai/text-embedding-3-small",
+            version="v1",
+            dimensions=768,
+            max_concurrency=20,
+            api_key="sk-test",
+        )
+        indexer = NotebookIndexer(
+            embedding_client=OpenAIEmbedding(config),
+            vector_index=mock_index,
+            embedding_version="v1",
+        )
+        page_data = {
+            "notebook_id": "nb_123",
+            "notebook_name": "Research Notebook",
+            "page_id": "page_big",
+            "page_title": "Large page",
+            "entries": [
+                {
+                    "eid": f"entry_{i}",
+                    "part_type": "plain_text",
+                    "content": f"entry {i}",
+                    "created_at": "2025-09-30T10:00:00Z",
+                    "updated_at": "2025-09-30T10:00:00Z",
+                }
+                for i in range(2000)
+            ],
+        }
+
+        embed_seconds: list[float] = []
+        embed_batch = indexer.embedding_client.embed_batch
+
+        async def timed_embed_batch(texts: list[str]) -> list[list[float]]:
+            start = time.perf_counter()
+            try:
+                return await embed_batch(texts)
+            finally:
+                embed_seconds.append(time.perf_counter() - start)
+
+        indexer.embedding_client.embed_batch = timed_embed_batch  # type: ignore[method-assign]
+        result = await indexer.index_page(
+            page_data=page_data,
+            author="test@example.com",
+            labarchives_url="https://example.com/notebook",
+        )
+
+        assert result["indexed_count"] == 2000
+        assert route.call_count == 20
+        upserted = mock_index.upsert.call_args[0][0]
+        assert [c.vector[0] for c in upserted] == [float(i) for i in range(2000)]
+        # All 20 sub-batches are in flight together rather than run back to back
+        assert embed_seconds[0] < latency * 20 / 4
+
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_index_page_skips_all_non_text(
         self, mock_embedding_client: MagicMock, mock_index: MagicMock
@@ -190,12 +272,331 @@ class TestNotebookIndexer:
         assert result["indexed_count"] > 1
 
 
-class TestConvenienceFunction:
-    """Tests for index_notebook convenience function."""
+def _bulky_page(n_entries: int, paragraphs: int) -> dict[str, Any]:
+    """A page of large HTML entries that makes extraction and chunking expensive."""
+    body = "".join(
+        f"<p>Sample {i} was <b>incubated</b> in buffer and centrifuged. "
+        f"The <i>pellet</i> was resuspended; supernatant discarded.</p>"
+        for i in range(paragraphs)
+    )
+    return {
+        "notebook_id": "nb_123",
+        "notebook_name": "Research Notebook",
+        "page_id": "page_bulk",
+        "page_title": "Bulk",
+        "entries": [
+            {
+                "eid": f"entry_{i}",
+                "part_type": "text_entry" if i % 5 else "attachment",
+                "content": body,
+                "created_at": "2025-09-30T10:00:00Z",
+                "updated_at": "2025-09-30T10:00:00Z",
+            }
+            for i in range(n_entries)
+        ],
+    }
+
+
+class TestProcessPoolIndexing:
+    """Tests for extraction and chunking in worker processes."""
+
+    @pytest.fixture  # type: ignore[misc]
+    def echo_embedding_client(self) -> MagicMock:
+        client = AsyncMock()
+        client.embed_batch = AsyncMock(side_effect=lambda texts: [[0.1] * 1536 for _ in texts])
+        return client
+
+    def test_prepare_page_chunks_returns_plain_rows(self) -> None:
+        """Worker results should be plain tuples that pickle without model objects."""
+        page = _bulky_page(n_entries=3, paragraphs=40)
+
+        rows, skipped = prepare_page_chunks(
+            page["entries"], ChunkingConfig(chunk_size=50, overlap=5)
+        )
+
+        assert skipped == [0]
+        assert rows and all(
+            type(row) is tuple and [type(v) for v in row] == [int, str, str, int, str]
+            for row in rows
+        )
+        assert {row[1] for row in rows} == {"entry_1", "entry_2"}
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_process_pool_matches_inline_and_keeps_loop_responsive(
+        self, echo_embedding_client: MagicMock
+    ) -> None:
+        """Pooled extraction should produce identical chunks without stalling the loop."""
+        page = _bulky_page(n_entries=20, paragraphs=400)
+        config = ChunkingConfig(chunk_size=100, overlap=10, strategy="token")
+
+        async def run(executor: Any) -> tuple[list[tuple[str, str]], float]:
+            index = AsyncMock()
+            indexer = NotebookIndexer(
+                echo_embedding_client, index, "v1", chunking_config=config, executor=executor
+            )
+            gaps: list[float] = []
+            done = asyncio.Event()
+
+            async def ticker() -> None:
+                last = time.perf_counter()
+                while not done.is_set():
+                    await asyncio.sleep(0.005)
+                    now = time.perf_counter()
+                    gaps.append(now - last)
+                    last = now
+
+            tick_task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)
+            await indexer.index_page(page, "test@example.com", "https://example.com/nb")
+            done.set()
+            await tick_task
+            upserted = index.upsert.call_args[0][0]
+            return [(c.id, c.text) for c in upserted], max(gaps, default=0.0)
+
+        inline_chunks, inline_stall = await run(None)
+
+        pool = create_process_pool(2)
+        try:
+            # Start the workers (and their imports) before measuring
+            await asyncio.get_running_loop().run_in_executor(pool, prepare_page_chunks, [], config)
+            pooled_chunks, pooled_stall = await run(pool)
+        finally:
+            pool.shutdown()
+
+        assert pooled_chunks == inline_chunks
+        assert pooled_stall < inline_stall / 2
+
+
+class FakeNotebook:
+    """In-memory notebook: a root folder with nested folders of text pages."""
+
+    def __init__(self, pages_per_folder: int = 3, folders: int = 2, latency: float = 0.0):
+        self.latency = latency
+        self.tree: dict[str, list[dict[str, Any]]] = {"0": []}
+        for f in range(folders):
+            folder_id = f"f{f}"
+            self.tree["0"].append({"tree_id": folder_id, "is_folder": True, "is_page": False})
+            self.tree[folder_id] = [
+                {"tree_id": f"p{f}_{p}", "display_text": f"Page {f}.{p}", "is_page": True}
+                for p in range(pages_per_folder)
+            ]
+        self.fetch_log: list[tuple[str, float]] = []
+        self.fetch_in_flight = 0
+        self.max_fetch_in_flight = 0
+        self.fail_pages: set[str] = set()
+
+    async def get_notebook_tree(
+        self, uid: str, nbid: str, parent_tree_id: int | str = 0
+    ) -> list[dict[str, Any]]:
+        return self.tree[str(parent_tree_id)]
+
+    async def get_page_entries(self, uid: str, nbid: str, pid: str) -> list[dict[str, Any]]:
+        self.fetch_in_flight += 1
+        self.max_fetch_in_flight = max(self.max_fetch_in_flight, self.fetch_in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            self.fetch_log.append((pid, time.perf_counter()))
+            if pid in self.fail_pages:
+                raise RuntimeError(f"page {pid} unavailable")
+            return [
+                {
+                    "eid": f"{pid}_e",
+                    "part_type": "text_entry",
+                    "content": f"<p>Notes for {pid}: protein assay results.</p>",
+                    "created_at": "2025-09-30T10:00:00Z",
+                }
+            ]
+        finally:
+            self.fetch_in_flight -= 1
+
+
+def _counting_embedder(latency: float = 0.0) -> tuple[MagicMock, list[tuple[float, float]]]:
+    """Embedding client that records the (start, end) time of every batch."""
+    spans: list[tuple[float, float]] = []
+
+    async def embed_batch(texts: list[str]) -> list[list[float]]:
+        start = time.perf_counter()
+        await asyncio.sleep(latency)
+        spans.append((start, time.perf_counter()))
+        return [[0.1] * 1536 for _ in texts]
+
+    client = MagicMock()
+    client.embed_batch = embed_batch
+    return client, spans
+
+
+class TestStreamingPipeline:
+    """Tests for the staged NotebookIndexer.index_notebook pipeline."""
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_index_notebook_convenience(self) -> None:
-        """Should provide convenient interface for indexing."""
-        # This is a placeholder - actual test would mock MCP calls
-        # For now, just verify the function exists and has right signature
-        assert callable(index_notebook)
+    async def test_crawls_nested_folders_and_reports_stage_stats(self) -> None:
+        """Every page under nested folders is indexed and each stage reports throughput."""
+        notebook = FakeNotebook(pages_per_folder=3, folders=2)
+        embed_client, _ = _counting_embedder()
+        index = AsyncMock()
+
+        stats = await index_notebook(
+            "nb_1",
+            notebook_client=notebook,
+            uid="uid",
+            labarchives_url="https://example.com/nb_1",
+            embedding_client=embed_client,
+            vector_index=index,
+            embedding_version="v1",
+        )
+
+        assert stats["pages_found"] == 6
+        assert stats["pages_processed"] == 6
+        assert stats["indexed_count"] == 6
+        assert stats["errors"] == []
+        assert set(stats["stages"]) == {"crawl", "fetch", "extract", "chunk", "embed", "upsert"}
+        assert all(stage["items"] == 6 for stage in stats["stages"].values())
+        upserted = [c for call in index.upsert.call_args_list for c in call.args[0]]
+        assert {c.metadata.page_title for c in upserted} == {
+            f"Page {f}.{p}" for f in range(2) for p in range(3)
+        }
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_fetch_overlaps_embedding(self) -> None:
+        """Later pages are fetched while earlier pages are still being embedded."""
+        from vector_backend.config import IndexingConfig
+
+        notebook = FakeNotebook(pages_per_folder=8, folders=1, latency=0.01)
+        embed_client, spans = _counting_embedder(latency=0.05)
+        indexer = NotebookIndexer(
+            embedding_client=embed_client, vector_index=AsyncMock(), embedding_version="v1"
+        )
+
+        start = time.perf_counter()
+        stats = await indexer.index_notebook(
+            notebook,
+            "uid",
+            "nb_1",
+            labarchives_url="https://example.com",
+            settings=IndexingConfig(fetch_concurrency=2, embed_concurrency=1, queue_size=2),
+        )
+        elapsed = time.perf_counter() - start
+
+        assert stats["pages_processed"] == 8
+        first_embed_end = min(end for _, end in spans)
+        assert any(fetched < first_embed_end for _, fetched in notebook.fetch_log[1:])
+        # Serial fetch-then-embed would take 8 * (0.01 + 0.05)
+        assert elapsed < 8 * (0.01 + 0.05)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_bounded_queues_limit_pages_in_flight(self) -> None:
+        """A slow embed stage applies backpressure instead of buffering the notebook."""
+        from vector_backend.config import IndexingConfig
+
+        notebook = FakeNotebook(pages_per_folder=40, folders=1)
+        embed_client, spans = _counting_embedder(latency=0.005)
+        fetched_ahead: list[int] = []
+
+        async def tracking_embed(texts: list[str]) -> list[list[float]]:
+            fetched_ahead.append(len(notebook.fetch_log) - len(spans))
+            vectors: list[list[float]] = await embed_client.embed_batch(texts)
+            return vectors
+
+        tracked = MagicMock()
+        tracked.embed_batch = tracking_embed
+        settings = IndexingConfig(fetch_concurrency=4, embed_concurrency=1, queue_size=1)
+
+        stats = await NotebookIndexer(
+            embedding_client=tracked, vector_index=AsyncMock(), embedding_version="v1"
+        ).index_notebook(
+            notebook, "uid", "nb_1", labarchives_url="https://example.com", settings=settings
+        )
+
+        assert stats["pages_processed"] == 40
+        # Pages fetched but not yet embedded: bounded by queue slots + stage workers
+        bound = 3 * settings.queue_size + settings.fetch_concurrency
+        bound += settings.extract_concurrency + settings.chunk_concurrency + 1
+        assert max(fetched_ahead) <= bound
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_page_failures_are_isolated(self) -> None:
+        """A page whose fetch fails is reported; the rest of the notebook is indexed."""
+        notebook = FakeNotebook(pages_per_folder=3, folders=1)
+        notebook.fail_pages = {"p0_1"}
+        embed_client, _ = _counting_embedder()
+
+        stats = await index_notebook(
+            "nb_1",
+            notebook_client=notebook,
+            uid="uid",
+            labarchives_url="https://example.com",
+            embedding_client=embed_client,
+            vector_index=AsyncMock(),
+            embedding_version="v1",
+        )
+
+        assert stats["pages_processed"] == 2
+        assert stats["stages"]["fetch"]["errors"] == 1
+        assert stats["errors"] == [
+            {"stage": "fetch", "page_id": "p0_1", "error": "page p0_1 unavailable"}
+        ]
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_subfolder_crawl_failures_are_reported(self) -> None:
+        """A folder that cannot be listed is reported; pages in other folders are indexed."""
+        notebook = FakeNotebook(pages_per_folder=2, folders=2)
+        del notebook.tree["f1"]
+        embed_client, _ = _counting_embedder()
+
+        stats = await index_notebook(
+            "nb_1",
+            notebook_client=notebook,
+            uid="uid",
+            labarchives_url="https://example.com",
+            embedding_client=embed_client,
+            vector_index=AsyncMock(),
+            embedding_version="v1",
+        )
+
+        assert stats["pages_processed"] == 2
+        assert stats["stages"]["crawl"]["errors"] == 1
+        assert [(e["stage"], e["page_id"]) for e in stats["errors"]] == [("crawl", "f1")]
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_explicit_pages_and_entry_filter(self) -> None:
+        """Given page_ids the crawl is skipped; pages the filter empties are not indexed."""
+        notebook = FakeNotebook(pages_per_folder=3, folders=1)
+        embed_client, _ = _counting_embedder()
+        index = AsyncMock()
+
+        def only_p0_2(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return [e for e in entries if e["eid"].startswith("p0_2")]
+
+        stats = await index_notebook(
+            "nb_1",
+            ["p0_1", "p0_2"],
+            notebook_client=notebook,
+            uid="uid",
+            labarchives_url="https://example.com",
+            entry_filter=only_p0_2,
+            embedding_client=embed_client,
+            vector_index=index,
+            embedding_version="v1",
+        )
+
+        assert [pid for pid, _ in sorted(notebook.fetch_log)] == ["p0_1", "p0_2"]
+        assert stats["pages_processed"] == 1
+        assert index.upsert.call_args.args[0][0].metadata.page_id == "p0_2"
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_root_crawl_failure_propagates(self) -> None:
+        """If the notebook root cannot be read, the run fails with the original error."""
+        notebook = FakeNotebook()
+        notebook.tree = {}
+        embed_client, _ = _counting_embedder()
+
+        with pytest.raises(KeyError):
+            await index_notebook(
+                "nb_1",
+                notebook_client=notebook,
+                uid="uid",
+                labarchives_url="https://example.com",
+                embedding_client=embed_client,
+                vector_index=AsyncMock(),
+                embedding_version="v1",
+            )
@@ -0,0 +1,124 @@
+"""Unit tests for int8 and binary vector quantisation."""
+
+import numpy as np
+import pytest
+
+from vector_backend.quantization import (
+    BinaryQuantizer,
+    ScalarQuantizer,
+    create_quantizer,
+    measure_recall,
+    rescored_top_k,
+)
+from vector_backend.similarity import normalize_rows, top_k_indices
+
+
+def _unit(rows: int, dim: int = 256, seed: int = 0) -> np.ndarray:
+    return normalize_rows(np.random.default_rng(seed).standard_normal((rows, dim)))[0]
+
+
+def _clustered(rows: int, seed: int, dim: int = 256, clusters: int = 50) -> np.ndarray:
+    """Unit rows around shared topic directions, like real embeddings."""
+    centers = np.random.default_rng(0).standard_normal((clusters, dim))
+    rng = np.random.default_rng(seed)
+    points = centers[rng.integers(clusters, size=rows)] + 0.5 * rng.standard_normal((rows, dim))
+    return normalize_rows(points)[0]
+
+
+class TestScalarQuantizer:
+    """Tests for int8 codes."""
+
+    def test_round_trip_error_is_small(self) -> None:
+        """Decoded rows stay within half a code step of the originals."""
+        vectors = _unit(200)
+        quantizer = ScalarQuantizer.fit(vectors)
+
+        codes = quantizer.encode(vectors)
+
+        assert codes.dtype == np.int8
+        assert np.all(np.abs(quantizer.decode(codes) - vectors) <= quantizer.scale / 2 + 1e-6)
+
+    def test_scores_track_exact_dot_products(self) -> None:
+        """Code scores are close to float32 dot products."""
+        vectors = _unit(500)
+        query = _unit(1, seed=1)[0]
+        quantizer = ScalarQuantizer.fit(vectors)
+
+        approx = quantizer.score(quantizer.encode(vectors), query)
+
+        assert np.allclose(approx, vectors @ query, atol=0.02)
+
+
+class TestBinaryQuantizer:
+    """Tests for sign-bit codes."""
+
+    def test_codes_pack_one_bit_per_dimension(self) -> None:
+        """A 256-dimension row packs into 32 bytes."""
+        codes = BinaryQuantizer().encode(_unit(10))
+
+        assert codes.shape == (10, 32)
+        assert codes.dtype == np.uint8
+
+    def test_score_is_negative_hamming_distance(self) -> None:
+        """Identical signs score 0; every flipped sign costs one."""
+        vectors = _unit(3, dim=16)
+        flipped = vectors.copy()
+        flipped[1, :5] *= -1
+        quantizer = BinaryQuantizer()
+
+        scores = quantizer.score(quantizer.encode(flipped), vectors[1])
+
+        assert scores[1] == -5
+        assert np.all(scores <= 0)
+
+    def test_unknown_quantizer_rejected(self) -> None:
+        """Only int8 and binary codes exist."""
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            create_quantizer("pq", _unit(2))
+
+
+class TestRescoring:
+    """Tests for prefiltering plus float32 rescoring."""
+
+    @pytest.mark.parametrize("name", ["int8", "binary"])  # type: ignore[misc]
+    def test_full_rescore_is_exact(self, name: str) -> None:
+        """Rescoring every row reproduces exact ranking and scores."""
+        vectors = _unit(300)
+        query = _unit(1, seed=2)[0]
+        quantizer = create_quantizer(name, vectors)
+
+        rows, scores = rescored_top_k(
+            query, vectors, quantizer.encode(vectors), quantizer, 5, rescore_factor=60
+        )
+
+        exact = vectors @ query
+        assert rows.tolist() == top_k_indices(exact, 5).tolist()
+        assert np.allclose(scores, exact[rows])
+
+    def test_rows_restrict_candidates(self) -> None:
+        """Only the given rows can be returned."""
+        vectors = _unit(100)
+        quantizer = create_quantizer("int8", vectors)
+        allowed = np.arange(50, 100)
+
+        rows, _ = rescored_top_k(
+            vectors[0], vectors, quantizer.encode(vectors), quantizer, 5, 4, rows=allowed
+        )
+
+        assert set(rows.tolist()) <= set(allowed.tolist())
+
+    def test_measure_recall_reports_compression(self) -> None:
+        """The harness reports recall before/after rescoring and the size reduction."""
+        vectors = _clustered(2000, seed=1)
+        queries = _clustered(20, seed=2)
+
+        int8 = measure_recall(vectors, queries, create_quantizer("int8", vectors))
+        binary = measure_recall(
+            vectors, queries, create_quantizer("binary", vectors), rescore_factor=10
+        )
+
+        assert int8["compression"] == 4.0
+        assert binary["compression"] == 32.0
+        assert int8["rescored_recall_at_k"] >= 0.95
+        assert binary["rescored_recall_at_k"] > binary["recall_at_k"]
+        assert binary["rescored_recall_at_k"] >= 0.9
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import hashlib
+import sqlite3
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, cast
 
+import httpx
 import pytest
 
 from labarchives_mcp import mcp_server
+from labarchives_mcp.eln_client import LabArchivesClient
 from labarchives_mcp.linked_data import export_project_jsonld
-from labarchives_mcp.models.upload import ProvenanceMetadata
+from labarchives_mcp.mirror import NotebookMirror
+from labarchives_mcp.models.upload import ProvenanceMetadata, UploadResponse
 from labarchives_mcp.state import StateManager
 
 
@@ -41,6 +46,8 @@ class DummyFastMCP:
         }
         self.resource_callbacks: dict[str, Callable[..., Any]] = {}
         self.tool_callbacks: dict[str, Callable[..., Any]] = {}
+        # Optional client session run while the server is up
+        self.while_serving: Callable[[], Awaitable[None]] | None = None
 
     def resource(self, uri: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -57,7 +64,8 @@ class DummyFastMCP:
         return decorator
 
     async def serve(self) -> None:
-        return None
+        if self.while_serving is not None:
+            await self.while_serving()
 
     async def run_async(self) -> None:
         await self.serve()
@@ -68,10 +76,16 @@ def _run_server_with_test_state(
     tmp_path: Path,
     *,
     entries_by_page: dict[tuple[str, str], list[dict[str, Any]]] | None = None,
+    tree_levels: dict[str, list[dict[str, Any]]] | None = None,
+    upload_log: list[Path] | None = None,
+    offline: bool = False,
+    while_serving: Callable[[DummyFastMCP], Awaitable[None]] | None = None,
 ) -> tuple[DummyFastMCP, StateManager]:
     mcp_module = cast(Any, mcp_server)
     state_manager = StateManager(storage_dir=tmp_path)
     page_entries = entries_by_page or {}
+    levels = tree_levels or {}
+    uploads = upload_log if upload_log is not None else []
 
     monkeypatch.setattr(
         mcp_module.Credentials,
@@ -104,8 +118,34 @@ def _run_server_with_test_state(
             page_id: str,
             include_data: bool = False,
         ) -> list[dict[str, Any]]:
+            if offline:
+                raise httpx.ConnectError("LabArchives is unreachable")
             return page_entries.get((notebook_id, page_id), [])
 
+        async def get_notebook_tree(
+            self, _uid: str, _nbid: str, parent_tree_id: int | str = 0
+        ) -> list[dict[str, Any]]:
+            if offline:
+                raise httpx.ConnectError("LabArchives is unreachable")
+            return levels.get(str(parent_tree_id), [])
+
+        async def upload_to_labarchives(
+            self, _uid: str, request: Any, progress: Any = None
+        ) -> UploadResponse:
+            uploads.append(request.file_path)
+            content = request.file_path.read_bytes()
+            return UploadResponse(
+                page_tree_id=f"page-{len(uploads)}",
+                entry_id=f"E{len(uploads)}",
+                page_url=f"https://example.org/page-{len(uploads)}",
+                created_at=datetime.now(UTC),
+                file_size_bytes=len(content),
+                filename=request.file_path.name,
+                sha256=hashlib.sha256(content).hexdigest(),
+            )
+
+        upload_files = LabArchivesClient.upload_files
+
     monkeypatch.setattr(mcp_module, "AuthenticationManager", DummyAuthenticationManager)
     monkeypatch.setattr(mcp_module, "LabArchivesClient", DummyLabArchivesClient)
 
@@ -115,6 +155,8 @@ def _run_server_with_test_state(
         version="",
         description="",
     )
+    if while_serving is not None:
+        fastmcp_instance.while_serving = lambda: while_serving(fastmcp_instance)
     monkeypatch.setattr(mcp_module, "FastMCP", lambda **kwargs: fastmcp_instance)
 
     asyncio.run(mcp_server.run_server())
@@ -269,7 +311,7 @@ def test_upload_tool_not_registered_when_disabled(monkeypatch: pytest.MonkeyPatc
     assert (
         "write_notebook_entry" not in fastmcp_instance.tool_callbacks
     ), "write_notebook_entry should not be registered when LABARCHIVES_ENABLE_UPLOAD=false"
-    assert len(fastmcp_instance.tool_callbacks) == 16
+    assert len(fastmcp_instance.tool_callbacks) == 17
 
 
 def test_upload_tool_registered_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -320,7 +362,8 @@ def test_upload_tool_registered_when_enabled(monkeypatch: pytest.MonkeyPatch) ->
     assert (
         "write_notebook_entry" in fastmcp_instance.tool_callbacks
     ), "write_notebook_entry should be registered when LABARCHIVES_ENABLE_UPLOAD=true"
-    assert len(fastmcp_instance.tool_callbacks) == 18
+    assert "upload_files_to_labarchives" in fastmcp_instance.tool_callbacks
+    assert len(fastmcp_instance.tool_callbacks) == 20
 
 
 def test_upload_tool_registered_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -372,7 +415,7 @@ def test_upload_tool_registered_by_default(monkeypatch: pytest.MonkeyPatch) -> N
     assert (
         "write_notebook_entry" in fastmcp_instance.tool_callbacks
     ), "write_notebook_entry should be registered by default when env var is not set"
-    assert len(fastmcp_instance.tool_callbacks) == 18
+    assert len(fastmcp_instance.tool_callbacks) == 20
 
 
 def test_export_tool_registered_and_matches_state_wrapper(
@@ -454,3 +497,174 @@ def test_export_tool_registered_and_matches_state_wrapper(
     result = asyncio.run(tool(context.id))
 
     assert result == export_project_jsonld(context.id, state_dir=tmp_path)
+
+
+def test_list_all_notebook_pages_walks_nested_folders(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Given pages nested two folders deep, when the recursive listing tool runs,
+    then every page is returned with its folder path."""
+
+    def node(tree_id: str, title: str, *, page: bool) -> dict[str, Any]:
+        return {"tree_id": tree_id, "display_text": title, "is_page": page, "is_folder": not page}
+
+    tree_levels = {
+        "0": [node("p1", "Intro", page=True), node("f1", "Methods", page=False)],
+        "f1": [node("f2", "Protein", page=False), node("p2", "Overview", page=True)],
+        "f2": [node("p3", "Western blot", page=True)],
+    }
+    fastmcp_instance, _ = _run_server_with_test_state(
+        monkeypatch, tmp_path, tree_levels=tree_levels
+    )
+
+    tool = fastmcp_instance.tool_callbacks["list_all_notebook_pages"]
+    result = asyncio.run(tool("nb1"))
+
+    assert result == [
+        {"tree_id": "p1", "title": "Intro", "path": "", "folder_id": "0"},
+        {"tree_id": "p2", "title": "Overview", "path": "Methods", "folder_id": "f1"},
+        {"tree_id": "p3", "title": "Western blot", "path": "Methods/Protein", "folder_id": "f2"},
+    ]
+
+
+UPLOAD_PROVENANCE = {
+    "git_commit_sha": "c" * 40,
+    "git_branch": "main",
+    "git_repo_url": "https://github.com/user/repo",
+    "python_version": "3.11.8",
+    "executed_at": "2025-09-30T12:00:00Z",
+}
+
+
+def test_identical_uploads_are_deduplicated_unless_forced(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Given a file already uploaded to a notebook folder, when the same bytes are uploaded
+    there again under the same title, then the existing page is returned; a different
+    folder, title or upload mode, or force=True, uploads anew."""
+    monkeypatch.setenv("LABARCHIVES_ENABLE_UPLOAD", "true")
+    uploads: list[Path] = []
+    fastmcp_instance, state_manager = _run_server_with_test_state(
+        monkeypatch, tmp_path / "state", upload_log=uploads
+    )
+    state_manager.create_project("Proj", "Desc")
+    upload = fastmcp_instance.tool_callbacks["upload_to_labarchives"]
+    figure = tmp_path / "figure.md"
+    figure.write_text("# Result")
+    rerun = tmp_path / "rerun" / "figure.md"
+    rerun.parent.mkdir()
+    rerun.write_text("# Result")
+
+    async def scenario() -> list[dict[str, Any]]:
+        kwargs = {"notebook_id": "nb1", "page_title": "Figure", **UPLOAD_PROVENANCE}
+        return [
+            await upload(file_path=str(figure), parent_folder_id="F1", **kwargs),
+            await upload(file_path=str(rerun), parent_folder_id="F1", **kwargs),
+            await upload(file_path=str(rerun), parent_folder_id="F2", **kwargs),
+            await upload(file_path=str(rerun), parent_folder_id="F1", force=True, **kwargs),
+            await upload(
+                file_path=str(rerun), parent_folder_id="F1", **{**kwargs, "page_title": "Fig 2"}
+            ),
+            await upload(file_path=str(rerun), parent_folder_id="F1", as_page_text=False, **kwargs),
+        ]
+
+    first, repeat, other_folder, forced, retitled, attached = asyncio.run(scenario())
+
+    assert first["deduplicated"] is False
+    assert repeat["deduplicated"] is True
+    assert repeat["page_tree_id"] == first["page_tree_id"]
+    assert repeat["sha256"] == first["sha256"]
+    assert other_folder["deduplicated"] is False
+    assert forced["deduplicated"] is False
+    assert retitled["deduplicated"] is False
+    assert attached["deduplicated"] is False
+    assert uploads == [figure, rerun, rerun, rerun, rerun]
+
+
+def test_batch_upload_skips_known_and_repeated_content(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Given a folder where one file was uploaded before and two files share bytes and a
+    name, when batch uploading, then only new pages are sent and every file gets a result;
+    the same bytes under another name become their own page."""
+    monkeypatch.setenv("LABARCHIVES_ENABLE_UPLOAD", "true")
+    uploads: list[Path] = []
+    fastmcp_instance, state_manager = _run_server_with_test_state(
+        monkeypatch, tmp_path / "state", upload_log=uploads
+    )
+    state_manager.create_project("Proj", "Desc")
+    out = tmp_path / "out"
+    (out / "rerun").mkdir(parents=True)
+    files = [("a.csv", "1"), ("b.csv", "2"), ("c.csv", "2"), ("d.csv", "3"), ("rerun/b.csv", "2")]
+    for name, content in files:
+        (out / name).write_text(content)
+
+    async def scenario() -> tuple[dict[str, Any], dict[str, Any]]:
+        single = await fastmcp_instance.tool_callbacks["upload_to_labarchives"](
+            notebook_id="nb1",
+            page_title="a.csv",
+            file_path=str(out / "a.csv"),
+            as_page_text=True,
+            **UPLOAD_PROVENANCE,
+        )
+        batch = await fastmcp_instance.tool_callbacks["upload_files_to_labarchives"](
+            notebook_id="nb1",
+            source=str(out / "**" / "*.csv"),
+            as_page_text=True,
+            **UPLOAD_PROVENANCE,
+        )
+        return single, batch
+
+    single, batch = asyncio.run(scenario())
+
+    assert (batch["uploaded"], batch["deduplicated"], batch["failed"]) == (3, 2, 0)
+    statuses = {Path(r["file_path"]).relative_to(out).as_posix(): r for r in batch["results"]}
+    assert statuses["a.csv"]["status"] == "deduplicated"
+    assert statuses["a.csv"]["page_tree_id"] == single["page_tree_id"]
+    assert statuses["rerun/b.csv"]["status"] == "deduplicated"
+    assert statuses["rerun/b.csv"]["page_tree_id"] == statuses["b.csv"]["page_tree_id"]
+    assert statuses["c.csv"]["page_tree_id"] != statuses["b.csv"]["page_tree_id"]
+    assert [p.relative_to(out).as_posix() for p in uploads] == ["a.csv", "b.csv", "c.csv", "d.csv"]
+
+
+def test_reads_fall_back_to_the_mirror_when_offline(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Given a mirrored notebook and an unreachable API, when listing and reading a page,
+    then the mirrored copies are returned marked as stale; the mirror is closed when the
+    server shuts down."""
+    mirror_path = tmp_path / "mirror.sqlite3"
+    mirror = NotebookMirror(mirror_path)
+    mirror.put_tree_level(
+        "nb1", 0, [{"tree_id": "p1", "display_text": "Page", "is_page": True, "is_folder": False}]
+    )
+    mirror.put_page_entries("nb1", "p1", [{"eid": "e1", "part_type": "heading", "content": "Hi"}])
+    mirror.close()
+    monkeypatch.setenv("LABARCHIVES_MIRROR_PATH", str(mirror_path))
+    opened: list[NotebookMirror] = []
+
+    def from_env() -> NotebookMirror:
+        opened.append(NotebookMirror(mirror_path))
+        return opened[-1]
+
+    monkeypatch.setattr(cast(Any, mcp_server).NotebookMirror, "from_env", staticmethod(from_env))
+    results: dict[str, Any] = {}
+
+    async def session(server: DummyFastMCP) -> None:
+        tools = server.tool_callbacks
+        results["listing"] = await tools["list_notebook_pages"](notebook_id="nb1")
+        results["page"] = await tools["read_notebook_page"](notebook_id="nb1", page_id="p1")
+        with pytest.raises(httpx.ConnectError):
+            await tools["read_notebook_page"](notebook_id="nb1", page_id="unmirrored")
+
+    _run_server_with_test_state(
+        monkeypatch, tmp_path / "state", offline=True, while_serving=session
+    )
+
+    listing, page = results["listing"], results["page"]
+    assert [item["tree_id"] for item in listing] == ["p1"]
+    assert listing[0]["stale"] is True and listing[0]["mirrored_at"]
+    assert page["stale"] is True
+    assert page["entries"][0]["content"] == "Hi"
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].stats()
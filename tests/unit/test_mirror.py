@@ -0,0 +1,144 @@
+"""Tests for the local SQLite notebook mirror."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+
+from labarchives_mcp.eln_client import LabArchivesClient
+from labarchives_mcp.mirror import NotebookMirror, is_offline_error
+from labarchives_mcp.throttle import TokenBucket
+
+ENTRIES_XML = (
+    b"<tree-tools><entry><eid>e1</eid><part-type>text entry</part-type>"
+    b"<updated-at>2026-01-02T03:04:05Z</updated-at><entry-data>hello</entry-data></entry>"
+    b"</tree-tools>"
+)
+TREE_XML = (
+    b"<tree-tools><level-node><tree-id>p1</tree-id><display-text>Page</display-text>"
+    b"<is-page>true</is-page></level-node></tree-tools>"
+)
+ADD_ENTRY_XML = b"<entries><entry><eid>e2</eid><part-type>text entry</part-type></entry></entries>"
+
+
+def _client(mirror: NotebookMirror, seen: list[str]) -> LabArchivesClient:
+    """Build an uncached LabArchivesClient over a mock transport that logs API methods."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        seen.append(method)
+        body = {"get_tree_level": TREE_XML, "add_entry": ADD_ENTRY_XML}.get(method, ENTRIES_XML)
+        return httpx.Response(200, content=body)
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    auth = MagicMock()
+    auth._build_auth_params = MagicMock(return_value={"akid": "a", "expires": "1", "sig": "s"})
+    client = LabArchivesClient(http, auth, cache_size=0, mirror=mirror)
+    client.throttle.bucket = TokenBucket(rate=0, burst=1)  # unlimited
+    return client
+
+
+def test_reads_go_through_the_mirror_and_fetches_are_written_back(tmp_path: Path) -> None:
+    """Given an empty mirror, when a page and a tree level are read twice, then only the
+    first reads call the API; later readers (even a new client) are served locally."""
+    mirror = NotebookMirror(tmp_path / "mirror.sqlite3", max_age_seconds=60)
+    seen: list[str] = []
+    client = _client(mirror, seen)
+
+    async def scenario() -> None:
+        for _ in range(2):
+            entries = await client.get_page_entries("uid", "nb", "p1")
+            assert entries == [
+                {
+                    "eid": "e1",
+                    "part_type": "text entry",
+                    "created_at": None,
+                    "updated_at": "2026-01-02T03:04:05Z",
+                    "content": "hello",
+                }
+            ]
+            assert (await client.get_notebook_tree("uid", "nb"))[0]["tree_id"] == "p1"
+        streamed = [entry async for entry in client.iter_page_entries("uid", "nb", "p1")]
+        assert streamed == entries
+        # Reads without data are answered from the mirrored page, minus the content
+        bare = await client.get_page_entries("uid", "nb", "p1", include_data=False)
+        assert "content" not in bare[0]
+
+    asyncio.run(scenario())
+
+    assert seen == ["get_entries_for_page", "get_tree_level"]
+    reopened = NotebookMirror(tmp_path / "mirror.sqlite3")
+    assert reopened.stats()["entries"] == 1
+
+
+def test_writes_expire_the_mirrored_page_but_keep_it_for_offline_reads(tmp_path: Path) -> None:
+    """Given a mirrored page, when an entry is added to it, then the next read refetches,
+    while the expired copy stays available to offline fallback (max_age=None)."""
+    mirror = NotebookMirror(tmp_path / "mirror.sqlite3", max_age_seconds=60)
+    seen: list[str] = []
+    client = _client(mirror, seen)
+
+    async def scenario() -> None:
+        await client.get_page_entries("uid", "nb", "p1")
+        await client.add_entry("uid", "nb", "p1", "plain text entry", "more")
+        assert mirror.get_page_entries("nb", "p1", max_age=60) is None
+        offline = mirror.get_page_entries("nb", "p1")
+        assert offline is not None and offline.value[0]["content"] == "hello"
+        await client.get_page_entries("uid", "nb", "p1")
+
+    asyncio.run(scenario())
+
+    assert seen == ["get_entries_for_page", "add_entry", "get_entries_for_page"]
+
+
+def test_mirror_io_runs_off_the_event_loop(tmp_path: Path) -> None:
+    """Given a mirrored client, when pages and tree levels are read and written, then every
+    SQLite call runs in a worker thread rather than on the event loop thread."""
+    threads: list[int] = []
+
+    class RecordingMirror(NotebookMirror):
+        def _transaction(self) -> Any:
+            threads.append(threading.get_ident())
+            return super()._transaction()
+
+        def get_tree_level(self, *args: Any, **kwargs: Any) -> Any:
+            threads.append(threading.get_ident())
+            return super().get_tree_level(*args, **kwargs)
+
+        def get_page_entries(self, *args: Any, **kwargs: Any) -> Any:
+            threads.append(threading.get_ident())
+            return super().get_page_entries(*args, **kwargs)
+
+    client = _client(RecordingMirror(tmp_path / "mirror.sqlite3", max_age_seconds=60), [])
+
+    async def scenario() -> int:
+        await client.get_notebook_tree("uid", "nb")
+        await client.get_page_entries("uid", "nb", "p1")
+        [entry async for entry in client.iter_page_entries("uid", "nb", "p2")]
+        await client.add_entry("uid", "nb", "p1", "plain text entry", "more")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+
+    # Reads and write-backs of the tree level and both pages, plus the page expiry
+    assert len(threads) == 7
+    assert loop_thread not in threads
+
+
+def test_offline_errors_are_transport_failures_and_server_errors() -> None:
+    """Connection failures and 5xx statuses count as offline; other statuses do not."""
+    request = httpx.Request("GET", "https://api.labarchives.com/api/x")
+
+    def status_error(code: int) -> httpx.HTTPStatusError:
+        response = httpx.Response(code, request=request)
+        return httpx.HTTPStatusError("status", request=request, response=response)
+
+    assert is_offline_error(httpx.ConnectError("down", request=request))
+    assert is_offline_error(status_error(503))
+    assert not is_offline_error(status_error(404))
+    assert not is_offline_error(ValueError("bad page id"))
@@ -3,18 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
 from labarchives_mcp.eln_client import LabArchivesClient
+from labarchives_mcp.throttle import background_priority
 
 
 @pytest.fixture  # type: ignore[misc]
 def mock_client() -> MagicMock:
-    """Create a mock httpx client."""
+    """Create a mock httpx client.
+
+    Streamed requests (`send(..., stream=True)`) are answered from the `get` mock,
+    so tests configure a single response source either way.
+    """
     client = MagicMock()
     client.get = AsyncMock()
+    client.build_request = MagicMock(side_effect=httpx.Request)
+
+    async def send(request: httpx.Request, *, stream: bool = False) -> httpx.Response:
+        url = str(request.url.copy_with(query=None))
+        mocked = await client.get(url, params=dict(request.url.params))
+        return httpx.Response(200, content=mocked.content, request=request)
+
+    client.send = AsyncMock(side_effect=send)
     return client
 
 
@@ -210,3 +226,333 @@ class TestGetPageEntries:
         assert call_args[1]["params"]["nbid"] == "nbid456"
         assert call_args[1]["params"]["page_tree_id"] == "789"
         assert call_args[1]["params"]["entry_data"] == "true"
+
+
+ENTRY_XML = b"""<?xml version="1.0"?>
+<tree-tools>
+    <entry>
+        <eid>e1</eid>
+        <part-type>text_entry</part-type>
+        <entry-data>Body</entry-data>
+    </entry>
+</tree-tools>
+"""
+
+
+def _xml_response(content: bytes) -> MagicMock:
+    response = MagicMock()
+    response.content = content
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestResponseCache:
+    """Tests for the TTL/LRU cache over LabArchivesClient reads."""
+
+    def test_repeated_reads_hit_the_cache(
+        self, lab_client: LabArchivesClient, mock_client: MagicMock
+    ) -> None:
+        """Given a page read twice, when the second read is within the TTL, then
+        only one API call is made and callers cannot mutate the cached rows."""
+        mock_client.get.return_value = _xml_response(ENTRY_XML)
+
+        first = asyncio.run(lab_client.get_page_entries("uid", "nb", "p1"))
+        first[0]["content"] = "mutated"
+        second = asyncio.run(lab_client.get_page_entries("uid", "nb", "p1"))
+
+        assert mock_client.get.call_count == 1
+        assert second[0]["content"] == "Body"
+        stats = lab_client.cache_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_key_includes_uid_and_params(
+        self, lab_client: LabArchivesClient, mock_client: MagicMock
+    ) -> None:
+        """Given different uids, pages or include_data flags, then each is fetched."""
+        mock_client.get.return_value = _xml_response(ENTRY_XML)
+
+        async def scenario() -> None:
+            await lab_client.get_page_entries("uid", "nb", "p1")
+            await lab_client.get_page_entries("other", "nb", "p1")
+            await lab_client.get_page_entries("uid", "nb", "p2")
+            await lab_client.get_page_entries("uid", "nb", "p1", include_data=False)
+
+        asyncio.run(scenario())
+        assert mock_client.get.call_count == 4
+
+    def test_writes_evict_the_affected_page_and_tree_level(
+        self, lab_client: LabArchivesClient, mock_client: MagicMock
+    ) -> None:
+        """Given cached page entries and tree levels, when add_entry and insert_node
+        write to them, then only the touched entries are refetched."""
+        from labarchives_mcp.models.upload import PageCreationRequest
+
+        tree_xml = b"<tree-tools><level-node><tree-id>p1</tree-id></level-node></tree-tools>"
+        mock_client.get.side_effect = lambda url, params: _xml_response(
+            tree_xml if "get_tree_level" in url else ENTRY_XML
+        )
+        mock_client.post = AsyncMock(
+            side_effect=[
+                _xml_response(b"<a><entry><eid>e2</eid></entry></a>"),
+                _xml_response(b"<a><node><tree-id>p3</tree-id></node></a>"),
+            ]
+        )
+
+        async def scenario() -> None:
+            await lab_client.get_page_entries("uid", "nb", "p1")
+            await lab_client.get_page_entries("uid", "nb", "p2")
+            await lab_client.get_notebook_tree("uid", "nb", 0)
+            await lab_client.add_entry("uid", "nb", "p1", "plain text entry", "new")
+            await lab_client.insert_node(
+                "uid", PageCreationRequest(notebook_id="nb", parent_tree_id=0, display_text="x")
+            )
+            await lab_client.get_page_entries("uid", "nb", "p1")
+            await lab_client.get_page_entries("uid", "nb", "p2")
+            await lab_client.get_notebook_tree("uid", "nb", 0)
+
+        asyncio.run(scenario())
+        fetched = [
+            call.kwargs["params"].get("page_tree_id") for call in mock_client.get.call_args_list
+        ]
+        assert fetched == ["p1", "p2", None, "p1", None]
+
+    def test_ttl_expiry_and_lru_eviction(
+        self, mock_client: MagicMock, mock_auth_manager: MagicMock
+    ) -> None:
+        """Given a zero TTL nothing is cached; given a full cache, then the least
+        recently used entry is evicted first."""
+        mock_client.get.return_value = _xml_response(ENTRY_XML)
+
+        uncached = LabArchivesClient(mock_client, mock_auth_manager, cache_ttl_seconds=0)
+        asyncio.run(uncached.get_page_entries("uid", "nb", "p1"))
+        asyncio.run(uncached.get_page_entries("uid", "nb", "p1"))
+        assert mock_client.get.call_count == 2
+
+        mock_client.get.reset_mock()
+        small = LabArchivesClient(mock_client, mock_auth_manager, cache_size=2)
+
+        async def scenario() -> None:
+            for page in ["p1", "p2", "p1", "p3", "p1", "p2"]:
+                await small.get_page_entries("uid", "nb", page)
+
+        asyncio.run(scenario())
+        fetched = [call.kwargs["params"]["page_tree_id"] for call in mock_client.get.call_args_list]
+        # p2 is least recently used when p3 arrives, so it is the one refetched
+        assert fetched == ["p1", "p2", "p3", "p2"]
+        assert small.cache_stats()["evictions"] == 2
+
+
+class TestSingleFlight:
+    """Tests for coalescing identical in-flight LabArchivesClient reads."""
+
+    @staticmethod
+    def _slow_get(responses: list[Any], delay: float = 0.02) -> AsyncMock:
+        async def get(url: str, params: dict[str, str]) -> MagicMock:
+            await asyncio.sleep(delay)
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return _xml_response(result)
+
+        return AsyncMock(side_effect=get)
+
+    def test_concurrent_identical_reads_share_one_request(
+        self, mock_client: MagicMock, mock_auth_manager: MagicMock
+    ) -> None:
+        """Given five concurrent reads of one page (cache disabled), then one HTTP
+        request is made and every caller gets its own copy of the result."""
+        mock_client.get = self._slow_get([ENTRY_XML, ENTRY_XML])
+        lab_client = LabArchivesClient(mock_client, mock_auth_manager, cache_size=0)
+
+        async def scenario() -> list[list[dict[str, Any]]]:
+            return list(
+                await asyncio.gather(
+                    *(lab_client.get_page_entries("uid", "nb", "p1") for _ in range(5)),
+                    lab_client.get_page_entries("uid", "nb", "p2"),
+                )
+            )
+
+        results = asyncio.run(scenario())
+
+        assert mock_client.get.call_count == 2
+        assert all(result[0]["eid"] == "e1" for result in results)
+        assert results[0][0] is not results[1][0]
+        assert lab_client.cache_stats()["coalesced"] == 4
+        assert lab_client.cache_stats()["in_flight"] == 0
+
+    def test_interactive_read_does_not_join_background_request(
+        self, mock_client: MagicMock, mock_auth_manager: MagicMock
+    ) -> None:
+        """Given a background read in flight, then an interactive read of the same page
+        issues its own request; a later background read joins the interactive one."""
+        mock_client.get = self._slow_get([ENTRY_XML, ENTRY_XML, ENTRY_XML])
+        lab_client = LabArchivesClient(mock_client, mock_auth_manager, cache_size=0)
+
+        async def background_read() -> list[dict[str, Any]]:
+            with background_priority():
+                return await lab_client.get_page_entries("uid", "nb", "p1")
+
+        async def scenario() -> None:
+            first = asyncio.create_task(background_read())
+            await asyncio.sleep(0)
+            interactive = asyncio.create_task(lab_client.get_page_entries("uid", "nb", "p1"))
+            await asyncio.sleep(0)
+            joined = asyncio.create_task(background_read())
+            await asyncio.gather(first, interactive, joined)
+
+        asyncio.run(scenario())
+
+        assert mock_client.get.call_count == 2
+        assert lab_client.cache_stats()["coalesced"] == 1
+        assert lab_client.cache_stats()["in_flight"] == 0
+
+    def test_failure_reaches_every_waiter_and_is_not_cached(
+        self, lab_client: LabArchivesClient, mock_client: MagicMock
+    ) -> None:
+        """Given a failing request shared by three callers, then all three see the
+        error and the next read retries."""
+        mock_client.get = self._slow_get([RuntimeError("boom"), ENTRY_XML])
+
+        async def scenario() -> list[Any]:
+            return list(
+                await asyncio.gather(
+                    *(lab_client.get_page_entries("uid", "nb", "p1") for _ in range(3)),
+                    return_exceptions=True,
+                )
+            )
+
+        outcomes = asyncio.run(scenario())
+        assert [str(outcome) for outcome in outcomes] == ["boom"] * 3
+
+        retried = asyncio.run(lab_client.get_page_entries("uid", "nb", "p1"))
+        assert retried[0]["eid"] == "e1"
+        assert mock_client.get.call_count == 2
+
+    def test_cancelled_caller_does_not_cancel_shared_request(
+        self, lab_client: LabArchivesClient, mock_client: MagicMock
+    ) -> None:
+        """Given the first caller is cancelled, then the coalesced caller still
+        receives the result."""
+        mock_client.get = self._slow_get([ENTRY_XML])
+
+        async def scenario() -> list[dict[str, Any]]:
+            first = asyncio.create_task(lab_client.get_page_entries("uid", "nb", "p1"))
+            second = asyncio.create_task(lab_client.get_page_entries("uid", "nb", "p1"))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(scenario())[0]["eid"] == "e1"
+        assert mock_client.get.call_count == 1
+
+    def test_write_during_read_is_not_masked_by_stale_result(
+        self, lab_client: LabArchivesClient, mock_client: MagicMock
+    ) -> None:
+        """Given a write to a page while a read of it is in flight, then the old
+        read is neither cached nor joined by later readers."""
+        mock_client.get = self._slow_get([ENTRY_XML, ENTRY_XML])
+        mock_client.post = AsyncMock(
+            return_value=_xml_response(b"<a><entry><eid>e2</eid></entry></a>")
+        )
+
+        async def scenario() -> None:
+            before = asyncio.create_task(lab_client.get_page_entries("uid", "nb", "p1"))
+            await asyncio.sleep(0)
+            await lab_client.add_entry("uid", "nb", "p1", "plain text entry", "new")
+            after = asyncio.create_task(lab_client.get_page_entries("uid", "nb", "p1"))
+            await asyncio.gather(before, after)
+
+        asyncio.run(scenario())
+        assert mock_client.get.call_count == 2
+        assert lab_client.cache_stats()["size"] == 1
+
+
+def _large_page(count: int) -> bytes:
+    entries = "".join(
+        f"<entry><eid>e{i}</eid><part-type>text_entry</part-type>"
+        f"<entry-data>&lt;p&gt;Entry {i} {'x' * 200}&lt;/p&gt;</entry-data></entry>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><tree-tools>{entries}</tree-tools>'.encode()
+
+
+def _streaming_client(
+    chunks: Callable[[], AsyncIterator[bytes]], **kwargs: Any
+) -> tuple[LabArchivesClient, list[int]]:
+    """LabArchivesClient over a transport that streams the body from `chunks`."""
+    requests: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(1)
+        return httpx.Response(200, content=chunks())
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    auth = MagicMock()
+    auth._build_auth_params = MagicMock(return_value={"akid": "a", "expires": "1", "sig": "s"})
+    return LabArchivesClient(http, auth, **kwargs), requests
+
+
+class TestStreamingEntries:
+    """Tests for incremental parsing of get_entries_for_page responses."""
+
+    def test_entries_are_yielded_before_the_download_finishes(self) -> None:
+        """Given a body whose second half is held back, when iterating, then the first
+        entry arrives before the rest of the body is sent."""
+        release = asyncio.Event()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"<tree-tools><entry><eid>e0</eid><part-type>heading</part-type></entry>"
+            await release.wait()
+            yield b"<entry><eid>e1</eid><part-type>heading</part-type></entry></tree-tools>"
+
+        client, _ = _streaming_client(chunks)
+
+        async def scenario() -> list[str]:
+            seen: list[str] = []
+            async for entry in client.iter_page_entries("uid", "nb", "p1"):
+                seen.append(entry["eid"])
+                release.set()
+            return seen
+
+        assert asyncio.run(asyncio.wait_for(scenario(), timeout=5)) == ["e0", "e1"]
+
+    def test_small_chunks_parse_like_a_buffered_body(self) -> None:
+        """Given a 300-entry page split into 7-byte chunks (cutting tags and entities),
+        then every entry is parsed intact and the page is cached."""
+        body = _large_page(300)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for start in range(0, len(body), 7):
+                yield body[start : start + 7]
+
+        client, requests = _streaming_client(chunks)
+        entries = asyncio.run(client.get_page_entries("uid", "nb", "p1"))
+
+        assert [e["eid"] for e in entries] == [f"e{i}" for i in range(300)]
+        assert entries[42]["content"].startswith("<p>Entry 42 x")
+        streamed = asyncio.run(_collect(client.iter_page_entries("uid", "nb", "p1")))
+        assert streamed == entries
+        assert len(requests) == 1
+
+    def test_abandoned_stream_is_not_cached(self) -> None:
+        """Given a consumer that stops after one entry, then the partial page is not
+        cached and the next read fetches it again."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield _large_page(5)
+
+        client, requests = _streaming_client(chunks)
+
+        async def first_only() -> None:
+            async for _entry in client.iter_page_entries("uid", "nb", "p1"):
+                break
+
+        asyncio.run(first_only())
+        entries = asyncio.run(client.get_page_entries("uid", "nb", "p1"))
+
+        assert len(entries) == 5
+        assert len(requests) == 2
+
+
+async def _collect(stream: AsyncIterator[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [entry async for entry in stream]
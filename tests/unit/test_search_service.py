@@ -0,0 +1,265 @@
+"""Tests for the warm search service behind `search_labarchives`."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from labarchives_mcp.search import SearchService
+from vector_backend import models as vm
+
+
+def _make_result(page_id: str, score: float) -> vm.SearchResult:
+    metadata = vm.ChunkMetadata(
+        notebook_id="nb1",
+        notebook_name="Example",
+        page_id=page_id,
+        page_title=f"Page {page_id}",
+        entry_id="e1",
+        entry_type="text_entry",
+        author="test@example.com",
+        date=datetime(2025, 1, 1),
+        labarchives_url="https://example.com",
+        embedding_version="v1",
+    )
+    chunk = vm.EmbeddedChunk(
+        id=f"nb1_{page_id}_e1_0", text="t", vector=[0.0] * 1536, metadata=metadata
+    )
+    return vm.SearchResult(chunk=chunk, score=score, rank=1)
+
+
+class StubAuth:
+    async def ensure_uid(self) -> str:
+        return "uid-1"
+
+
+class StubNotebookClient:
+    async def iter_page_entries(
+        self, uid: str, nbid: str, pid: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        await asyncio.sleep(0)
+        yield {"part_type": "text entry", "content": f"<p>Body of {pid}</p>"}
+
+
+@pytest.fixture()  # type: ignore[misc]
+def counters(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> dict[str, Any]:
+    """Stub secrets, config, embedding and index, logging every round-trip in `calls`."""
+    import vector_backend.config as vbc
+    import vector_backend.embedding as vbe
+    import vector_backend.index as vbi
+
+    counts: dict[str, Any] = {
+        "calls": [],
+        "healthy": True,
+        "pages": ["p1", "p1", "p2"],
+    }
+    calls: list[str] = counts["calls"]
+
+    secrets = tmp_path / "secrets.yml"
+    secrets.write_text("PINECONE_API_KEY: test-key\n")
+    monkeypatch.setenv("LABARCHIVES_CONFIG_PATH", str(secrets))
+
+    load_secrets = SearchService._load_secrets
+
+    async def counting_load_secrets(self: SearchService) -> dict[str, Any]:
+        calls.append("secrets")
+        return await load_secrets(self)
+
+    class StubConfig:
+        embedding = object()
+        index = SimpleNamespace(backend="pinecone")
+
+    def fake_load_config(_name: str = "default") -> StubConfig:
+        calls.append("config")
+        return StubConfig()
+
+    class StubEmbed:
+        async def embed_single(self, text: str) -> list[float]:
+            calls.append("embed")
+            await asyncio.sleep(0)
+            return [0.1] * 1536
+
+        async def aclose(self) -> None:
+            counts["embed_closed"] = True
+
+    class StubIndex:
+        def __init__(self, **kwargs: Any) -> None:
+            calls.append("index")
+            counts["api_key"] = kwargs["api_key"]
+
+        async def health_check(self) -> bool:
+            calls.append("health")
+            if "on_health" in counts:
+                counts["on_health"]()
+            await asyncio.sleep(0)
+            return bool(counts["healthy"])
+
+        async def search(self, request: Any, query_vector: list[float]) -> list[vm.SearchResult]:
+            calls.append("query")
+            await asyncio.sleep(0)
+            pages = counts["pages"]
+            return [_make_result(pid, 0.9 - i * 0.01) for i, pid in enumerate(pages)]
+
+    monkeypatch.setattr(SearchService, "_load_secrets", counting_load_secrets)
+    monkeypatch.setattr(vbc, "load_config", fake_load_config)
+    monkeypatch.setattr(vbe, "create_embedding_client", lambda _cfg: StubEmbed())
+    monkeypatch.setattr(vbi, "PineconeIndex", StubIndex)
+    return counts
+
+
+def _service(notebook_client: Any = None, **kwargs: Any) -> SearchService:
+    client = notebook_client or StubNotebookClient()
+    return SearchService(cast(Any, StubAuth()), cast(Any, client), **kwargs)
+
+
+def test_warm_path_skips_cold_path_round_trips(counters: dict[str, Any]) -> None:
+    """Given a fresh service, when several queries run, then only the first pays for
+    secrets/config/client construction and the health round-trip; warm queries only
+    embed and query."""
+    calls: list[str] = counters["calls"]
+
+    async def scenario() -> list[list[str]]:
+        service = _service()
+        per_query: list[list[str]] = []
+        for _ in range(6):
+            before = len(calls)
+            results = await service.search("q", limit=2)
+            per_query.append(calls[before:])
+            assert [r["page_id"] for r in results] == ["p1", "p2"]
+            assert results[0]["content"] == "Body of p1"
+        await service.aclose()
+        return per_query
+
+    cold, *warm = asyncio.run(scenario())
+
+    assert cold == ["secrets", "config", "index", "health", "embed", "query"]
+    assert warm == [["embed", "query"]] * 5
+    assert counters["api_key"] == "test-key"
+    assert counters["embed_closed"] is True
+
+
+def test_health_is_rechecked_periodically_off_the_query_path(counters: dict[str, Any]) -> None:
+    """Given a warm service, when the health interval elapses, then a background task
+    re-checks the index without any query arriving, and stops once the service closes."""
+    calls: list[str] = counters["calls"]
+
+    async def scenario() -> None:
+        checks: asyncio.Queue[None] = asyncio.Queue()
+        counters["on_health"] = lambda: checks.put_nowait(None)
+
+        async def next_check() -> None:
+            await asyncio.wait_for(checks.get(), timeout=5)
+
+        service = _service(health_ttl_seconds=0.0)
+        await service.warm_up()
+        await next_check()  # the warm-up check
+
+        await next_check()
+        await next_check()
+        assert service.healthy is True
+        assert "embed" not in calls
+
+        counters["healthy"] = False
+        await next_check()
+        assert service.healthy is False
+
+        await service.aclose()
+        checked = calls.count("health")
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert calls.count("health") == checked
+
+    asyncio.run(scenario())
+
+
+def test_unhealthy_index_fails_fast_then_recovers(counters: dict[str, Any]) -> None:
+    """Given an unreachable index, when queried, then an error is raised; once the index
+    recovers, the next query re-checks inline and succeeds."""
+
+    async def scenario() -> None:
+        service = _service()
+        counters["healthy"] = False
+        with pytest.raises(RuntimeError, match="not reachable"):
+            await service.search("q")
+        assert service.healthy is False
+
+        counters["healthy"] = True
+        results = await service.search("q", limit=1)
+        assert len(results) == 1
+        assert service.healthy is True
+        await service.aclose()
+
+    asyncio.run(scenario())
+    assert counters["calls"].count("index") == 1
+
+
+def test_hydration_fans_out_with_bounded_concurrency(counters: dict[str, Any]) -> None:
+    """Given ten result pages, when hydrated with a limit of 4, then fetches overlap
+    (never more than 4 in flight), order is preserved and one failing page is isolated."""
+    counters["pages"] = [f"p{i}" for i in range(10)]
+
+    class TrackingClient:
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def iter_page_entries(
+            self, uid: str, nbid: str, pid: str
+        ) -> AsyncIterator[dict[str, Any]]:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                # Finish later pages first so ordering is not an accident of scheduling
+                for _ in range(10 - int(pid[1:])):
+                    await asyncio.sleep(0)
+                if pid == "p3":
+                    raise RuntimeError("page gone")
+                yield {"part_type": "heading", "content": f" Title {pid} "}
+            finally:
+                self.in_flight -= 1
+
+    client = TrackingClient()
+
+    async def scenario() -> list[dict[str, Any]]:
+        service = _service(client, hydration_concurrency=4)
+        results = await service.search("q", limit=10)
+        await service.aclose()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert [r["page_id"] for r in results] == [f"p{i}" for i in range(10)]
+    assert results[0]["content"] == "Title p0"
+    assert results[3]["content"] == "(Error fetching page: page gone)"
+    assert results[4]["content"] == "Title p4"
+    # Pages were fetched in overlapping waves rather than ten sequential round-trips
+    assert client.max_in_flight == 4
+
+
+def test_hydration_streams_entries(counters: dict[str, Any]) -> None:
+    """Given a page whose entries stream in, when hydrating, then each text-bearing
+    entry is cleaned and the rest are skipped."""
+
+    class StreamingClient:
+        async def iter_page_entries(
+            self, uid: str, nbid: str, pid: str
+        ) -> AsyncIterator[dict[str, Any]]:
+            yield {"part_type": "heading", "content": f" Title {pid} "}
+            await asyncio.sleep(0)
+            yield {"part_type": "text entry", "content": "<p>Streamed body</p>"}
+            yield {"part_type": "attachment"}
+
+    async def scenario() -> list[dict[str, Any]]:
+        service = _service(StreamingClient())
+        results = await service.search("q", limit=1)
+        await service.aclose()
+        return results
+
+    results = asyncio.run(scenario())
+    assert results[0]["content"] == "Title p1\n\nStreamed body"
@@ -0,0 +1,351 @@
+"""Tests for LabArchives rate limiting, retries and adaptive concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from labarchives_mcp.eln_client import LabArchivesClient
+from labarchives_mcp.throttle import (
+    AIMDLimiter,
+    Priority,
+    RetryPolicy,
+    TokenBucket,
+    background_priority,
+    current_priority,
+    throttle_for,
+)
+from labarchives_mcp.transform import LabArchivesAPIError, parse_labarchives_fault
+
+ENTRIES_XML = b"<tree-tools><entry><eid>e1</eid><part-type>heading</part-type></entry></tree-tools>"
+
+
+def _fault(code: int) -> httpx.Response:
+    body = (
+        f"<error><error-code>{code}</error-code>"
+        f"<error-description>fault {code}</error-description></error>"
+    )
+    return httpx.Response(400, content=body.encode())
+
+
+def _client(
+    handler: Callable[[httpx.Request], httpx.Response | Any],
+) -> tuple[LabArchivesClient, MagicMock]:
+    """Build a LabArchivesClient over a mock transport with fast retries."""
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    auth = MagicMock()
+    signatures = iter(range(1_000_000))
+    auth._build_auth_params = MagicMock(
+        side_effect=lambda method: {"akid": "a", "expires": "1", "sig": str(next(signatures))}
+    )
+    client = LabArchivesClient(http, auth, cache_size=0)
+    client.throttle.retry = RetryPolicy(max_attempts=4, base_delay=0.001, max_delay=0.005)
+    client.throttle.bucket = TokenBucket(rate=0, burst=1)  # unlimited
+    return client, auth
+
+
+def test_parse_labarchives_fault() -> None:
+    """Given an <error> body, then code and description are extracted; other bodies yield None."""
+    fault = parse_labarchives_fault(_fault(4505).content)
+    assert fault == LabArchivesAPIError(code=4505, message="fault 4505")
+    assert parse_labarchives_fault(b"<tree-tools/>") is None
+    assert parse_labarchives_fault(b"not xml") is None
+
+
+def test_retryable_fault_is_retried_with_a_fresh_signature() -> None:
+    """Given two 4505 faults then success, when reading a page, then the call succeeds
+    on the third attempt and every attempt is signed anew."""
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.params["sig"])
+        return _fault(4505) if len(seen) < 3 else httpx.Response(200, content=ENTRIES_XML)
+
+    client, _ = _client(handler)
+    entries = asyncio.run(client.get_page_entries("uid", "nb", "p1"))
+
+    assert entries[0]["eid"] == "e1"
+    assert seen == ["0", "1", "2"]
+    assert client.throttle.stats()["retries"] == 2
+
+
+def test_non_retryable_fault_raises_immediately() -> None:
+    """Given a 4501 (no rights) fault, then LabArchivesAPIError is raised without retrying."""
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return _fault(4501)
+
+    client, _ = _client(handler)
+    with pytest.raises(LabArchivesAPIError) as excinfo:
+        asyncio.run(client.get_notebook_tree("uid", "nb"))
+
+    assert excinfo.value.code == 4501
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("response", "forgets_uid"),
+    [
+        (httpx.Response(403, content=_fault(4501).content), False),
+        (httpx.Response(401, content=_fault(4520).content), False),
+        (httpx.Response(403), False),
+        (_fault(4507), True),
+    ],
+)
+def test_only_uid_faults_forget_the_cached_uid(response: httpx.Response, forgets_uid: bool) -> None:
+    """Given a no-rights or bad-signature rejection, then the resolved uid is kept;
+    given a uid-not-found fault, then the auth manager forgets it."""
+    client, auth = _client(lambda request: response)
+    with pytest.raises((LabArchivesAPIError, httpx.HTTPStatusError)):
+        asyncio.run(client.get_notebook_tree("uid", "nb"))
+
+    assert auth.invalidate_uid.called is forgets_uid
+
+
+def test_persistent_fault_surfaces_after_retry_budget() -> None:
+    """Given a fault on every attempt, then the fault is raised after max_attempts."""
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return _fault(4506)
+
+    client, _ = _client(handler)
+    with pytest.raises(LabArchivesAPIError):
+        asyncio.run(client.get_page_entries("uid", "nb", "p1"))
+    assert len(calls) == 4
+
+
+def test_transport_errors_retry_reads_but_not_sent_writes() -> None:
+    """Given flaky transport, then reads are retried; a write whose request may have
+    reached the server is not repeated."""
+    attempts: dict[str, int] = {"GET": 0, "POST": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts[request.method] += 1
+        if attempts[request.method] == 1:
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(200, content=ENTRIES_XML)
+
+    client, _ = _client(handler)
+    asyncio.run(client.get_page_entries("uid", "nb", "p1"))
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(client.add_entry("uid", "nb", "p1", "plain text entry", "x"))
+
+    assert attempts == {"GET": 2, "POST": 1}
+
+
+def test_gateway_errors_retry_reads_but_not_writes() -> None:
+    """Given a 504 on the first attempt, then a read is retried; a write, which may
+    already have landed, is sent exactly once. A 429 is retried for both."""
+    attempts: dict[str, int] = {"GET": 0, "POST": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts[request.method] += 1
+        if attempts[request.method] == 1:
+            return httpx.Response(504)
+        return httpx.Response(200, content=ENTRIES_XML)
+
+    client, _ = _client(handler)
+    asyncio.run(client.get_page_entries("uid", "nb", "p1"))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.add_entry("uid", "nb", "p1", "plain text entry", "x"))
+
+    assert attempts == {"GET": 2, "POST": 1}
+
+    posts: list[int] = []
+
+    def throttled(request: httpx.Request) -> httpx.Response:
+        posts.append(1)
+        return httpx.Response(429) if len(posts) == 1 else httpx.Response(200, content=ENTRIES_XML)
+
+    client, _ = _client(throttled)
+    asyncio.run(client.add_entry("uid", "nb", "p1", "plain text entry", "x"))
+    assert len(posts) == 2
+
+
+def test_throttle_is_shared_per_async_client() -> None:
+    """Given two LabArchivesClients on one AsyncClient, then they share one throttle."""
+    http = httpx.AsyncClient()
+    first = LabArchivesClient(http, MagicMock())
+    second = LabArchivesClient(http, MagicMock())
+
+    assert first.throttle is second.throttle is throttle_for(http)
+    assert throttle_for(httpx.AsyncClient()) is not first.throttle
+
+
+def test_token_bucket_limits_request_rate() -> None:
+    """Given 20 req/s with a burst of 2, then 6 calls take at least 4 refill intervals."""
+    bucket = TokenBucket(rate=20.0, burst=2)
+
+    async def scenario() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(scenario()) >= 4 / 20 * 0.9
+
+
+def test_aimd_limiter_bounds_in_flight_and_adapts() -> None:
+    """Given a limit of 4, then at most 4 slots are held; a fault halves the limit once
+    per cooldown and successes grow it back."""
+    limiter = AIMDLimiter(initial=4, maximum=8, cooldown_seconds=60.0)
+    peak = 0
+
+    async def work() -> None:
+        nonlocal peak
+        await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.005)
+        limiter.release()
+
+    async def scenario() -> None:
+        await asyncio.gather(*(work() for _ in range(20)))
+
+    asyncio.run(scenario())
+    assert peak == 4
+    assert limiter.in_flight == 0
+
+    limiter.on_fault()
+    limiter.on_fault()
+    assert limiter.limit == 2.0
+    for _ in range(10):
+        limiter.on_success()
+    assert 4.0 < limiter.limit <= 8.0
+
+
+def test_sustained_overload_settles_below_server_capacity() -> None:
+    """Given a server that faults with 4505 above 3 concurrent calls, when 40 reads
+    are issued at once, then all succeed and the limit backs off toward capacity."""
+    active = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active
+        active += 1
+        try:
+            await asyncio.sleep(0.002)
+            if active > 3:
+                return _fault(4505)
+            return httpx.Response(200, content=ENTRIES_XML)
+        finally:
+            active -= 1
+
+    client, _ = _client(handler)
+    client.throttle.retry = RetryPolicy(max_attempts=20, base_delay=0.002, max_delay=0.02)
+    client.throttle.concurrency = AIMDLimiter(initial=12, maximum=16, cooldown_seconds=0.005)
+
+    async def scenario() -> list[Any]:
+        return list(
+            await asyncio.gather(
+                *(client.get_page_entries("uid", "nb", f"p{i}") for i in range(40))
+            )
+        )
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 40
+    stats = client.throttle.stats()
+    assert stats["faults"] > 0
+    assert stats["concurrency_limit"] < 12
+
+
+def test_interactive_waiters_jump_queued_background_work() -> None:
+    """Given a full limiter with background calls queued, when an interactive call
+    arrives, then it is granted the next free slot; background never takes the
+    slot reserved for interactive use."""
+    limiter = AIMDLimiter(initial=3, maximum=3, reserved=1)
+    order: list[str] = []
+
+    async def call(name: str, priority: Priority, hold: asyncio.Event) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+        await hold.wait()
+        limiter.release()
+
+    async def scenario() -> None:
+        hold = asyncio.Event()
+        tasks = [asyncio.create_task(call(f"bg{i}", Priority.BACKGROUND, hold)) for i in range(4)]
+        await asyncio.sleep(0)
+        # Two background calls fill capacity - reserved; the third slot stays free
+        assert order == ["bg0", "bg1"]
+        assert limiter.waiting == {"interactive": 0, "background": 2}
+
+        tasks.append(asyncio.create_task(call("fast", Priority.INTERACTIVE, hold)))
+        await asyncio.sleep(0)
+        assert order[-1] == "fast"
+
+        tasks.append(asyncio.create_task(call("queued", Priority.INTERACTIVE, hold)))
+        await asyncio.sleep(0)
+        hold.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order.index("queued") < order.index("bg2")
+    assert limiter.in_flight == 0
+
+
+def test_background_tokens_never_borrow_from_the_bucket() -> None:
+    """Given an empty bucket, then background takers wait for a refill instead of
+    going into debt, while interactive callers may reserve ahead."""
+    bucket = TokenBucket(rate=10.0, burst=1)
+    assert bucket.try_take() == 0.0
+    assert bucket.try_take() > 0.0
+    assert bucket.try_take() > 0.0  # still no debt: the wait does not grow
+    assert bucket.reserve() > 0.0
+
+
+def test_priority_is_inherited_by_spawned_tasks() -> None:
+    """Given work started inside background_priority(), then its tasks run as background."""
+
+    async def scenario() -> tuple[Priority, Priority]:
+        with background_priority():
+            inner = await asyncio.create_task(_priority_of_task())
+        return inner, current_priority()
+
+    assert asyncio.run(scenario()) == (Priority.BACKGROUND, Priority.INTERACTIVE)
+
+
+async def _priority_of_task() -> Priority:
+    return current_priority()
+
+
+def test_interactive_latency_stays_flat_during_background_flood() -> None:
+    """Given 60 background reads saturating the client, when interactive reads are
+    issued meanwhile, then each completes in about one server round-trip."""
+    latency = 0.01
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, content=ENTRIES_XML)
+
+    client, _ = _client(handler)
+    client.throttle.concurrency = AIMDLimiter(initial=4, maximum=4)
+
+    async def scenario() -> list[float]:
+        with background_priority():
+            flood = asyncio.gather(
+                *(client.get_page_entries("uid", "nb", f"bg{i}") for i in range(60))
+            )
+        await asyncio.sleep(latency)
+        timings: list[float] = []
+        for i in range(5):
+            start = time.perf_counter()
+            await client.get_page_entries("uid", "nb", f"fg{i}")
+            timings.append(time.perf_counter() - start)
+        assert client.throttle.concurrency.waiting["background"] > 0
+        await flood
+        return timings
+
+    timings = asyncio.run(scenario())
+
+    # The background queue alone holds 60 / 3 * latency = 0.2s of work
+    assert max(timings) < latency * 5
+    assert client.throttle.stats()["background_requests"] == 60
@@ -8,10 +8,13 @@ of LabArchivesClient using mocked HTTP responses.
 # ruff: noqa: F841
 
 import asyncio
+import hashlib
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
 from labarchives_mcp.auth import AuthenticationManager
@@ -251,9 +254,57 @@ class TestAddAttachment:
         # Act
         result = asyncio.run(lab_client.add_attachment("uid123", request))
 
-        # Assert
+        # Assert: the body is a stream over the file, sent with a fixed length
         call_args = mock_client.post.call_args
-        assert call_args[1]["content"] == test_content.encode()
+        body = call_args[1]["content"]
+        assert asyncio.run(body.read()) == test_content.encode()
+        assert call_args[1]["headers"]["Content-Length"] == str(len(test_content))
+        assert result.file_size_bytes == len(test_content)
+
+    def test_streams_large_file_in_chunks_with_hash_and_progress(self, tmp_path: Path) -> None:
+        """Given a multi-chunk file, when uploading over a real transport, then the
+        server receives the exact bytes with a Content-Length, the SHA-256 is computed
+        on the way and progress is reported up to the total."""
+        payload = bytes(range(256)) * (3 * 4096 + 17)  # ~3 MiB, not chunk-aligned
+        test_file = tmp_path / "stack.tif"
+        test_file.write_bytes(payload)
+        received: dict[str, Any] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            received["headers"] = request.headers
+            received["body"] = b"".join([chunk async for chunk in request.stream])
+            return httpx.Response(
+                200,
+                content=b"<entries><entry><eid>E1</eid>"
+                b"<created-at>2025-09-30T12:00:00Z</created-at></entry></entries>",
+            )
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        auth = MagicMock(spec=AuthenticationManager)
+        auth._build_auth_params.return_value = {"akid": "k", "expires": "1", "sig": "s"}
+        client = LabArchivesClient(http, auth)
+        progress: list[tuple[int, int]] = []
+        request = AttachmentUploadRequest(
+            notebook_id="nbid123",
+            page_tree_id="PAGE_ID",
+            file_path=test_file,
+            filename=None,
+            caption=None,
+            change_description=None,
+        )
+
+        result = asyncio.run(
+            client.add_attachment("uid123", request, progress=lambda d, t: progress.append((d, t)))
+        )
+
+        assert received["body"] == payload
+        assert received["headers"]["Content-Length"] == str(len(payload))
+        assert "Transfer-Encoding" not in received["headers"]
+        assert result.sha256 == hashlib.sha256(payload).hexdigest()
+        assert result.file_size_bytes == len(payload)
+        assert len(progress) == 4
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+        assert progress[-1] == (len(payload), len(payload))
 
 
 class TestAddEntry:
@@ -511,3 +562,96 @@ class TestUploadToLabArchives:
             asyncio.run(lab_client.upload_to_labarchives("uid123", request))
 
         assert "metadata" in str(exc_info.value).lower()
+
+
+class TestUploadFiles:
+    """Tests for upload_files (batch upload of a directory or glob)."""
+
+    @staticmethod
+    def _batch_client(delay: float = 0.01) -> tuple[LabArchivesClient, dict[str, Any]]:
+        """Client over a fake API that tracks concurrent page creations."""
+        seen: dict[str, Any] = {"active": 0, "peak": 0, "pages": []}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            title = request.url.params.get("display_text", "")
+            if request.url.path.endswith("insert_node"):
+                if title == "broken.png":
+                    return httpx.Response(
+                        400,
+                        content=b"<error><error-code>4501</error-code>"
+                        b"<error-description>no rights</error-description></error>",
+                    )
+                seen["active"] += 1
+                seen["peak"] = max(seen["peak"], seen["active"])
+                seen["pages"].append(title)
+                await asyncio.sleep(delay)
+                return httpx.Response(
+                    200,
+                    content=f"<n><node><tree-id>T-{title}</tree-id><is-page>true</is-page>"
+                    f"</node></n>".encode(),
+                )
+            await asyncio.sleep(delay)
+            seen["active"] -= 1
+            name = request.url.params["filename"]
+            return httpx.Response(
+                200,
+                content=f"<e><entry><eid>E-{name}</eid><created-at>2025-09-30T12:00:00Z"
+                f"</created-at></entry></e>".encode(),
+            )
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        auth = MagicMock(spec=AuthenticationManager)
+        auth._build_auth_params.return_value = {"akid": "k", "expires": "1", "sig": "s"}
+        client = LabArchivesClient(http, auth)
+        client.throttle.bucket.rate = 0  # unlimited
+        return client, seen
+
+    def test_uploads_glob_with_bounded_parallelism_and_partial_failure(
+        self, tmp_path: Path
+    ) -> None:
+        """Given 9 figures (one rejected by the API) and a limit of 3, then pages are
+        created concurrently but never more than 3 at once, and every file gets a result
+        in order with the failure isolated."""
+        for i in range(8):
+            (tmp_path / f"fig{i}.png").write_bytes(b"png" * (i + 1))
+        (tmp_path / "broken.png").write_bytes(b"png")
+        (tmp_path / "notes.txt").write_text("not matched")
+        client, seen = self._batch_client()
+        progress: list[tuple[int, int]] = []
+
+        items = asyncio.run(
+            client.upload_files(
+                "uid123",
+                str(tmp_path / "*.png"),
+                notebook_id="nb1",
+                max_concurrency=3,
+                progress=lambda done, total: progress.append((done, total)),
+            )
+        )
+
+        assert [item.file_path.name for item in items] == ["broken.png"] + [
+            f"fig{i}.png" for i in range(8)
+        ]
+        assert not items[0].ok and "no rights" in (items[0].error or "")
+        assert all(item.ok for item in items[1:])
+        assert items[3].response is not None
+        assert items[3].response.entry_id == "E-fig2.png"
+        assert items[3].response.file_size_bytes == 9
+        assert seen["peak"] == 3
+        assert progress[-1] == (9, 9)
+
+    def test_directory_source_and_missing_matches(self, tmp_path: Path) -> None:
+        """Given a directory, then its visible top-level files are uploaded; a pattern
+        matching nothing raises FileNotFoundError."""
+        (tmp_path / "a.csv").write_text("1,2")
+        (tmp_path / ".hidden").write_text("x")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.csv").write_text("3,4")
+        client, seen = self._batch_client(delay=0)
+
+        items = asyncio.run(client.upload_files("uid123", tmp_path, notebook_id="nb1"))
+
+        assert [item.file_path.name for item in items] == ["a.csv"]
+        assert seen["pages"] == ["a.csv"]
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(client.upload_files("uid123", str(tmp_path / "*.tif"), notebook_id="nb1"))